@@ -1,6 +1,12 @@
 from app.auth.application.dto import RefreshTokenResponseDTO
 from app.auth.application.exception import DecodeTokenException
 from app.auth.domain.usecase.jwt import JwtUseCase
+from core.helpers.refresh_token import (
+    ReusedRefreshTokenException,
+    RevokedTokenException,
+    is_refresh_token,
+    refresh_tokens,
+)
 from core.helpers.token import (
     TokenHelper,
     DecodeTokenException as JwtDecodeTokenException,
@@ -11,23 +17,38 @@ from core.helpers.token import (
 class JwtService(JwtUseCase):
     async def verify_token(self, token: str) -> None:
         try:
-            TokenHelper.decode(token=token)
+            payload = TokenHelper.decode(token=token)
         except (JwtDecodeTokenException, JwtExpiredTokenException):
             raise DecodeTokenException
 
+        if is_refresh_token(payload):
+            raise DecodeTokenException
+
     async def create_refresh_token(
         self,
         token: str,
         refresh_token: str,
     ) -> RefreshTokenResponseDTO:
-        decoede_created_token = TokenHelper.decode(token=token)
-        decoded_refresh_token = TokenHelper.decode(token=refresh_token)
-        if decoded_refresh_token.get("sub") != "refresh":
+        try:
+            # The access token being replaced has usually expired already
+            decoded_created_token = TokenHelper.decode_expired_token(token=token)
+            decoded_refresh_token = TokenHelper.decode(token=refresh_token)
+            if is_refresh_token(decoded_created_token):
+                raise DecodeTokenException
+
+            if decoded_created_token.get("sid") != decoded_refresh_token.get("sid"):
+                raise DecodeTokenException
+
+            pair = await refresh_tokens.rotate(refresh_token=refresh_token)
+        except (
+            JwtDecodeTokenException,
+            JwtExpiredTokenException,
+            RevokedTokenException,
+            ReusedRefreshTokenException,
+        ):
             raise DecodeTokenException
 
         return RefreshTokenResponseDTO(
-            token=TokenHelper.encode(
-                payload={"user_id": decoede_created_token.get("user_id")}
-            ),
-            refresh_token=TokenHelper.encode(payload={"sub": "refresh"}),
+            token=pair.token,
+            refresh_token=pair.refresh_token,
         )
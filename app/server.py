@@ -1,12 +1,15 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.auth.adapter.input.api import router as auth_router
 from app.container import Container
 from app.user.adapter.input.api import router as user_router
 from core.config import config
+from core.db.session import reader_pool
 from core.exceptions import CustomException
 from core.fastapi.dependencies import Logging
 from core.fastapi.middlewares import (
@@ -15,7 +18,22 @@ from core.fastapi.middlewares import (
     ResponseLogMiddleware,
     SQLAlchemyMiddleware,
 )
-from core.helpers.cache import Cache, CustomKeyMaker, RedisBackend
+from core.helpers.cache import (
+    Cache,
+    CustomKeyMaker,
+    MemoryBackend,
+    RedisBackend,
+    ResilientBackend,
+    TwoTierBackend,
+)
+from core.helpers.cache.base import BaseBackend
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from core.helpers.metrics import PrometheusMetricsSink, metrics_sink
+from core.helpers.redis import (
+    cache_redis_client,
+    close_redis_pools,
+    warm_redis_pools,
+)
 
 
 def init_routers(app_: FastAPI) -> None:
@@ -70,7 +88,58 @@ def make_middleware() -> list[Middleware]:
 
 
 def init_cache() -> None:
-    Cache.init(backend=RedisBackend(), key_maker=CustomKeyMaker())
+    backend: BaseBackend = RedisBackend(metrics=metrics_sink)
+    if config.CACHE_LOCAL_ENABLED:
+        backend = TwoTierBackend(
+            remote=backend,
+            local=MemoryBackend(
+                max_entries=config.CACHE_LOCAL_MAX_ENTRIES,
+                max_size=config.CACHE_LOCAL_MAX_SIZE,
+                metrics=metrics_sink,
+            ),
+            local_ttl=config.CACHE_LOCAL_TTL,
+        )
+
+    backend = ResilientBackend(
+        backend=backend,
+        timeout=config.CACHE_TIMEOUT,
+        invalidation_timeout=config.CACHE_INVALIDATION_TIMEOUT,
+        breaker=CircuitBreaker(
+            failure_threshold=config.CACHE_FAILURE_THRESHOLD,
+            recovery_timeout=config.CACHE_RECOVERY_TIMEOUT,
+        ),
+        write_behind=config.CACHE_WRITE_BEHIND,
+        metrics=metrics_sink,
+    )
+    Cache.init(
+        backend=backend,
+        key_maker=CustomKeyMaker(),
+        lock_client=cache_redis_client,
+        metrics=metrics_sink,
+    )
+
+
+def init_metrics(app_: FastAPI) -> None:
+    if not isinstance(metrics_sink, PrometheusMetricsSink):
+        return
+
+    @app_.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(
+            metrics_sink.render(),
+            media_type="text/plain; version=0.0.4",
+        )
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    await warm_redis_pools()
+    await Cache.start()
+    await reader_pool.start()
+    yield
+    await reader_pool.stop()
+    await Cache.stop()
+    await close_redis_pools()
 
 
 def create_app() -> FastAPI:
@@ -82,10 +151,12 @@ def create_app() -> FastAPI:
         redoc_url=None if config.ENV == "production" else "/redoc",
         dependencies=[Depends(Logging)],
         middleware=make_middleware(),
+        lifespan=lifespan,
     )
     init_routers(app_=app_)
     init_listeners(app_=app_)
     init_cache()
+    init_metrics(app_=app_)
     return app_
 
 
@@ -1,5 +1,8 @@
+from typing import Sequence
+
 from app.user.domain.entity.user import User, UserRead
 from app.user.domain.repository.user import UserRepo
+from core.helpers.dataloader import DataLoader, request_loader
 
 
 class UserRepositoryAdapter:
@@ -12,8 +15,7 @@ class UserRepositoryAdapter:
         limit: int = 12,
         prev: int | None = None,
     ) -> list[UserRead]:
-        users = await self.user_repo.get_users(limit=limit, prev=prev)
-        return [UserRead.model_validate(user) for user in users]
+        return await self.user_repo.get_user_reads(limit=limit, prev=prev)
 
     async def get_user_by_email_or_nickname(
         self,
@@ -27,7 +29,18 @@ class UserRepositoryAdapter:
         )
 
     async def get_user_by_id(self, *, user_id: int) -> User | None:
-        return await self.user_repo.get_user_by_id(user_id=user_id)
+        # Lookups made in the same tick of a request share one query
+        return await self._user_loader().load(user_id)
+
+    async def get_users_by_ids(self, *, user_ids: Sequence[int]) -> list[User]:
+        return await self.user_repo.get_users_by_ids(user_ids=user_ids)
+
+    async def is_admin(self, *, user_id: int) -> bool:
+        return await self.user_repo.is_admin(user_id=user_id)
+
+    async def update_admin(self, *, user_id: int, is_admin: bool) -> None:
+        await self.user_repo.update_admin(user_id=user_id, is_admin=is_admin)
+        self._user_loader().clear(user_id)
 
     async def get_user_by_email_and_password(
         self,
@@ -42,3 +55,15 @@ class UserRepositoryAdapter:
 
     async def save(self, *, user: User) -> None:
         await self.user_repo.save(user=user)
+        if user.id is not None:
+            self._user_loader().clear(user.id)
+
+    def _user_loader(self) -> DataLoader[int, User]:
+        return request_loader(
+            "user_by_id",
+            lambda: DataLoader(batch_load=self._load_users),
+        )
+
+    async def _load_users(self, user_ids: list[int]) -> dict[int, User]:
+        users = await self.user_repo.get_users_by_ids(user_ids=user_ids)
+        return {user.id: user for user in users}
@@ -1,30 +1,40 @@
-from sqlalchemy import and_, or_, select
+from typing import Sequence
 
-from app.user.domain.entity.user import User
+from sqlalchemy import and_, exists, or_, select
+
+from app.user.domain.entity.user import User, UserRead
 from app.user.domain.repository.user import UserRepo
-from core.db.session import session, session_factory
+from core.db.session import read_session_scope, session
+from core.repository.base import BaseRepo
+
 
+class UserSQLAlchemyRepo(BaseRepo[User], UserRepo):
+    max_page_size = 12
+
+    def __init__(self):
+        super().__init__(model=User)
 
-class UserSQLAlchemyRepo(UserRepo):
     async def get_users(
         self,
         *,
         limit: int = 12,
         prev: int | None = None,
     ) -> list[User]:
-        query = select(User)
-
-        if prev:
-            query = query.where(User.id < prev)
+        page = await self.paginate(limit=limit, after=(prev,) if prev else None)
+        return page.items
 
-        if limit > 12:
-            limit = 12
-
-        query = query.limit(limit)
-        async with session_factory() as read_session:
-            result = await read_session.execute(query)
-
-        return result.scalars().all()
+    async def get_user_reads(
+        self,
+        *,
+        limit: int = 12,
+        prev: int | None = None,
+    ) -> list[UserRead]:
+        page = await self.paginate(
+            limit=limit,
+            after=(prev,) if prev else None,
+            projection=UserRead,
+        )
+        return page.items
 
     async def get_user_by_email_or_nickname(
         self,
@@ -32,24 +42,36 @@ class UserSQLAlchemyRepo(UserRepo):
         email: str,
         nickname: str,
     ) -> User | None:
-        async with session_factory() as read_session:
+        async with read_session_scope() as read_session:
             stmt = await read_session.execute(
                 select(User).where(or_(User.email == email, User.nickname == nickname)),
             )
             return stmt.scalars().first()
 
     async def get_user_by_id(self, *, user_id: int) -> User | None:
-        async with session_factory() as read_session:
+        async with read_session_scope() as read_session:
             stmt = await read_session.execute(select(User).where(User.id == user_id))
             return stmt.scalars().first()
 
+    async def get_users_by_ids(self, *, user_ids: Sequence[int]) -> list[User]:
+        return await self.get_by_ids(user_ids)
+
+    async def is_admin(self, *, user_id: int) -> bool:
+        query = select(exists().where(User.id == user_id, User.is_admin.is_(True)))
+        async with read_session_scope() as read_session:
+            result = await read_session.execute(query)
+            return bool(result.scalar())
+
+    async def update_admin(self, *, user_id: int, is_admin: bool) -> None:
+        await self.update_by_id(user_id, {"is_admin": is_admin})
+
     async def get_user_by_email_and_password(
         self,
         *,
         email: str,
         password: str,
     ) -> User | None:
-        async with session_factory() as read_session:
+        async with read_session_scope() as read_session:
             stmt = await read_session.execute(
                 select(User).where(and_(User.email == email, password == password))
             )
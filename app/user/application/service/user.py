@@ -9,8 +9,10 @@ from app.user.domain.command import CreateUserCommand
 from app.user.domain.entity.user import User, UserRead
 from app.user.domain.usecase.user import UserUseCase
 from app.user.domain.vo.location import Location
+from core.config import config
 from core.db import Transactional
-from core.helpers.token import TokenHelper
+from core.helpers.cache import Cache, CacheTag
+from core.helpers.refresh_token import refresh_tokens
 
 
 class UserService(UserUseCase):
@@ -45,15 +47,22 @@ class UserService(UserUseCase):
         )
         await self.repository.save(user=user)
 
+    @Cache.cached(tag=CacheTag.USER_IS_ADMIN, ttl=config.PERMISSION_CACHE_TTL)
     async def is_admin(self, *, user_id: int) -> bool:
-        user = await self.repository.get_user_by_id(user_id=user_id)
-        if not user:
-            return False
+        return await self.repository.is_admin(user_id=user_id)
 
-        if user.is_admin is False:
-            return False
+    async def change_admin(self, *, user_id: int, is_admin: bool) -> None:
+        await self._update_admin(user_id=user_id, is_admin=is_admin)
+        # Dropped after commit so a concurrent check cannot re-cache the old flag
+        await Cache.remove(
+            function=UserService.is_admin,
+            tag=CacheTag.USER_IS_ADMIN,
+            kwargs={"user_id": user_id},
+        )
 
-        return True
+    @Transactional()
+    async def _update_admin(self, *, user_id: int, is_admin: bool) -> None:
+        await self.repository.update_admin(user_id=user_id, is_admin=is_admin)
 
     async def login(self, *, email: str, password: str) -> LoginResponseDTO:
         user = await self.repository.get_user_by_email_and_password(
@@ -63,8 +72,9 @@ class UserService(UserUseCase):
         if not user:
             raise UserNotFoundException
 
+        pair = await refresh_tokens.issue(user_id=user.id)
         response = LoginResponseDTO(
-            token=TokenHelper.encode(payload={"user_id": user.id}),
-            refresh_token=TokenHelper.encode(payload={"sub": "refresh"}),
+            token=pair.token,
+            refresh_token=pair.refresh_token,
         )
         return response
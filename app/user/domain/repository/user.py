@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from app.user.domain.entity.user import User
+from typing import Sequence
+
+from app.user.domain.entity.user import User, UserRead
 
 
 class UserRepo(ABC):
@@ -12,6 +14,15 @@ class UserRepo(ABC):
     ) -> list[User]:
         """Get user list"""
 
+    @abstractmethod
+    async def get_user_reads(
+        self,
+        *,
+        limit: int = 12,
+        prev: int | None = None,
+    ) -> list[UserRead]:
+        """Get user list with only the read model columns"""
+
     @abstractmethod
     async def get_user_by_email_or_nickname(
         self,
@@ -25,6 +36,18 @@ class UserRepo(ABC):
     async def get_user_by_id(self, *, user_id: int) -> User | None:
         """Get user by id"""
 
+    @abstractmethod
+    async def get_users_by_ids(self, *, user_ids: Sequence[int]) -> list[User]:
+        """Get users by ids"""
+
+    @abstractmethod
+    async def is_admin(self, *, user_id: int) -> bool:
+        """Whether the user exists and is an admin"""
+
+    @abstractmethod
+    async def update_admin(self, *, user_id: int, is_admin: bool) -> None:
+        """Update user admin flag"""
+
     @abstractmethod
     async def get_user_by_email_and_password(
         self,
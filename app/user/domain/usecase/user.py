@@ -22,6 +22,10 @@ class UserUseCase(ABC):
     async def is_admin(self, *, user_id: int) -> bool:
         """Is admin"""
 
+    @abstractmethod
+    async def change_admin(self, *, user_id: int, is_admin: bool) -> None:
+        """Change admin"""
+
     @abstractmethod
     async def login(self, *, email: str, password: str) -> LoginResponseDTO:
         """Login"""
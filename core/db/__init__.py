@@ -1,9 +1,11 @@
-from .session import Base, session, session_factory
-from .transactional import Transactional
+from .session import Base, read_session_scope, session, session_factory
+from .transactional import Propagation, Transactional
 
 __all__ = [
     "Base",
     "session",
     "Transactional",
+    "Propagation",
     "session_factory",
+    "read_session_scope",
 ]
@@ -0,0 +1,46 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+from sqlalchemy.pool.base import ConnectionPoolEntry
+
+from core.helpers.metrics import BaseMetricsSink, metrics_sink
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool publishing checkout wait time and occupancy gauges"""
+
+    metrics: BaseMetricsSink = metrics_sink
+
+    @property
+    def engine_label(self) -> str:
+        return self.logging_name or "default"
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.increment("db_pool_timeouts_total", engine=self.engine_label)
+            raise
+        finally:
+            self.metrics.observe(
+                "db_pool_checkout_seconds",
+                time.perf_counter() - started,
+                engine=self.engine_label,
+            )
+
+        self.record_gauges()
+        return connection
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self.record_gauges()
+
+    def record_gauges(self) -> None:
+        engine = self.engine_label
+        self.metrics.set_gauge("db_pool_size", self.size(), engine=engine)
+        self.metrics.set_gauge("db_pool_checked_out", self.checkedout(), engine=engine)
+        self.metrics.set_gauge(
+            "db_pool_overflow", max(self.overflow(), 0), engine=engine
+        )
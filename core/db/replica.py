@@ -0,0 +1,199 @@
+import asyncio
+import itertools
+import logging
+import random
+import time
+from enum import Enum
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from core.helpers.metrics import BaseMetricsSink, metrics_sink
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaStrategy(Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+    LATENCY = "latency"
+
+
+class Replica:
+    def __init__(self, *, engine: AsyncEngine, name: str):
+        self.engine = engine
+        self.name = name
+        self.healthy = True
+        self.failures = 0
+        # Smoothed health-check round trip in seconds
+        self.latency: float | None = None
+        # Replication delay reported by the last health check
+        self.lag: float | None = None
+
+    @property
+    def checked_out(self) -> int:
+        return self.engine.pool.checkedout()
+
+
+class ReaderPool:
+    """Select a healthy read replica per session.
+
+    Replicas are ejected after `failure_threshold` consecutive failed health
+    checks or disconnect errors and re-admitted on the next successful check.
+    With `max_lag` set, health checks also read the replication delay and
+    replicas further behind are skipped until they catch up. When no replica
+    is usable, `choose()` returns the writer.
+    """
+
+    def __init__(
+        self,
+        *,
+        replicas: list[Replica],
+        writer: AsyncEngine,
+        strategy: ReplicaStrategy = ReplicaStrategy.ROUND_ROBIN,
+        failure_threshold: int = 3,
+        check_interval: float = 5.0,
+        check_timeout: float = 1.0,
+        latency_smoothing: float = 0.3,
+        max_lag: float | None = None,
+        lag_query: str = "SHOW REPLICA STATUS",
+        metrics: BaseMetricsSink = metrics_sink,
+    ):
+        self.replicas = replicas
+        self.writer = writer
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.latency_smoothing = latency_smoothing
+        self.max_lag = max_lag
+        self.lag_query = lag_query
+        self.metrics = metrics
+        self._counter = itertools.count()
+        self._checker: asyncio.Task | None = None
+
+        for replica in replicas:
+            self._watch(replica)
+
+    def _watch(self, replica: Replica) -> None:
+        @event.listens_for(replica.engine.sync_engine, "handle_error")
+        def _handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                self.record_failure(replica)
+
+    @property
+    def healthy(self) -> list[Replica]:
+        return [
+            replica
+            for replica in self.replicas
+            if replica.healthy and not self._is_lagging(replica)
+        ]
+
+    def _is_lagging(self, replica: Replica) -> bool:
+        if self.max_lag is None or replica.lag is None:
+            return False
+        return replica.lag > self.max_lag
+
+    def choose(self) -> AsyncEngine:
+        replicas = self.healthy
+        if not replicas:
+            self.metrics.increment("db_reader_fallback_total")
+            return self.writer
+
+        if len(replicas) == 1:
+            return replicas[0].engine
+
+        if self.strategy == ReplicaStrategy.LEAST_CONNECTIONS:
+            return min(replicas, key=lambda replica: replica.checked_out).engine
+
+        if self.strategy == ReplicaStrategy.LATENCY:
+            return self._choose_by_latency(replicas).engine
+
+        return replicas[next(self._counter) % len(replicas)].engine
+
+    def _choose_by_latency(self, replicas: list[Replica]) -> Replica:
+        measured = [replica.latency for replica in replicas if replica.latency]
+        if not measured:
+            return replicas[next(self._counter) % len(replicas)]
+
+        # Unmeasured replicas get the mean weight so they still receive traffic
+        default = sum(measured) / len(measured)
+        weights = [1 / (replica.latency or default) for replica in replicas]
+        return random.choices(replicas, weights=weights)[0]
+
+    def record_success(self, replica: Replica, *, latency: float) -> None:
+        if replica.latency is None:
+            replica.latency = latency
+        else:
+            replica.latency += self.latency_smoothing * (latency - replica.latency)
+
+        replica.failures = 0
+        if not replica.healthy:
+            logger.warning("Read replica %s is back in rotation", replica.name)
+            replica.healthy = True
+            self._record_health(replica)
+
+    def record_failure(self, replica: Replica) -> None:
+        replica.failures += 1
+        if replica.healthy and replica.failures >= self.failure_threshold:
+            logger.warning("Read replica %s ejected", replica.name)
+            replica.healthy = False
+            self._record_health(replica)
+
+    def _record_health(self, replica: Replica) -> None:
+        self.metrics.set_gauge(
+            "db_reader_healthy", int(replica.healthy), replica=replica.name
+        )
+
+    async def ping(self, replica: Replica) -> float:
+        started = time.perf_counter()
+        async with asyncio.timeout(self.check_timeout):
+            async with replica.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                latency = time.perf_counter() - started
+                if self.max_lag is not None:
+                    replica.lag = await self._read_lag(connection)
+
+        return latency
+
+    async def _read_lag(self, connection: AsyncConnection) -> float:
+        result = await connection.execute(text(self.lag_query))
+        row = result.mappings().first()
+        if row is None:
+            # Not replicating, e.g. the reader URL points at the primary
+            return 0.0
+
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        # NULL means the replication threads are stopped
+        return float("inf") if lag is None else float(lag)
+
+    async def check(self) -> None:
+        async def _check(replica: Replica) -> None:
+            try:
+                latency = await self.ping(replica)
+            except (SQLAlchemyError, OSError, TimeoutError):
+                self.record_failure(replica)
+            else:
+                self.record_success(replica, latency=latency)
+
+        await asyncio.gather(*(_check(replica) for replica in self.replicas))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def start(self) -> None:
+        if self._checker is None and len(self.replicas) > 0:
+            self._checker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._checker is not None:
+            self._checker.cancel()
+            try:
+                await self._checker
+            except asyncio.CancelledError:
+                pass
+            self._checker = None
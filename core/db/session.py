@@ -4,6 +4,7 @@ from enum import Enum
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_scoped_session,
     async_sessionmaker,
@@ -11,17 +12,30 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.sql.expression import Delete, Insert, Update
+from sqlalchemy.util import await_only
 
 from core.config import config
-
-session_context: ContextVar[str] = ContextVar("session_context")
+from core.db.pool import InstrumentedQueuePool
+from core.db.replica import ReaderPool, Replica, ReplicaStrategy
+from core.db.write_marker import write_marker
+
+session_context: ContextVar[str | int] = ContextVar("session_context")
+# Authenticated user whose recent writes this context's reads must see
+sticky_user_context: ContextVar[int | None] = ContextVar(
+    "sticky_user_context",
+    default=None,
+)
+engine_type_context: ContextVar["EngineType | None"] = ContextVar(
+    "engine_type_context",
+    default=None,
+)
 
 
-def get_session_context() -> str:
+def get_session_context() -> str | int:
     return session_context.get()
 
 
-def set_session_context(session_id: str) -> Token:
+def set_session_context(session_id: str | int) -> Token:
     return session_context.set(session_id)
 
 
@@ -29,23 +43,134 @@ def reset_session_context(context: Token) -> None:
     session_context.reset(context)
 
 
+def set_sticky_user(user_id: int | None) -> Token:
+    return sticky_user_context.set(user_id)
+
+
+def reset_sticky_user(context: Token) -> None:
+    sticky_user_context.reset(context)
+
+
+def set_engine_type(engine_type: "EngineType | None") -> Token:
+    return engine_type_context.set(engine_type)
+
+
+def reset_engine_type(context: Token) -> None:
+    engine_type_context.reset(context)
+
+
 class EngineType(Enum):
     WRITER = "writer"
     READER = "reader"
 
 
+def create_engine(
+    *,
+    url: str,
+    name: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    pool_recycle: int,
+    pool_pre_ping: bool,
+    pool_use_lifo: bool,
+    echo_pool: bool,
+) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        pool_use_lifo=pool_use_lifo,
+        echo_pool=echo_pool,
+        query_cache_size=config.DB_QUERY_CACHE_SIZE,
+    )
+
+
+def create_reader_engine(*, url: str, name: str) -> AsyncEngine:
+    return create_engine(
+        url=url,
+        name=name,
+        pool_size=config.READER_DB_POOL_SIZE,
+        max_overflow=config.READER_DB_MAX_OVERFLOW,
+        pool_timeout=config.READER_DB_POOL_TIMEOUT,
+        pool_recycle=config.READER_DB_POOL_RECYCLE,
+        pool_pre_ping=config.READER_DB_POOL_PRE_PING,
+        pool_use_lifo=config.READER_DB_POOL_USE_LIFO,
+        echo_pool=config.READER_DB_ECHO_POOL,
+    )
+
+
+writer_engine = create_engine(
+    url=config.WRITER_DB_URL,
+    name=EngineType.WRITER.value,
+    pool_size=config.WRITER_DB_POOL_SIZE,
+    max_overflow=config.WRITER_DB_MAX_OVERFLOW,
+    pool_timeout=config.WRITER_DB_POOL_TIMEOUT,
+    pool_recycle=config.WRITER_DB_POOL_RECYCLE,
+    pool_pre_ping=config.WRITER_DB_POOL_PRE_PING,
+    pool_use_lifo=config.WRITER_DB_POOL_USE_LIFO,
+    echo_pool=config.WRITER_DB_ECHO_POOL,
+)
+reader_pool = ReaderPool(
+    replicas=[
+        Replica(
+            engine=create_reader_engine(url=url, name=f"reader-{index}"),
+            name=f"reader-{index}",
+        )
+        for index, url in enumerate(config.READER_DB_URLS or [config.READER_DB_URL])
+    ],
+    writer=writer_engine,
+    strategy=ReplicaStrategy(config.READER_DB_STRATEGY),
+    failure_threshold=config.READER_DB_FAILURE_THRESHOLD,
+    check_interval=config.READER_DB_HEALTH_CHECK_INTERVAL,
+    check_timeout=config.READER_DB_HEALTH_CHECK_TIMEOUT,
+    max_lag=config.READER_DB_MAX_LAG,
+)
 engines = {
-    EngineType.WRITER: create_async_engine(config.WRITER_DB_URL, pool_recycle=3600),
-    EngineType.READER: create_async_engine(config.READER_DB_URL, pool_recycle=3600),
+    EngineType.WRITER: writer_engine,
+    EngineType.READER: reader_pool.replicas[0].engine,
 }
 
 
 class RoutingSession(Session):
+    # Reader picked on first read and kept for the session's lifetime
+    _reader: AsyncEngine | None = None
+    # Once the session has written, its reads must see those writes
+    _wrote: bool = False
+    # Whether the sticky user wrote recently, looked up on first read
+    _sticky: bool | None = None
+
     def get_bind(self, mapper=None, clause=None, **kw):
+        engine_type = engine_type_context.get()
         if self._flushing or isinstance(clause, (Update, Delete, Insert)):
+            self._wrote = True
+            return engines[EngineType.WRITER].sync_engine
+        elif engine_type == EngineType.WRITER:
+            return engines[EngineType.WRITER].sync_engine
+        # Read-your-writes wins over a reader pin
+        elif self._wrote or self._is_sticky():
             return engines[EngineType.WRITER].sync_engine
         else:
-            return engines[EngineType.READER].sync_engine
+            return self._get_reader().sync_engine
+
+    def _is_sticky(self) -> bool:
+        if self._sticky is None:
+            user_id = sticky_user_context.get()
+            # get_bind runs inside SQLAlchemy's greenlet, so it may await
+            self._sticky = user_id is not None and await_only(
+                write_marker.is_marked(user_id=user_id)
+            )
+        return self._sticky
+
+    def _get_reader(self) -> AsyncEngine:
+        if self._reader is None:
+            self._reader = reader_pool.choose()
+        return self._reader
 
 
 _async_session_factory = async_sessionmaker(
@@ -53,24 +178,47 @@ _async_session_factory = async_sessionmaker(
     sync_session_class=RoutingSession,
     expire_on_commit=False,
 )
+# Read-only work never has pending changes to flush
+_read_session_factory = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
 session = async_scoped_session(
     session_factory=_async_session_factory,
     scopefunc=get_session_context,
 )
 
 
+def has_session() -> bool:
+    return session.registry.has()
+
+
+def session_has_written() -> bool:
+    if not has_session():
+        return False
+    return session.registry().sync_session._wrote
+
+
 class Base(DeclarativeBase):
     ...
 
 
 @asynccontextmanager
 async def session_factory() -> AsyncGenerator[AsyncSession, None]:
-    _session = async_sessionmaker(
-        class_=AsyncSession,
-        sync_session_class=RoutingSession,
-        expire_on_commit=False,
-    )()
+    _session = _read_session_factory()
     try:
         yield _session
     finally:
         await _session.close()
+
+
+@asynccontextmanager
+async def read_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    # Inside a request reuse its session so reads share one connection
+    if session_context.get(None) is None:
+        async with session_factory() as _session:
+            yield _session
+    else:
+        yield session()
@@ -1,12 +1,90 @@
+import asyncio
+import random
+from contextvars import ContextVar
+from enum import Enum
 from functools import wraps
 
+from sqlalchemy.exc import DBAPIError
+
 from core.db import session
+from core.db.session import EngineType, reset_engine_type, set_engine_type
+
+# MySQL deadlock and lock wait timeout
+RETRYABLE_ERROR_CODES = (1213, 1205)
+
+transaction_depth: ContextVar[int] = ContextVar("transaction_depth", default=0)
+transaction_read_only: ContextVar[bool] = ContextVar(
+    "transaction_read_only", default=False
+)
+
+
+class ReadOnlyTransactionError(RuntimeError):
+    """A writable Transactional joined a read-only one, which never commits"""
+
+
+class Propagation(Enum):
+    # Join the surrounding transaction or start one
+    REQUIRED = "required"
+    # Run inside a savepoint of the surrounding transaction
+    NESTED = "nested"
+
+
+def is_retryable(exc: Exception) -> bool:
+    if not isinstance(exc, DBAPIError) or exc.orig is None:
+        return False
+    args = getattr(exc.orig, "args", ())
+    return bool(args) and args[0] in RETRYABLE_ERROR_CODES
 
 
 class Transactional:
+    def __init__(
+        self,
+        *,
+        read_only: bool = False,
+        isolation: str | None = None,
+        propagation: Propagation = Propagation.REQUIRED,
+        retries: int = 0,
+        retry_backoff: float = 0.05,
+    ):
+        self.read_only = read_only
+        self.isolation = isolation
+        self.propagation = propagation
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+
     def __call__(self, func):
         @wraps(func)
         async def _transactional(*args, **kwargs):
+            if transaction_depth.get() > 0:
+                return await self._join(func, *args, **kwargs)
+
+            for attempt in range(self.retries + 1):
+                try:
+                    return await self._run(func, *args, **kwargs)
+                except DBAPIError as e:
+                    if attempt == self.retries or not is_retryable(e):
+                        raise
+                # Full jitter keeps retried transactions from colliding again
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * 2**attempt))
+
+        return _transactional
+
+    async def _run(self, func, *args, **kwargs):
+        engine_type = EngineType.READER if self.read_only else EngineType.WRITER
+        engine_context = set_engine_type(engine_type)
+        depth_context = transaction_depth.set(1)
+        read_only_context = transaction_read_only.set(self.read_only)
+        try:
+            if self.isolation is not None:
+                await session.connection(
+                    execution_options={"isolation_level": self.isolation}
+                )
+
+            if self.read_only:
+                # Nothing to commit; keep pending objects out of the queries
+                with session.no_autoflush:
+                    return await func(*args, **kwargs)
+
             try:
                 result = await func(*args, **kwargs)
                 await session.commit()
@@ -15,5 +93,24 @@ class Transactional:
                 raise e
 
             return result
+        finally:
+            transaction_read_only.reset(read_only_context)
+            transaction_depth.reset(depth_context)
+            reset_engine_type(engine_context)
 
-        return _transactional
+    async def _join(self, func, *args, **kwargs):
+        if not self.read_only and transaction_read_only.get():
+            # Its writes would be flushed and then silently rolled back
+            raise ReadOnlyTransactionError(
+                f"{func.__qualname__} writes inside a read-only transaction"
+            )
+
+        depth_context = transaction_depth.set(transaction_depth.get() + 1)
+        try:
+            if self.propagation != Propagation.NESTED:
+                return await func(*args, **kwargs)
+
+            async with session.begin_nested():
+                return await func(*args, **kwargs)
+        finally:
+            transaction_depth.reset(depth_context)
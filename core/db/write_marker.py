@@ -0,0 +1,57 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.config import config
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from core.helpers.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class WriteMarker:
+    """Remember users who wrote recently so their next reads use the writer"""
+
+    def __init__(
+        self,
+        *,
+        client: Redis = redis_client,
+        ttl: int = 5,
+        prefix: str = "db:wrote:",
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        # Keeps an unavailable Redis from adding latency to every request
+        self.breaker = breaker or CircuitBreaker()
+
+    async def mark(self, *, user_id: int) -> None:
+        if self.ttl <= 0 or not self.breaker.allow():
+            return
+
+        try:
+            await self.client.set(f"{self.prefix}{user_id}", 1, ex=self.ttl)
+        except RedisError:
+            self.breaker.record_failure()
+            logger.warning("Could not mark user %s as writer", user_id, exc_info=True)
+        else:
+            self.breaker.record_success()
+
+    async def is_marked(self, *, user_id: int) -> bool:
+        if self.ttl <= 0 or not self.breaker.allow():
+            return False
+
+        try:
+            marked = await self.client.get(f"{self.prefix}{user_id}")
+        except RedisError:
+            # Without the marker reads go to replicas as usual
+            self.breaker.record_failure()
+            return False
+
+        self.breaker.record_success()
+        return marked is not None
+
+
+write_marker = WriteMarker(ttl=config.DB_STICKY_WRITER_SECONDS)
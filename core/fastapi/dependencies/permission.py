@@ -1,5 +1,8 @@
-from abc import ABC, abstractmethod
-from typing import Type
+import asyncio
+import inspect
+from abc import ABC, ABCMeta, abstractmethod
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, Type
+from uuid import uuid4
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, Request
@@ -9,6 +12,12 @@ from starlette import status
 
 from app.container import Container
 from app.user.domain.usecase.user import UserUseCase
+from core.db.session import (
+    has_session,
+    reset_session_context,
+    session,
+    set_session_context,
+)
 from core.exceptions import CustomException
 
 
@@ -18,18 +27,55 @@ class UnauthorizedException(CustomException):
     message = ""
 
 
-class BasePermission(ABC):
+class PermissionMeta(ABCMeta):
+    def __or__(cls, other):
+        # Keep `BasePermission | None` working as a type annotation
+        if not _is_permission(other):
+            return super().__or__(other)
+
+        return AnyPermission(cls, other)
+
+    def __and__(cls, other):
+        return AllPermissions(cls, other)
+
+
+def _is_permission(value: Any) -> bool:
+    if isinstance(value, type):
+        return issubclass(value, BasePermission)
+
+    return isinstance(value, BasePermission)
+
+
+class BasePermission(ABC, metaclass=PermissionMeta):
     exception = CustomException
 
     @abstractmethod
-    async def has_permission(self, request: Request) -> bool:
-        """has permssion"""
+    def has_permission(self, request: Request) -> bool | Awaitable[bool]:
+        """has permssion, sync for cheap checks and async for I/O"""
+
+    @property
+    def is_sync(self) -> bool:
+        return not inspect.iscoroutinefunction(self.has_permission)
+
+    async def denied(self, *, request: Request) -> "BasePermission | None":
+        """Return the permission that denied the request, if any"""
+        result = self.has_permission(request=request)
+        if inspect.isawaitable(result):
+            result = await result
+
+        return None if result else self
+
+    def __or__(self, other):
+        return AnyPermission(self, other)
+
+    def __and__(self, other):
+        return AllPermissions(self, other)
 
 
 class IsAuthenticated(BasePermission):
     exception = UnauthorizedException
 
-    async def has_permission(self, request: Request) -> bool:
+    def has_permission(self, request: Request) -> bool:
         return request.user.id is not None
 
 
@@ -50,18 +96,126 @@ class IsAdmin(BasePermission):
 
 
 class AllowAll(BasePermission):
-    async def has_permission(self, request: Request) -> bool:
+    def has_permission(self, request: Request) -> bool:
         return True
 
 
+PermissionType = Type[BasePermission] | BasePermission
+
+
+async def _in_own_session(coroutine: Coroutine) -> Any:
+    # Concurrent checks must not share the request's AsyncSession
+    context = set_session_context(session_id=str(uuid4()))
+    try:
+        return await coroutine
+    finally:
+        if has_session():
+            await session.remove()
+        reset_session_context(context=context)
+
+
+async def _first_match(
+    coroutines: list[Coroutine],
+    *,
+    match: Callable[[Any], bool],
+    default: Any,
+) -> Any:
+    """Run concurrently and return the first result that matches, cancelling the rest"""
+    if len(coroutines) == 1:
+        result = await coroutines[0]
+        return result if match(result) else default
+
+    tasks = [
+        asyncio.create_task(_in_own_session(coroutine)) for coroutine in coroutines
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if match(result):
+                return result
+
+        return default
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class CompositePermission(BasePermission):
+    def __init__(self, *permissions: PermissionType):
+        self.permissions = list(self._flatten(permissions))
+        self.sync_permissions = [p for p in self.permissions if p.is_sync]
+        self.async_permissions = [p for p in self.permissions if not p.is_sync]
+        self.exception = self.permissions[0].exception
+
+    def _flatten(
+        self,
+        permissions: Iterable[PermissionType],
+    ) -> Iterable[BasePermission]:
+        for permission in permissions:
+            if isinstance(permission, type):
+                permission = permission()
+
+            if type(permission) is type(self):
+                yield from permission.permissions
+            else:
+                yield permission
+
+    @property
+    def is_sync(self) -> bool:
+        return not self.async_permissions
+
+    async def has_permission(self, request: Request) -> bool:
+        return await self.denied(request=request) is None
+
+
+class AllPermissions(CompositePermission):
+    """Granted when every permission grants, denied by the first that does not"""
+
+    async def denied(self, *, request: Request) -> BasePermission | None:
+        for permission in self.sync_permissions:
+            denied = await permission.denied(request=request)
+            if denied:
+                return denied
+
+        if not self.async_permissions:
+            return None
+
+        return await _first_match(
+            [p.denied(request=request) for p in self.async_permissions],
+            match=lambda denied: denied is not None,
+            default=None,
+        )
+
+
+class AnyPermission(CompositePermission):
+    """Granted by the first permission that grants"""
+
+    async def denied(self, *, request: Request) -> BasePermission | None:
+        for permission in self.sync_permissions:
+            if not await permission.denied(request=request):
+                return None
+
+        if not self.async_permissions:
+            return self
+
+        granted = await _first_match(
+            [self._granted(p, request=request) for p in self.async_permissions],
+            match=bool,
+            default=False,
+        )
+        return None if granted else self
+
+    async def _granted(self, permission: BasePermission, *, request: Request) -> bool:
+        return await permission.denied(request=request) is None
+
+
 class PermissionDependency(SecurityBase):
-    def __init__(self, permissions: list[Type[BasePermission]]):
-        self.permissions = permissions
+    def __init__(self, permissions: list[PermissionType]):
+        self.permission = AllPermissions(*permissions)
         self.model: APIKey = APIKey(**{"in": APIKeyIn.header}, name="Authorization")
         self.scheme_name = self.__class__.__name__
 
     async def __call__(self, request: Request):
-        for permission in self.permissions:
-            cls = permission()
-            if not await cls.has_permission(request=request):
-                raise cls.exception
+        denied = await self.permission.denied(request=request)
+        if denied:
+            raise denied.exception
@@ -1,3 +1,7 @@
+import hashlib
+import time
+from collections import OrderedDict
+
 import jwt
 from pydantic import BaseModel, Field
 from starlette.authentication import AuthenticationBackend
@@ -7,13 +11,78 @@ from starlette.middleware.authentication import (
 from starlette.requests import HTTPConnection
 
 from core.config import config
+from core.helpers.refresh_token import (
+    RefreshTokenManager,
+    is_refresh_token,
+    refresh_tokens,
+)
+from core.helpers.token import key_set
 
 
 class CurrentUser(BaseModel):
     id: int = Field(None, description="ID")
 
 
+class VerifiedTokenCache:
+    """LRU of recently verified tokens, keyed by token hash.
+
+    An entry lives until the token's `exp` or `ttl` seconds, whichever is
+    sooner, so a cached token never outlives its own expiry.
+    """
+
+    def __init__(self, *, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+
+    def _key(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, token: str, payload: dict) -> None:
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        key = self._key(token)
+        self._entries[key] = (payload, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class AuthBackend(AuthenticationBackend):
+    def __init__(
+        self,
+        *,
+        cache_size: int = config.JWT_CACHE_SIZE,
+        cache_ttl: int = config.JWT_CACHE_TTL,
+        refresh_tokens: RefreshTokenManager = refresh_tokens,
+    ):
+        self.key_set = key_set
+        self.refresh_tokens = refresh_tokens
+        self.cache = VerifiedTokenCache(max_entries=cache_size, ttl=cache_ttl)
+
     async def authenticate(
         self, conn: HTTPConnection
     ) -> tuple[bool, CurrentUser | None]:
@@ -32,17 +101,29 @@ class AuthBackend(AuthenticationBackend):
         if not credentials:
             return False, current_user
 
-        try:
-            payload = jwt.decode(
-                credentials,
-                config.JWT_SECRET_KEY,
-                algorithms=[config.JWT_ALGORITHM],
-            )
-            user_id = payload.get("user_id")
-        except jwt.exceptions.PyJWTError:
+        payload = self.cache.get(credentials)
+        if payload is None:
+            try:
+                header = jwt.get_unverified_header(credentials)
+                payload = jwt.decode(
+                    credentials,
+                    self.key_set.verification_key(kid=header.get("kid")),
+                    algorithms=self.key_set.algorithms,
+                )
+            except jwt.exceptions.PyJWTError:
+                return False, current_user
+
+            self.cache.set(credentials, payload)
+
+        if is_refresh_token(payload):
+            return False, current_user
+
+        # Checked on cache hits too, so revoking a session takes effect at once
+        session_id = payload.get("sid")
+        if session_id and await self.refresh_tokens.is_revoked(session_id=session_id):
             return False, current_user
 
-        current_user.id = user_id
+        current_user.id = payload.get("user_id")
         return True, current_user
 
 
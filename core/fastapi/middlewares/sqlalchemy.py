@@ -1,8 +1,20 @@
-from uuid import uuid4
+from itertools import count
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from core.db.session import set_session_context, reset_session_context, session
+from core.db.session import (
+    has_session,
+    reset_session_context,
+    reset_sticky_user,
+    session,
+    session_has_written,
+    set_session_context,
+    set_sticky_user,
+)
+from core.db.write_marker import write_marker
+
+# Only needs to be unique among in-flight requests of this process
+session_ids = count()
 
 
 class SQLAlchemyMiddleware:
@@ -10,13 +22,23 @@ class SQLAlchemyMiddleware:
         self.app = app
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        session_id = str(uuid4())
-        context = set_session_context(session_id=session_id)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # The scoped session itself is only created on first use
+        context = set_session_context(session_id=next(session_ids))
+        user_id = getattr(scope.get("user"), "id", None)
+        user_context = set_sticky_user(user_id)
 
         try:
             await self.app(scope, receive, send)
         except Exception as e:
             raise e
         finally:
-            await session.remove()
+            if has_session():
+                if user_id is not None and session_has_written():
+                    await write_marker.mark(user_id=user_id)
+                await session.remove()
+            reset_sticky_user(context=user_context)
             reset_session_context(context=context)
@@ -1,11 +1,18 @@
 from .cache_manager import Cache
 from .cache_tag import CacheTag
 from .custom_key_maker import CustomKeyMaker
+from .memory_backend import MemoryBackend
 from .redis_backend import RedisBackend
+from .resilient_backend import CacheInvalidationError, ResilientBackend
+from .two_tier_backend import TwoTierBackend
 
 __all__ = [
     "Cache",
     "RedisBackend",
+    "MemoryBackend",
+    "TwoTierBackend",
+    "ResilientBackend",
+    "CacheInvalidationError",
     "CustomKeyMaker",
     "CacheTag",
 ]
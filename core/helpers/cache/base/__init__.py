@@ -1,7 +1,10 @@
-from .backend import BaseBackend
+from .backend import MISSING, BaseBackend
 from .key_maker import BaseKeyMaker
+from .serializer import BaseSerializer
 
 __all__ = [
+    "MISSING",
     "BaseKeyMaker",
     "BaseBackend",
+    "BaseSerializer",
 ]
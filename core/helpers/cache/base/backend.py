@@ -2,15 +2,59 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# Returned instead of `default` to tell a miss apart from a cached None
+MISSING: Any = _Missing()
+
+
 class BaseBackend(ABC):
     @abstractmethod
-    async def get(self, *, key: str) -> Any:
-        """Get"""
+    async def get(self, *, key: str, default: Any = None) -> Any:
+        """Get, return `default` on miss"""
 
     @abstractmethod
-    async def set(self, *, response: Any, key: str, ttl: int = 60) -> None:
+    async def set(
+        self,
+        *,
+        response: Any,
+        key: str,
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
         """Set"""
 
     @abstractmethod
     async def delete_startswith(self, *, value: str) -> None:
         """Delete starts with"""
+
+    @abstractmethod
+    async def get_many(self, *, keys: list[str]) -> dict[str, Any]:
+        """Get many, the result only contains hits (cached None included)"""
+
+    @abstractmethod
+    async def set_many(
+        self,
+        *,
+        responses: dict[str, Any],
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        """Set many"""
+
+    @abstractmethod
+    async def delete_many(self, *, keys: list[str]) -> None:
+        """Delete many"""
+
+    async def delete_by_tag(self, *, tag: str) -> None:
+        """Delete every key set with `tag`, defaults to a prefix scan"""
+        await self.delete_startswith(value=tag)
+
+    async def start(self) -> None:
+        """Start background work, called from the application lifespan"""
+
+    async def stop(self) -> None:
+        """Stop background work, called from the application lifespan"""
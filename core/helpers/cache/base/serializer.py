@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class BaseSerializer(ABC):
+    format_id: int
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Dumps, raise TypeError if the value is not supported"""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Loads"""
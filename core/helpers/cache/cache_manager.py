@@ -1,17 +1,43 @@
+import inspect
+import math
+import random
+import time
 from functools import wraps
+from typing import Any, Awaitable, Callable
 
-from .base import BaseBackend, BaseKeyMaker
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.helpers.metrics import BaseMetricsSink, NullMetricsSink
+
+from .base import MISSING, BaseBackend, BaseKeyMaker
 from .cache_tag import CacheTag
+from .single_flight import SingleFlight
+
+# Shape of the entries `cached(early_refresh_beta=...)` stores
+EARLY_REFRESH_KEYS = frozenset({"value", "delta", "expiry"})
 
 
 class CacheManager:
     def __init__(self):
         self.backend = None
         self.key_maker = None
+        self.lock_client = None
+        self.metrics: BaseMetricsSink = NullMetricsSink()
+        self.single_flight = SingleFlight()
 
-    def init(self, *, backend: BaseBackend, key_maker: BaseKeyMaker) -> None:
+    def init(
+        self,
+        *,
+        backend: BaseBackend,
+        key_maker: BaseKeyMaker,
+        lock_client: Redis | None = None,
+        metrics: BaseMetricsSink | None = None,
+    ) -> None:
         self.backend = backend
         self.key_maker = key_maker
+        self.lock_client = lock_client
+        self.metrics = metrics or NullMetricsSink()
 
     def cached(
         self,
@@ -19,7 +45,27 @@ class CacheManager:
         prefix: str | None = None,
         tag: CacheTag | None = None,
         ttl: int = 60,
+        negative_ttl: int | None = None,
+        single_flight: bool = True,
+        lock: bool = False,
+        lock_timeout: int = 10,
+        early_refresh_beta: float | None = None,
     ):
+        """Cache the return value of the decorated coroutine.
+
+        negative_ttl: cache a `None` result for this many seconds. `None`
+            results are not cached unless it is set.
+        single_flight: share one in-flight call between concurrent misses of
+            the same key in this process.
+        lock: additionally serialize misses across workers with a Redis lock,
+            so only one worker recomputes an expired key.
+        early_refresh_beta: enable probabilistic early recomputation (XFetch)
+            before the TTL expires. `1.0` is the usual value, larger values
+            refresh earlier.
+        """
+
+        label = prefix if prefix else tag.value
+
         def _cached(function):
             @wraps(function)
             async def __cached(*args, **kwargs):
@@ -28,22 +74,356 @@ class CacheManager:
 
                 key = await self.key_maker.make(
                     function=function,
-                    prefix=prefix if prefix else tag.value,
+                    prefix=label,
+                    args=args,
+                    kwargs=kwargs,
+                )
+                cached_response = await self._instrument(
+                    operation="get",
+                    label=label,
+                    awaitable=self.backend.get(key=key, default=MISSING),
                 )
-                cached_response = await self.backend.get(key=key)
-                if cached_response:
-                    return cached_response
+                if self._is_fresh(
+                    cached_response=cached_response,
+                    early_refresh_beta=early_refresh_beta,
+                ):
+                    self.metrics.increment("cache_hits_total", tag=label)
+                    return self._unwrap(
+                        cached_response=cached_response,
+                        early_refresh_beta=early_refresh_beta,
+                    )
 
-                response = await function(*args, **kwargs)
-                await self.backend.set(response=response, key=key, ttl=ttl)
-                return response
+                self.metrics.increment("cache_misses_total", tag=label)
+
+                async def _load():
+                    return await self._load(
+                        key=key,
+                        label=label,
+                        function=function,
+                        args=args,
+                        kwargs=kwargs,
+                        ttl=ttl,
+                        negative_ttl=negative_ttl,
+                        tag=tag,
+                        lock=lock,
+                        lock_timeout=lock_timeout,
+                        early_refresh_beta=early_refresh_beta,
+                    )
+
+                if single_flight:
+                    return await self.single_flight.do(key, _load)
+
+                return await _load()
 
             return __cached
 
         return _cached
 
+    def cached_many(
+        self,
+        *,
+        prefix: str | None = None,
+        tag: CacheTag | None = None,
+        ttl: int = 60,
+        negative_ttl: int | None = None,
+    ):
+        """Cache a batch loader per ID.
+
+        The decorated coroutine takes the IDs as the `ids` keyword argument
+        and returns a dict of ID to value. Cached IDs are served with a
+        single multi-get and the loader is only called with the misses.
+        IDs missing from the loader's result are cached as not found for
+        `negative_ttl` seconds when it is set.
+        """
+
+        label = prefix if prefix else tag.value
+
+        def _cached_many(function):
+            @wraps(function)
+            async def __cached_many(*args, ids: list, **kwargs) -> dict:
+                if not self.backend or not self.key_maker:
+                    raise Exception("backend or key_maker is None")
+
+                keys = {}
+                for id in dict.fromkeys(ids):
+                    keys[id] = await self.key_maker.make(
+                        function=function,
+                        prefix=label,
+                        args=args,
+                        kwargs={**kwargs, "ids": [id]},
+                    )
+
+                cached_responses = await self._instrument(
+                    operation="get_many",
+                    label=label,
+                    awaitable=self.backend.get_many(keys=list(keys.values())),
+                )
+                responses = {
+                    id: cached_responses[key]
+                    for id, key in keys.items()
+                    if key in cached_responses
+                }
+                missing_ids = [id for id in keys if id not in responses]
+                self.metrics.increment("cache_hits_total", len(responses), tag=label)
+                self.metrics.increment(
+                    "cache_misses_total",
+                    len(missing_ids),
+                    tag=label,
+                )
+                if missing_ids:
+                    loaded = await function(*args, ids=missing_ids, **kwargs)
+                    await self._instrument(
+                        operation="set_many",
+                        label=label,
+                        awaitable=self.backend.set_many(
+                            responses={
+                                keys[id]: response
+                                for id, response in loaded.items()
+                                if id in keys and response is not None
+                            },
+                            ttl=ttl,
+                            tag=tag.value if tag else None,
+                        ),
+                    )
+                    if negative_ttl is not None:
+                        await self._instrument(
+                            operation="set_many",
+                            label=label,
+                            awaitable=self.backend.set_many(
+                                responses={
+                                    keys[id]: None
+                                    for id in missing_ids
+                                    if loaded.get(id) is None
+                                },
+                                ttl=negative_ttl,
+                                tag=tag.value if tag else None,
+                            ),
+                        )
+
+                    responses.update(loaded)
+
+                # Cached None values are known misses
+                return {
+                    id: responses[id] for id in keys if responses.get(id) is not None
+                }
+
+            return __cached_many
+
+        return _cached_many
+
+    async def _instrument(
+        self,
+        *,
+        operation: str,
+        label: str,
+        awaitable: Awaitable,
+    ) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return await awaitable
+        except Exception:
+            self.metrics.increment(
+                "cache_errors_total",
+                tag=label,
+                operation=operation,
+            )
+            raise
+        finally:
+            self.metrics.observe(
+                "cache_backend_latency_seconds",
+                time.perf_counter() - started_at,
+                tag=label,
+                operation=operation,
+            )
+
+    async def _load(
+        self,
+        *,
+        key: str,
+        label: str,
+        function: Callable,
+        args: tuple,
+        kwargs: dict,
+        ttl: int,
+        negative_ttl: int | None,
+        tag: CacheTag | None,
+        lock: bool,
+        lock_timeout: int,
+        early_refresh_beta: float | None,
+    ) -> Any:
+        if not lock or not self.lock_client:
+            return await self._compute(
+                key=key,
+                label=label,
+                function=function,
+                args=args,
+                kwargs=kwargs,
+                ttl=ttl,
+                negative_ttl=negative_ttl,
+                tag=tag,
+                early_refresh=early_refresh_beta is not None,
+            )
+
+        redis_lock = self.lock_client.lock(
+            f"{key}:lock",
+            timeout=lock_timeout,
+            blocking_timeout=lock_timeout,
+        )
+        try:
+            acquired = await redis_lock.acquire()
+        except RedisError:
+            # Without Redis, fall back to per-process coalescing only
+            acquired = False
+
+        try:
+            # Another worker may have filled the key while we were waiting
+            cached_response = await self._instrument(
+                operation="get",
+                label=label,
+                awaitable=self.backend.get(key=key, default=MISSING),
+            )
+            if self._is_fresh(
+                cached_response=cached_response,
+                early_refresh_beta=early_refresh_beta,
+            ):
+                return self._unwrap(
+                    cached_response=cached_response,
+                    early_refresh_beta=early_refresh_beta,
+                )
+
+            return await self._compute(
+                key=key,
+                label=label,
+                function=function,
+                args=args,
+                kwargs=kwargs,
+                ttl=ttl,
+                negative_ttl=negative_ttl,
+                tag=tag,
+                early_refresh=early_refresh_beta is not None,
+            )
+        finally:
+            if acquired:
+                try:
+                    await redis_lock.release()
+                except RedisError:
+                    pass
+
+    async def _compute(
+        self,
+        *,
+        key: str,
+        label: str,
+        function: Callable,
+        args: tuple,
+        kwargs: dict,
+        ttl: int,
+        negative_ttl: int | None,
+        tag: CacheTag | None,
+        early_refresh: bool,
+    ) -> Any:
+        started_at = time.time()
+        response = await function(*args, **kwargs)
+        if response is None:
+            if negative_ttl is None:
+                return response
+
+            ttl = negative_ttl
+
+        if early_refresh:
+            finished_at = time.time()
+            response_to_cache = {
+                "value": response,
+                "delta": finished_at - started_at,
+                "expiry": finished_at + ttl,
+            }
+        else:
+            response_to_cache = response
+
+        await self._instrument(
+            operation="set",
+            label=label,
+            awaitable=self.backend.set(
+                response=response_to_cache,
+                key=key,
+                ttl=ttl,
+                tag=tag.value if tag else None,
+            ),
+        )
+
+        return response
+
+    def _is_fresh(
+        self,
+        *,
+        cached_response: Any,
+        early_refresh_beta: float | None,
+    ) -> bool:
+        if cached_response is MISSING:
+            return False
+
+        if early_refresh_beta is None:
+            return True
+
+        # Written before early refresh was enabled, recompute it in the new shape
+        if not self._is_envelope(cached_response):
+            return False
+
+        # XFetch: refresh with a probability that grows as expiry approaches
+        # and with the time the value took to compute
+        jitter = (
+            -cached_response["delta"]
+            * early_refresh_beta
+            * math.log(1.0 - random.random())
+        )
+        return time.time() + jitter < cached_response["expiry"]
+
+    @staticmethod
+    def _is_envelope(cached_response: Any) -> bool:
+        return (
+            isinstance(cached_response, dict)
+            and EARLY_REFRESH_KEYS <= cached_response.keys()
+        )
+
+    def _unwrap(
+        self,
+        *,
+        cached_response: Any,
+        early_refresh_beta: float | None,
+    ) -> Any:
+        if early_refresh_beta is None:
+            return cached_response
+
+        return cached_response["value"]
+
+    async def start(self) -> None:
+        if self.backend:
+            await self.backend.start()
+
+    async def stop(self) -> None:
+        if self.backend:
+            await self.backend.stop()
+
+    async def remove(
+        self,
+        *,
+        function: Callable,
+        prefix: str | None = None,
+        tag: CacheTag | None = None,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Remove the entry `cached` stored for this call of `function`"""
+        key = await self.key_maker.make(
+            function=inspect.unwrap(function),
+            prefix=prefix if prefix else tag.value,
+            args=args,
+            kwargs=kwargs,
+        )
+        await self.backend.delete_many(keys=[key])
+
     async def remove_by_tag(self, *, tag: CacheTag) -> None:
-        await self.backend.delete_startswith(value=tag.value)
+        await self.backend.delete_by_tag(tag=tag.value)
 
     async def remove_by_prefix(self, *, prefix: str) -> None:
         await self.backend.delete_startswith(value=prefix)
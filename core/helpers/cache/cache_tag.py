@@ -3,3 +3,4 @@ from enum import Enum
 
 class CacheTag(Enum):
     GET_USER_LIST = "get_user_list"
+    USER_IS_ADMIN = "user_is_admin"
@@ -0,0 +1,51 @@
+import time
+
+
+class CircuitBreaker:
+    """Stop calling a dependency after repeated failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    `allow()` returns False for `recovery_timeout` seconds. Then a single
+    probe call is let through; its result closes or re-opens the circuit.
+    A probe that never reports back (e.g. its task was cancelled) gives up
+    the slot after another `recovery_timeout` seconds.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probe_started_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+
+        now = time.monotonic()
+        if now - self.opened_at < self.recovery_timeout:
+            return False
+
+        if (
+            self.probe_started_at is not None
+            and now - self.probe_started_at < self.recovery_timeout
+        ):
+            return False
+
+        self.probe_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probe_started_at = None
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
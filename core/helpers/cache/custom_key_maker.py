@@ -1,18 +1,117 @@
+import hashlib
 import inspect
-from typing import Callable
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable
+from uuid import UUID
+
+from pydantic import BaseModel
 
 from core.helpers.cache.base import BaseKeyMaker
 
+SKIP_PARAMETERS = frozenset({"self", "cls"})
+# Types whose repr() depends only on their value
+STABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    type(None),
+    Decimal,
+    UUID,
+    Enum,
+    date,
+    time,
+    timedelta,
+)
+
+
+def encode_argument(value: Any) -> str:
+    """Render an argument the same way in every process.
+
+    Objects without a value-based repr (the default one holds a memory
+    address) would give every call its own key, so they are rejected.
+    """
+    if isinstance(value, BaseModel):
+        model = type(value)
+        return f"{model.__module__}.{model.__qualname__}({value.model_dump_json()})"
+
+    if isinstance(value, STABLE_TYPES):
+        return repr(value)
+
+    if isinstance(value, (list, tuple)):
+        items = ",".join(encode_argument(item) for item in value)
+        return f"{type(value).__name__}({items})"
+
+    if isinstance(value, (set, frozenset)):
+        items = ",".join(sorted(encode_argument(item) for item in value))
+        return f"set({items})"
+
+    if isinstance(value, dict):
+        items = ",".join(
+            sorted(
+                f"{encode_argument(key)}:{encode_argument(item)}"
+                for key, item in value.items()
+            )
+        )
+        return f"dict({items})"
+
+    raise TypeError(f"{type(value)} cannot be part of a cache key")
+
+
+class FunctionSpec:
+    __slots__ = ("path", "signature", "skip", "has_arguments")
+
+    def __init__(self, *, function: Callable):
+        module = inspect.getmodule(function)
+        self.path = f"{module.__name__}.{function.__name__}"  # type: ignore
+        self.signature = inspect.signature(function)
+        parameters = list(self.signature.parameters)
+        self.skip = None
+        if parameters and parameters[0] in SKIP_PARAMETERS:
+            self.skip = parameters[0]
+        self.has_arguments = len(parameters) > (1 if self.skip else 0)
+
 
 class CustomKeyMaker(BaseKeyMaker):
-    async def make(self, *, function: Callable, prefix: str) -> str:
-        path = f"{prefix}::{inspect.getmodule(function).__name__}.{function.__name__}"  # type: ignore
-        args = ""
+    def __init__(self, *, digest_size: int = 16):
+        self.digest_size = digest_size
+        self._specs: dict[Callable, FunctionSpec] = {}
+
+    def _get_spec(self, function: Callable) -> FunctionSpec:
+        spec = self._specs.get(function)
+        if spec is None:
+            spec = FunctionSpec(function=function)
+            self._specs[function] = spec
+
+        return spec
 
-        for arg in inspect.signature(function).parameters.values():
-            args += arg.name
+    async def make(
+        self,
+        *,
+        function: Callable,
+        prefix: str,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> str:
+        spec = self._get_spec(function)
+        path = f"{prefix}::{spec.path}"
+        if not spec.has_arguments:
+            return path
 
-        if args:
-            return f"{path}.{args}"
+        bound = spec.signature.bind_partial(*args, **(kwargs or {}))
+        bound.apply_defaults()
+        arguments = [
+            f"{name}={encode_argument(value)}"
+            for name, value in sorted(bound.arguments.items())
+            if name != spec.skip
+        ]
+        if not arguments:
+            return path
 
-        return path
+        digest = hashlib.blake2b(
+            "&".join(arguments).encode(),
+            digest_size=self.digest_size,
+        ).hexdigest()
+        return f"{path}:{digest}"
@@ -0,0 +1,159 @@
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from core.helpers.cache.base import MISSING, BaseBackend
+from core.helpers.metrics import BaseMetricsSink, metrics_sink
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+def estimate_size(value: Any, depth: int = 2) -> int:
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, depth - 1) + estimate_size(item, depth - 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, depth - 1)
+
+    return size
+
+
+class MemoryBackend(BaseBackend):
+    """In-process LRU cache with per-entry TTL.
+
+    Entries are evicted least-recently-used first once either `max_entries`
+    or `max_size` (estimated bytes) is exceeded. Values are stored as-is, so
+    callers must not mutate objects returned from `get`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_size: int = 64 * 1024 * 1024,
+        metrics: BaseMetricsSink = metrics_sink,
+    ):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.metrics = metrics
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[Any, float, int, str | None]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[str]] = {}
+
+    async def get(self, *, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return default
+
+        value, expires_at, _, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(
+        self,
+        *,
+        response: Any,
+        key: str,
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        # The previous value is stale even when the new one is too large to keep
+        if key in self._entries:
+            self._remove(key)
+
+        size = estimate_size(response)
+        if size > self.max_size:
+            return
+
+        self._entries[key] = (response, time.monotonic() + ttl, size, tag)
+        if tag:
+            self._tags.setdefault(tag, set()).add(key)
+        self.stats.entries += 1
+        self.stats.size += size
+        self._evict()
+
+    async def get_many(self, *, keys: list[str]) -> dict[str, Any]:
+        responses = {}
+        for key in keys:
+            response = await self.get(key=key, default=MISSING)
+            if response is not MISSING:
+                responses[key] = response
+
+        return responses
+
+    async def set_many(
+        self,
+        *,
+        responses: dict[str, Any],
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        for key, response in responses.items():
+            await self.set(response=response, key=key, ttl=ttl, tag=tag)
+
+    async def delete_many(self, *, keys: list[str]) -> None:
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+
+    async def delete_startswith(self, *, value: str) -> None:
+        for key in [key for key in self._entries if key.startswith(value)]:
+            self._remove(key)
+
+    async def delete_by_tag(self, *, tag: str) -> None:
+        for key in self._tags.pop(tag, ()):
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+        self.stats.entries = 0
+        self.stats.size = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size, tag = self._entries.pop(key)
+        if tag and (keys := self._tags.get(tag)) is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+        self.stats.entries -= 1
+        self.stats.size -= size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            self.stats.entries > self.max_entries or self.stats.size > self.max_size
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+            self.metrics.increment(
+                "cache_evictions_total",
+                tag=key.partition("::")[0],
+                tier="memory",
+            )
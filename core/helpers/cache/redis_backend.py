@@ -1,28 +1,143 @@
-import pickle
+import time
 from typing import Any
 
-import ujson
+from redis.asyncio import Redis
 
-from core.helpers.cache.base import BaseBackend
-from core.helpers.redis import redis_client
+from core.helpers.cache.base import MISSING, BaseBackend, BaseSerializer
+from core.helpers.cache.serializer import CacheDecodeError, CacheSerializer
+from core.helpers.metrics import BaseMetricsSink, metrics_sink
+from core.helpers.redis import cache_redis_client
 
 
 class RedisBackend(BaseBackend):
-    async def get(self, *, key: str) -> Any:
-        result = await redis_client.get(key)
-        if not result:
+    def __init__(
+        self,
+        *,
+        client: Redis = cache_redis_client,
+        serializer: BaseSerializer | None = None,
+        tag_prefix: str = "cache:tags:",
+        tag_prune_delay: int = 60,
+        batch_size: int = 500,
+        metrics: BaseMetricsSink = metrics_sink,
+    ):
+        self.client = client
+        self.serializer = serializer or CacheSerializer()
+        self.tag_prefix = tag_prefix
+        self.tag_prune_delay = tag_prune_delay
+        self.batch_size = batch_size
+        self.metrics = metrics
+
+    async def get(self, *, key: str, default: Any = None) -> Any:
+        return self._loads(result=await self.client.get(key), default=default)
+
+    def _dumps(self, *, key: str, response: Any) -> bytes:
+        value = self.serializer.dumps(response)
+        self.metrics.observe(
+            "cache_payload_size_bytes",
+            len(value),
+            tag=key.partition("::")[0],
+        )
+        return value
+
+    def _loads(self, *, result: bytes | None, default: Any) -> Any:
+        if result is None:
+            return default
+
+        try:
+            return self.serializer.loads(result)
+        except CacheDecodeError:
+            # Unreadable entries (e.g. written by an older format) are misses
+            return default
+
+    async def set(
+        self,
+        *,
+        response: Any,
+        key: str,
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        if tag:
+            await self.set_many(responses={key: response}, ttl=ttl, tag=tag)
+            return
+
+        await self.client.set(
+            name=key, value=self._dumps(key=key, response=response), ex=ttl
+        )
+
+    async def get_many(self, *, keys: list[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+
+        responses = {}
+        for key, result in zip(keys, await self.client.mget(keys)):
+            response = self._loads(result=result, default=MISSING)
+            if response is not MISSING:
+                responses[key] = response
+
+        return responses
+
+    async def set_many(
+        self,
+        *,
+        responses: dict[str, Any],
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        if not responses:
             return
 
-        return ujson.loads(result)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, response in responses.items():
+                pipe.set(
+                    name=key,
+                    value=self._dumps(key=key, response=response),
+                    ex=ttl,
+                )
+
+            if tag:
+                # The tag index is a sorted set scored by each key's expiry.
+                # Members of expired keys are pruned on write, so the index
+                # stays bounded by the live keys without EXPIRE NX/GT (7.0+).
+                # The delay absorbs clock skew between workers.
+                tag_key = f"{self.tag_prefix}{tag}"
+                now = time.time()
+                pipe.zadd(tag_key, {key: now + ttl for key in responses})
+                pipe.zremrangebyscore(tag_key, "-inf", now - self.tag_prune_delay)
 
-    async def set(self, *, response: Any, key: str, ttl: int = 60) -> None:
-        if isinstance(response, dict):
-            response = ujson.dumps(response)
-        else:
-            response = pickle.dumps(response)
+            await pipe.execute()
 
-        await redis_client.set(name=key, value=response, ex=ttl)
+    async def delete_many(self, *, keys: list[str]) -> None:
+        for index in range(0, len(keys), self.batch_size):
+            await self.client.unlink(*keys[index : index + self.batch_size])
 
     async def delete_startswith(self, *, value: str) -> None:
-        async for key in redis_client.scan_iter(f"{value}*"):
-            await redis_client.delete(key)
+        async for key in self.client.scan_iter(f"{value}*"):
+            await self.client.delete(key)
+
+    async def delete_by_tag(self, *, tag: str) -> None:
+        # Detach the index first so keys written from now on start a new one.
+        # Members leave the detached index only once their keys are gone, so
+        # an interrupted run is finished by the next one for the same tag.
+        tag_key = f"{self.tag_prefix}{tag}"
+        detached_key = f"{tag_key}:detached"
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(detached_key, [detached_key, tag_key], aggregate="MAX")
+            pipe.unlink(tag_key)
+            await pipe.execute()
+
+        keys = []
+        async for key, _ in self.client.zscan_iter(detached_key, count=self.batch_size):
+            keys.append(key)
+            if len(keys) >= self.batch_size:
+                await self._delete_tagged(detached_key=detached_key, keys=keys)
+                keys = []
+
+        if keys:
+            await self._delete_tagged(detached_key=detached_key, keys=keys)
+
+    async def _delete_tagged(self, *, detached_key: str, keys: list[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.unlink(*keys)
+            pipe.zrem(detached_key, *keys)
+            await pipe.execute()
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from core.helpers.cache.base import BaseBackend
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from core.helpers.metrics import BaseMetricsSink, metrics_sink
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationError(RuntimeError):
+    """An invalidation did not complete, so stale entries may still be served"""
+
+
+class ResilientBackend(BaseBackend):
+    """Keep a cache outage from turning into an API outage.
+
+    Every call to the wrapped backend is bounded by `timeout` seconds and
+    guarded by a circuit breaker. Failed or skipped reads are misses and
+    failed writes are dropped. Invalidations get the longer
+    `invalidation_timeout`, since they may walk a whole tag index, and raise
+    `CacheInvalidationError` when they fail or are skipped. With
+    `write_behind`, writes and deletes are queued (in order) and applied by a
+    background worker started from `start()`, so responses are not delayed by
+    cache population.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend: BaseBackend,
+        timeout: float = 0.1,
+        invalidation_timeout: float = 5.0,
+        breaker: CircuitBreaker | None = None,
+        write_behind: bool = False,
+        queue_size: int = 1000,
+        metrics: BaseMetricsSink = metrics_sink,
+    ):
+        self.backend = backend
+        self.timeout = timeout
+        self.invalidation_timeout = invalidation_timeout
+        self.breaker = breaker or CircuitBreaker()
+        self.write_behind = write_behind
+        self.metrics = metrics
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._writer: asyncio.Task | None = None
+
+    async def get(self, *, key: str, default: Any = None) -> Any:
+        return await self._call(
+            operation="get",
+            function=lambda: self.backend.get(key=key, default=default),
+            fallback=default,
+        )
+
+    async def set(
+        self,
+        *,
+        response: Any,
+        key: str,
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        await self._write(
+            operation="set",
+            function=lambda: self.backend.set(
+                response=response,
+                key=key,
+                ttl=ttl,
+                tag=tag,
+            ),
+        )
+
+    async def get_many(self, *, keys: list[str]) -> dict[str, Any]:
+        return await self._call(
+            operation="get_many",
+            function=lambda: self.backend.get_many(keys=keys),
+            fallback={},
+        )
+
+    async def set_many(
+        self,
+        *,
+        responses: dict[str, Any],
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        await self._write(
+            operation="set_many",
+            function=lambda: self.backend.set_many(
+                responses=responses,
+                ttl=ttl,
+                tag=tag,
+            ),
+        )
+
+    async def delete_many(self, *, keys: list[str]) -> None:
+        await self._write(
+            operation="delete_many",
+            function=lambda: self.backend.delete_many(keys=keys),
+            invalidation=True,
+        )
+
+    async def delete_startswith(self, *, value: str) -> None:
+        await self._write(
+            operation="delete_startswith",
+            function=lambda: self.backend.delete_startswith(value=value),
+            invalidation=True,
+        )
+
+    async def delete_by_tag(self, *, tag: str) -> None:
+        await self._write(
+            operation="delete_by_tag",
+            function=lambda: self.backend.delete_by_tag(tag=tag),
+            invalidation=True,
+        )
+
+    async def start(self) -> None:
+        await self.backend.start()
+        if self.write_behind and self._writer is None:
+            self._writer = asyncio.create_task(self._drain())
+
+    async def stop(self) -> None:
+        if self._writer is not None:
+            try:
+                await asyncio.wait_for(
+                    self._queue.join(),
+                    timeout=max(self.timeout * 10, self.invalidation_timeout),
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Dropping %d queued cache writes", self._queue.qsize())
+
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+
+        await self.backend.stop()
+
+    async def _write(
+        self,
+        *,
+        operation: str,
+        function: Callable[[], Awaitable[Any]],
+        invalidation: bool = False,
+    ) -> None:
+        if self._writer is None:
+            await self._call(
+                operation=operation,
+                function=function,
+                fallback=None,
+                invalidation=invalidation,
+            )
+            return
+
+        try:
+            self._queue.put_nowait((operation, function, invalidation))
+        except asyncio.QueueFull:
+            self.metrics.increment("cache_write_behind_dropped_total")
+            if invalidation:
+                raise CacheInvalidationError(
+                    f"Cache {operation} dropped, queue is full"
+                )
+
+    async def _drain(self) -> None:
+        while True:
+            operation, function, invalidation = await self._queue.get()
+            try:
+                await self._call(
+                    operation=operation,
+                    function=function,
+                    fallback=None,
+                    invalidation=invalidation,
+                )
+            except CacheInvalidationError:
+                # Nobody is waiting on a queued invalidation to report to
+                logger.exception("Queued cache %s failed", operation)
+            finally:
+                self._queue.task_done()
+
+    async def _call(
+        self,
+        *,
+        operation: str,
+        function: Callable[[], Awaitable[Any]],
+        fallback: Any,
+        invalidation: bool = False,
+    ) -> Any:
+        if not self.breaker.allow():
+            self.metrics.increment("cache_bypassed_total", operation=operation)
+            if invalidation:
+                raise CacheInvalidationError(
+                    f"Cache {operation} skipped while the circuit is open"
+                )
+            return fallback
+
+        timeout = self.invalidation_timeout if invalidation else self.timeout
+        try:
+            result = await asyncio.wait_for(function(), timeout=timeout)
+        except Exception as e:
+            self.breaker.record_failure()
+            self.metrics.increment("cache_backend_failures_total", operation=operation)
+            self.metrics.set_gauge("cache_circuit_open", int(self.breaker.is_open))
+            if invalidation:
+                # Part of it may have run; retrying finishes the rest
+                raise CacheInvalidationError(f"Cache {operation} failed") from e
+
+            logger.warning("Cache %s failed: %r", operation, e)
+            return fallback
+
+        if self.breaker.failures or self.breaker.is_open:
+            self.metrics.set_gauge("cache_circuit_open", 0)
+        self.breaker.record_success()
+        return result
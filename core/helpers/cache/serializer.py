@@ -0,0 +1,226 @@
+import importlib
+import math
+import pickle
+import zlib
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from core.helpers.cache.base import BaseSerializer
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import lz4.frame as lz4
+except ImportError:  # pragma: no cover
+    lz4 = None
+
+MAGIC = b"\x00"
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+
+class CacheDecodeError(ValueError):
+    """A stored value could not be decoded"""
+
+
+def _check_json_value(value: Any) -> None:
+    # orjson turns tuples, UUIDs, enums, dataclasses, datetimes and subclasses
+    # into lists, strings or dicts, and NaN into null. Only exact JSON types
+    # are accepted, so anything else falls back to a serializer that
+    # round-trips it.
+    value_type = type(value)
+    if value_type in (str, int, bool) or value is None:
+        return
+
+    if value_type is float:
+        if not math.isfinite(value):
+            raise TypeError(f"{value} is not a JSON number")
+    elif value_type is list:
+        for item in value:
+            _check_json_value(item)
+    elif value_type is dict:
+        for key, item in value.items():
+            if type(key) is not str:
+                raise TypeError(f"{type(key)} is not a JSON object key")
+            _check_json_value(item)
+    else:
+        raise TypeError(f"{value_type} does not round-trip through JSON")
+
+
+class JsonSerializer(BaseSerializer):
+    format_id = 1
+
+    def dumps(self, value: Any) -> bytes:
+        _check_json_value(value)
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(BaseSerializer):
+    format_id = 2
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class PickleSerializer(BaseSerializer):
+    format_id = 3
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _import_model(path: str) -> type[BaseModel]:
+    module_name, _, qualname = path.partition(":")
+    model: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        model = getattr(model, name)
+
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        raise TypeError(f"{path} is not a pydantic model")
+
+    return model
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+class PydanticSerializer(BaseSerializer):
+    """Serialize a pydantic model or a list of models of one class.
+
+    The model path is stored in front of the JSON body, so the value is
+    rebuilt with pydantic-core's JSON validator instead of pickle.
+    """
+
+    format_id = 4
+
+    def dumps(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            model, many = type(value), False
+            body = value.model_dump_json().encode()
+        elif (
+            isinstance(value, list)
+            and value
+            and isinstance(value[0], BaseModel)
+            and all(type(item) is type(value[0]) for item in value)
+        ):
+            model, many = type(value[0]), True
+            body = _list_adapter(model).dump_json(value)
+        else:
+            raise TypeError(f"{type(value)} is not a pydantic model")
+
+        path = f"{model.__module__}:{model.__qualname__}"
+        return f"{int(many)}{path}\n".encode() + body
+
+    def loads(self, data: bytes) -> Any:
+        header, _, body = data.partition(b"\n")
+        model = _import_model(header[1:].decode())
+        if header[:1] == b"1":
+            return _list_adapter(model).validate_json(body)
+
+        return model.model_validate_json(body)
+
+
+class CacheSerializer(BaseSerializer):
+    """Encode values with the first serializer that supports them.
+
+    Stored values start with `MAGIC`, a format byte (serializer id and
+    compression) and then the payload. Values without the header were
+    written by older versions as plain JSON and are decoded as such.
+    """
+
+    format_id = 0
+
+    def __init__(
+        self,
+        *,
+        serializers: list[BaseSerializer] | None = None,
+        compression: int = COMPRESSION_ZLIB,
+        compress_threshold: int = 1024,
+        compress_level: int = 6,
+    ):
+        if compression == COMPRESSION_LZ4 and lz4 is None:
+            raise RuntimeError("lz4 is not installed")
+
+        self.serializers = serializers or [
+            PydanticSerializer(),
+            JsonSerializer(),
+            PickleSerializer(),
+        ]
+        self.formats = {
+            serializer.format_id: serializer for serializer in self.serializers
+        }
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self.legacy = JsonSerializer()
+
+    def dumps(self, value: Any) -> bytes:
+        for serializer in self.serializers:
+            try:
+                data = serializer.dumps(value)
+            except TypeError:
+                continue
+
+            compression = COMPRESSION_NONE
+            if self.compression and len(data) >= self.compress_threshold:
+                compression = self.compression
+                data = self._compress(data=data, compression=compression)
+
+            header = bytes([serializer.format_id | compression << 4])
+            return MAGIC + header + data
+
+        raise TypeError(f"{type(value)} is not serializable")
+
+    def loads(self, data: bytes) -> Any:
+        # Corrupt payloads can fail in many ways (pickle, zlib, unknown
+        # format byte, moved models), so they all surface as one error
+        try:
+            return self._loads(data)
+        except Exception as exc:
+            raise CacheDecodeError(str(exc)) from exc
+
+    def _loads(self, data: bytes) -> Any:
+        if data[:1] != MAGIC:
+            return self.legacy.loads(data)
+
+        format_id, compression = data[1] & 0x0F, data[1] >> 4
+        data = data[2:]
+        if compression:
+            data = self._decompress(data=data, compression=compression)
+
+        return self.formats[format_id].loads(data)
+
+    def _compress(self, *, data: bytes, compression: int) -> bytes:
+        if compression == COMPRESSION_LZ4:
+            return lz4.compress(data)
+
+        return zlib.compress(data, self.compress_level)
+
+    def _decompress(self, *, data: bytes, compression: int) -> bytes:
+        if compression == COMPRESSION_LZ4:
+            return lz4.decompress(data)
+
+        return zlib.decompress(data)
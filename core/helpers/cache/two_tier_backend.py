@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from typing import Any
+
+import ujson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.helpers.cache.base import MISSING, BaseBackend
+from core.helpers.cache.memory_backend import MemoryBackend
+from core.helpers.redis import cache_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class TwoTierBackend(BaseBackend):
+    """Per-worker `MemoryBackend` (L1) in front of a shared backend (L2).
+
+    L1 entries live for at most `local_ttl` seconds. Invalidations are
+    applied to both tiers and broadcast over Redis pub/sub so that other
+    workers drop their L1 copies as well; a tag invalidation clears the whole
+    L1 tier. Call `start()`/`stop()` from the application lifespan to run the
+    subscriber.
+    """
+
+    def __init__(
+        self,
+        *,
+        remote: BaseBackend,
+        local: MemoryBackend | None = None,
+        local_ttl: int = 5,
+        client: Redis = cache_redis_client,
+        channel: str = "cache:invalidate",
+        retry_interval: float = 1.0,
+        poll_interval: float = 1.0,
+    ):
+        self.remote = remote
+        self.local = local or MemoryBackend()
+        self.local_ttl = local_ttl
+        self.client = client
+        self.channel = channel
+        self.retry_interval = retry_interval
+        self.poll_interval = poll_interval
+        self._listener: asyncio.Task | None = None
+
+    async def get(self, *, key: str, default: Any = None) -> Any:
+        response = await self.local.get(key=key, default=MISSING)
+        if response is not MISSING:
+            return response
+
+        response = await self.remote.get(key=key, default=MISSING)
+        if response is MISSING:
+            return default
+
+        await self.local.set(response=response, key=key, ttl=self.local_ttl)
+        return response
+
+    async def set(
+        self,
+        *,
+        response: Any,
+        key: str,
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        await self.remote.set(response=response, key=key, ttl=ttl, tag=tag)
+        await self.local.set(
+            response=response,
+            key=key,
+            ttl=min(ttl, self.local_ttl),
+            tag=tag,
+        )
+
+    async def get_many(self, *, keys: list[str]) -> dict[str, Any]:
+        responses = await self.local.get_many(keys=keys)
+        missing = [key for key in keys if key not in responses]
+        if not missing:
+            return responses
+
+        remote_responses = await self.remote.get_many(keys=missing)
+        await self.local.set_many(responses=remote_responses, ttl=self.local_ttl)
+        responses.update(remote_responses)
+        return responses
+
+    async def set_many(
+        self,
+        *,
+        responses: dict[str, Any],
+        ttl: int = 60,
+        tag: str | None = None,
+    ) -> None:
+        await self.remote.set_many(responses=responses, ttl=ttl, tag=tag)
+        await self.local.set_many(
+            responses=responses,
+            ttl=min(ttl, self.local_ttl),
+            tag=tag,
+        )
+
+    async def delete_many(self, *, keys: list[str]) -> None:
+        await self.remote.delete_many(keys=keys)
+        await self.local.delete_many(keys=keys)
+        await self.client.publish(self.channel, ujson.dumps({"keys": keys}))
+
+    async def delete_startswith(self, *, value: str) -> None:
+        await self.remote.delete_startswith(value=value)
+        await self.local.delete_startswith(value=value)
+        await self.client.publish(self.channel, ujson.dumps({"prefix": value}))
+
+    async def delete_by_tag(self, *, tag: str) -> None:
+        # L1 entries filled from L2 reads do not know their tag
+        await self.remote.delete_by_tag(tag=tag)
+        self.local.clear()
+        await self.client.publish(self.channel, ujson.dumps({"tag": tag}))
+
+    async def start(self) -> None:
+        await self.remote.start()
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        await self.remote.stop()
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                while True:
+                    # Poll with an explicit timeout so the pool's socket
+                    # timeout does not tear down an idle subscription
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=self.poll_interval,
+                    )
+                    if message is not None and message.get("type") == "message":
+                        await self._handle_message(message["data"])
+            except RedisError:
+                # Invalidations may have been missed while disconnected
+                logger.exception("Cache invalidation subscriber disconnected")
+                self.local.clear()
+                await asyncio.sleep(self.retry_interval)
+            finally:
+                await pubsub.aclose()
+
+    async def _handle_message(self, data: str | bytes) -> None:
+        try:
+            message = ujson.loads(data)
+        except ValueError:
+            message = {}
+
+        if "tag" in message:
+            self.local.clear()
+        elif "keys" in message:
+            await self.local.delete_many(keys=message["keys"])
+        elif "prefix" in message:
+            await self.local.delete_startswith(value=message["prefix"])
+        else:
+            logger.warning("Invalid cache invalidation message: %r", data)
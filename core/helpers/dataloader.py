@@ -0,0 +1,96 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Mapping, TypeVar
+
+from core.db.session import session, session_context
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Batch and deduplicate loads issued in the same event loop tick.
+
+    Every `load()` made before the loop gets back to its ready queue is
+    collected into a single `batch_load` call, which returns the found values
+    keyed by key. Results are cached for the loader's lifetime.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int | None = None,
+    ):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        # Batch loads share the request's AsyncSession, which does not allow
+        # concurrent operations, so dispatches from later ticks wait their turn
+        self._lock = asyncio.Lock()
+        # The loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V | None:
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                asyncio.get_running_loop().call_soon(self._dispatch)
+
+        # Shielded so one cancelled caller does not fail the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self, key: K) -> None:
+        self._futures.pop(key, None)
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._load_chunks(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_chunks(self, keys: list[K]) -> None:
+        size = self.max_batch_size or len(keys)
+        async with self._lock:
+            for start in range(0, len(keys), size):
+                await self._load_batch(keys[start : start + size])
+
+    async def _load_batch(self, keys: list[K]) -> None:
+        futures = [self._futures.get(key) for key in keys]
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            for key, future in zip(keys, futures):
+                # Failures are not cached so a later load can retry
+                self._futures.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in zip(keys, futures):
+            if future is not None and not future.done():
+                future.set_result(values.get(key))
+
+
+def request_loader(
+    name: str,
+    factory: Callable[[], DataLoader[K, V]],
+) -> DataLoader[K, V]:
+    """Loader shared by everything that runs in the current request.
+
+    Lives in the request session's `info`, so it is dropped with the session.
+    Outside a request a fresh loader is returned.
+    """
+    if session_context.get(None) is None:
+        return factory()
+
+    loaders = session().info.setdefault("loaders", {})
+    if name not in loaders:
+        loaders[name] = factory()
+    return loaders[name]
@@ -0,0 +1,125 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+
+from core.config import config
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+class BaseMetricsSink(ABC):
+    @abstractmethod
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increment counter"""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Observe histogram"""
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set gauge"""
+
+
+class NullMetricsSink(BaseMetricsSink):
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        pass
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, *, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class PrometheusMetricsSink(BaseMetricsSink):
+    """Keep metrics in memory and render them in Prometheus text format"""
+
+    def __init__(self, *, buckets: dict[str, tuple[float, ...]] | None = None):
+        self.buckets = buckets or {}
+        self.counters: dict[str, dict[LabelKey, float]] = {}
+        self.gauges: dict[str, dict[LabelKey, float]] = {}
+        self.histograms: dict[str, dict[LabelKey, Histogram]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            buckets = self.buckets.get(name, LATENCY_BUCKETS)
+            histogram = series[key] = Histogram(buckets=buckets)
+        histogram.observe(value)
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        self.gauges.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+    def render(self) -> str:
+        lines = []
+        for metric_type, metrics in (
+            ("counter", self.counters),
+            ("gauge", self.gauges),
+        ):
+            for name, series in sorted(metrics.items()):
+                lines.append(f"# TYPE {name} {metric_type}")
+                for key, value in series.items():
+                    lines.append(f"{name}{_format_labels(key)} {value}")
+
+        for name, series in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bucket, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    labels = _format_labels(key + (("le", str(bucket)),))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _format_labels(key + (("le", "+Inf"),))
+                lines.append(f"{name}_bucket{labels} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum}")
+                lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+
+    labels = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in key
+    )
+    return f"{{{labels}}}"
+
+
+metrics_sink: BaseMetricsSink = (
+    PrometheusMetricsSink(buckets={"cache_payload_size_bytes": SIZE_BUCKETS})
+    if config.METRICS_ENABLED
+    else NullMetricsSink()
+)
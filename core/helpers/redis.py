@@ -1,5 +1,55 @@
+import asyncio
+import logging
+
 from redis import asyncio as redis
+from redis.exceptions import RedisError
 
 from core.config import config
 
-redis_client = redis.from_url(url=f"redis://{config.REDIS_HOST}", decode_responses=True)
+logger = logging.getLogger(__name__)
+
+
+def create_redis_client(*, max_connections: int, decode_responses: bool) -> redis.Redis:
+    pool = redis.BlockingConnectionPool(
+        host=config.REDIS_HOST,
+        port=config.REDIS_PORT,
+        db=config.REDIS_DB,
+        max_connections=max_connections,
+        timeout=config.REDIS_POOL_TIMEOUT,
+        socket_timeout=config.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=config.REDIS_SOCKET_CONNECT_TIMEOUT,
+        socket_keepalive=config.REDIS_SOCKET_KEEPALIVE,
+        health_check_interval=config.REDIS_HEALTH_CHECK_INTERVAL,
+        decode_responses=decode_responses,
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+# Cache payloads are binary, everything else works with str
+cache_redis_client = create_redis_client(
+    max_connections=config.REDIS_CACHE_MAX_CONNECTIONS,
+    decode_responses=False,
+)
+redis_client = create_redis_client(
+    max_connections=config.REDIS_MAX_CONNECTIONS,
+    decode_responses=True,
+)
+redis_clients = (cache_redis_client, redis_client)
+
+
+async def warm_redis_pools(*, connections: int | None = None) -> None:
+    if connections is None:
+        connections = config.REDIS_POOL_WARM_CONNECTIONS
+
+    for client in redis_clients:
+        # Concurrent pings make the pool open that many connections up front
+        count = min(connections, client.connection_pool.max_connections)
+        try:
+            await asyncio.gather(*(client.ping() for _ in range(count)))
+        except RedisError:
+            logger.warning("Could not warm redis connection pool", exc_info=True)
+
+
+async def close_redis_pools() -> None:
+    for client in redis_clients:
+        await client.connection_pool.disconnect()
@@ -0,0 +1,198 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.config import config
+from core.exceptions import CustomException
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from core.helpers.redis import redis_client
+from core.helpers.token import DecodeTokenException, TokenHelper
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TOKEN_SUBJECT = "refresh"
+
+
+def is_refresh_token(payload: dict) -> bool:
+    """Refresh tokens must never be accepted where an access token is expected"""
+    return payload.get("sub") == REFRESH_TOKEN_SUBJECT
+
+
+class RevokedTokenException(CustomException):
+    code = 401
+    error_code = "TOKEN__REVOKED_TOKEN"
+    message = "revoked token"
+
+
+class ReusedRefreshTokenException(CustomException):
+    code = 401
+    error_code = "TOKEN__REUSED_REFRESH_TOKEN"
+    message = "refresh token already used"
+
+
+class BaseRefreshTokenStore(ABC):
+    @abstractmethod
+    async def add(self, *, jti: str, ttl: int) -> None:
+        """Register an issued refresh token"""
+
+    @abstractmethod
+    async def consume(self, *, jti: str) -> bool:
+        """Atomically invalidate a refresh token, False if it was not live"""
+
+    @abstractmethod
+    async def revoke_session(self, *, session_id: str, ttl: int) -> None:
+        """Revoke every token of a session"""
+
+    @abstractmethod
+    async def is_session_revoked(self, *, session_id: str) -> bool:
+        """Whether the session was revoked"""
+
+
+class RedisRefreshTokenStore(BaseRefreshTokenStore):
+    def __init__(
+        self,
+        *,
+        client: Redis = redis_client,
+        prefix: str = "auth:",
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.client = client
+        self.prefix = prefix
+        # Only guards the per-request revocation check
+        self.breaker = breaker or CircuitBreaker()
+
+    async def add(self, *, jti: str, ttl: int) -> None:
+        await self.client.set(f"{self.prefix}refresh:{jti}", 1, ex=ttl)
+
+    async def consume(self, *, jti: str) -> bool:
+        return await self.client.getdel(f"{self.prefix}refresh:{jti}") is not None
+
+    async def revoke_session(self, *, session_id: str, ttl: int) -> None:
+        await self.client.set(f"{self.prefix}revoked:{session_id}", 1, ex=ttl)
+
+    async def is_session_revoked(self, *, session_id: str) -> bool:
+        if not self.breaker.allow():
+            return False
+
+        try:
+            revoked = await self.client.exists(f"{self.prefix}revoked:{session_id}")
+        except RedisError:
+            # Access tokens are short-lived, so an outage does not lock everyone out
+            self.breaker.record_failure()
+            logger.warning("Could not check session %s", session_id, exc_info=True)
+            return False
+
+        self.breaker.record_success()
+        return bool(revoked)
+
+
+class MemoryRefreshTokenStore(BaseRefreshTokenStore):
+    def __init__(self):
+        self._tokens: dict[str, float] = {}
+        self._revoked: dict[str, float] = {}
+
+    def _is_live(self, entries: dict[str, float], key: str) -> bool:
+        expires_at = entries.get(key)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.monotonic():
+            del entries[key]
+            return False
+
+        return True
+
+    async def add(self, *, jti: str, ttl: int) -> None:
+        self._tokens[jti] = time.monotonic() + ttl
+
+    async def consume(self, *, jti: str) -> bool:
+        if not self._is_live(self._tokens, jti):
+            return False
+
+        del self._tokens[jti]
+        return True
+
+    async def revoke_session(self, *, session_id: str, ttl: int) -> None:
+        self._revoked[session_id] = time.monotonic() + ttl
+
+    async def is_session_revoked(self, *, session_id: str) -> bool:
+        return self._is_live(self._revoked, session_id)
+
+
+@dataclass(frozen=True)
+class TokenPair:
+    token: str
+    refresh_token: str
+
+
+class RefreshTokenManager:
+    """Issue token pairs bound to a session and rotate refresh tokens on use.
+
+    Every refresh token has a `jti` that can be used once. Presenting a used
+    one again means it leaked, so its whole session (`sid`) is revoked.
+    Access tokens carry the same `sid` so revocation also rejects them.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: BaseRefreshTokenStore,
+        access_ttl: int = 3600,
+        refresh_ttl: int = config.JWT_REFRESH_TOKEN_TTL,
+    ):
+        self.store = store
+        self.access_ttl = access_ttl
+        self.refresh_ttl = refresh_ttl
+
+    async def issue(self, *, user_id: int, session_id: str | None = None) -> TokenPair:
+        session_id = session_id or uuid4().hex
+        jti = uuid4().hex
+        await self.store.add(jti=jti, ttl=self.refresh_ttl)
+        return TokenPair(
+            token=TokenHelper.encode(
+                payload={"user_id": user_id, "sid": session_id},
+                expire_period=self.access_ttl,
+            ),
+            refresh_token=TokenHelper.encode(
+                payload={
+                    "sub": REFRESH_TOKEN_SUBJECT,
+                    "jti": jti,
+                    "user_id": user_id,
+                    "sid": session_id,
+                },
+                expire_period=self.refresh_ttl,
+            ),
+        )
+
+    async def rotate(self, *, refresh_token: str) -> TokenPair:
+        payload = TokenHelper.decode(token=refresh_token)
+        if not is_refresh_token(payload):
+            raise DecodeTokenException
+
+        jti, session_id = payload.get("jti"), payload.get("sid")
+        if not jti or not session_id:
+            raise DecodeTokenException
+
+        if await self.store.is_session_revoked(session_id=session_id):
+            raise RevokedTokenException
+
+        if not await self.store.consume(jti=jti):
+            await self.revoke(session_id=session_id)
+            raise ReusedRefreshTokenException
+
+        return await self.issue(user_id=payload.get("user_id"), session_id=session_id)
+
+    async def revoke(self, *, session_id: str) -> None:
+        # Outlives every token of the session, including the latest refresh token
+        await self.store.revoke_session(session_id=session_id, ttl=self.refresh_ttl)
+
+    async def is_revoked(self, *, session_id: str) -> bool:
+        return await self.store.is_session_revoked(session_id=session_id)
+
+
+refresh_tokens = RefreshTokenManager(store=RedisRefreshTokenStore())
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
+from typing import Any
 
 import jwt
+from jwt.algorithms import HMACAlgorithm
 
 from core.config import config
 from core.exceptions import CustomException
@@ -18,6 +20,77 @@ class ExpiredTokenException(CustomException):
     message = "expired token"
 
 
+class KeySet:
+    """Signing key and verification keys by `kid`, parsed once.
+
+    HMAC algorithms sign and verify with the shared secret. Asymmetric ones
+    (RS256, ES256, EdDSA, ...) sign with a PEM private key and verify with PEM
+    public keys, so verifiers never need the private key. Keep the previous
+    keys in `verification_keys` while rotating so tokens they signed stay
+    valid until they expire.
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: str,
+        signing_key: str = "",
+        kid: str = "",
+        verification_keys: dict[str, str] | None = None,
+    ):
+        self.algorithm = algorithm
+        self.algorithms = [algorithm]
+        self.kid = kid or None
+        self._algorithm = jwt.get_algorithm_by_name(algorithm)
+        self.signing_key = (
+            self._algorithm.prepare_key(signing_key) if signing_key else None
+        )
+        self.verification_keys: dict[str | None, Any] = {
+            kid or None: self._algorithm.prepare_key(key)
+            for kid, key in (verification_keys or {}).items()
+        }
+        if self.signing_key is not None and self.kid not in self.verification_keys:
+            self.verification_keys[self.kid] = self._public_key(self.signing_key)
+
+    def _public_key(self, key: Any) -> Any:
+        if isinstance(self._algorithm, HMACAlgorithm):
+            return key
+
+        return key.public_key()
+
+    @property
+    def headers(self) -> dict | None:
+        return {"kid": self.kid} if self.kid else None
+
+    def verification_key(self, *, kid: str | None) -> Any:
+        # Tokens without a `kid` are verified with the current key
+        key = self.verification_keys.get(kid or self.kid)
+        if key is None:
+            raise jwt.exceptions.InvalidKeyError(f"Unknown key id: {kid}")
+
+        return key
+
+    def verification_key_for(self, token: str) -> Any:
+        return self.verification_key(kid=jwt.get_unverified_header(token).get("kid"))
+
+    @classmethod
+    def from_config(cls) -> "KeySet":
+        if config.JWT_ALGORITHM.startswith("HS"):
+            signing_key = config.JWT_SECRET_KEY
+        else:
+            signing_key = config.JWT_PRIVATE_KEY
+
+        return cls(
+            algorithm=config.JWT_ALGORITHM,
+            signing_key=signing_key,
+            kid=config.JWT_KEY_ID,
+            verification_keys=config.JWT_VERIFICATION_KEYS,
+        )
+
+
+key_set = KeySet.from_config()
+
+
 class TokenHelper:
     @staticmethod
     def encode(payload: dict, expire_period: int = 3600) -> str:
@@ -26,8 +99,9 @@ class TokenHelper:
                 **payload,
                 "exp": datetime.now() + timedelta(seconds=expire_period),
             },
-            key=config.JWT_SECRET_KEY,
-            algorithm=config.JWT_ALGORITHM,
+            key=key_set.signing_key,
+            algorithm=key_set.algorithm,
+            headers=key_set.headers,
         )
         return token
 
@@ -36,10 +110,10 @@ class TokenHelper:
         try:
             return jwt.decode(
                 token,
-                config.JWT_SECRET_KEY,
-                config.JWT_ALGORITHM,
+                key_set.verification_key_for(token),
+                key_set.algorithms,
             )
-        except jwt.exceptions.DecodeError:
+        except (jwt.exceptions.DecodeError, jwt.exceptions.InvalidKeyError):
             raise DecodeTokenException
         except jwt.exceptions.ExpiredSignatureError:
             raise ExpiredTokenException
@@ -49,9 +123,9 @@ class TokenHelper:
         try:
             return jwt.decode(
                 token,
-                config.JWT_SECRET_KEY,
-                config.JWT_ALGORITHM,
+                key_set.verification_key_for(token),
+                key_set.algorithms,
                 options={"verify_exp": False},
             )
-        except jwt.exceptions.DecodeError:
+        except (jwt.exceptions.DecodeError, jwt.exceptions.InvalidKeyError):
             raise DecodeTokenException
@@ -1,20 +1,51 @@
-from typing import TypeVar, Type, Generic
+from itertools import islice
+from typing import Any, Generic, Iterable, Iterator, Sequence, Type, TypeVar
 
-from sqlalchemy import select, update, delete
+from pydantic import BaseModel
+from sqlalchemy import Select, delete, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import InstrumentedAttribute
 
-from core.db.session import Base, session
-from core.repository.enum import SynchronizeSessionEnum
+from core.db.session import Base, read_session_scope, session
+from core.repository.enum import SortOrder, SynchronizeSessionEnum
+from core.repository.pagination import Page, decode_cursor, encode_cursor, keyset_query
+from core.repository.projection import construct, projection_columns
 
 ModelType = TypeVar("ModelType", bound=Base)
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 class BaseRepo(Generic[ModelType]):
+    max_page_size: int = 100
+    bulk_chunk_size: int = 1000
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
     async def get_by_id(self, id: int) -> ModelType | None:
         query = select(self.model).where(self.model.id == id)
-        return await session.execute(query).scalars().first()
+        result = await session.execute(query)
+        return result.scalars().first()
+
+    async def get_by_ids(
+        self,
+        ids: Iterable[int],
+        chunk_size: int | None = None,
+    ) -> list[ModelType]:
+        models: list[ModelType] = []
+        async with read_session_scope() as read_session:
+            for chunk in chunked(set(ids), chunk_size or self.bulk_chunk_size):
+                query = select(self.model).where(self.model.id.in_(chunk))
+                result = await read_session.execute(query)
+                models.extend(result.scalars().all())
+
+        return models
 
     async def update_by_id(
         self,
@@ -46,5 +77,121 @@ class BaseRepo(Generic[ModelType]):
         await session.execute(query)
 
     async def save(self, model: ModelType) -> ModelType:
-        saved = await session.add(model)
-        return saved
+        session.add(model)
+        return model
+
+    async def bulk_create(
+        self,
+        rows: Iterable[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> None:
+        # Core insert skips the unit of work; one executemany per chunk
+        query = insert(self.model.__table__)
+        for chunk in chunked(rows, chunk_size or self.bulk_chunk_size):
+            await session.execute(query, chunk)
+
+    async def bulk_upsert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        """INSERT ... ON DUPLICATE KEY UPDATE.
+
+        Updates `update_columns`, or every non-primary-key column present in
+        the rows, when a row collides with an existing key.
+        """
+        table = self.model.__table__
+        for chunk in chunked(rows, chunk_size or self.bulk_chunk_size):
+            columns = update_columns or [
+                key for key in chunk[0] if not table.c[key].primary_key
+            ]
+            query = mysql_insert(table)
+            query = query.on_duplicate_key_update(
+                {column: query.inserted[column] for column in columns}
+            )
+            await session.execute(query, chunk)
+
+    async def bulk_update_by_ids(
+        self,
+        ids: Iterable[int],
+        params: dict,
+        synchronize_session: SynchronizeSessionEnum = False,
+        chunk_size: int | None = None,
+    ) -> None:
+        for chunk in chunked(ids, chunk_size or self.bulk_chunk_size):
+            query = (
+                update(self.model)
+                .where(self.model.id.in_(chunk))
+                .values(**params)
+                .execution_options(synchronize_session=synchronize_session)
+            )
+            await session.execute(query)
+
+    async def bulk_delete_by_ids(
+        self,
+        ids: Iterable[int],
+        synchronize_session: SynchronizeSessionEnum = False,
+        chunk_size: int | None = None,
+    ) -> None:
+        for chunk in chunked(ids, chunk_size or self.bulk_chunk_size):
+            query = (
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .execution_options(synchronize_session=synchronize_session)
+            )
+            await session.execute(query)
+
+    async def paginate(
+        self,
+        *,
+        query: Select | None = None,
+        columns: Sequence[InstrumentedAttribute] | None = None,
+        order: SortOrder = SortOrder.DESC,
+        limit: int | None = None,
+        cursor: str | None = None,
+        after: Sequence[Any] | None = None,
+        projection: type[BaseModel] | None = None,
+    ) -> Page:
+        """Keyset pagination over `columns`, which must end in a unique column.
+
+        Continue from an opaque `cursor` returned as `Page.next_cursor`, or
+        from the raw key values in `after`. With `projection`, only the
+        columns backing its fields are selected and items are built from the
+        rows without loading ORM objects.
+        """
+        if columns is None:
+            columns = (self.model.id,)
+        if query is None:
+            query = select(self.model)
+        if cursor is not None:
+            after = decode_cursor(cursor, columns=columns)
+        if projection is not None:
+            fields = projection_columns(self.model, projection)
+            # Key columns are needed for the cursor even if the DTO omits them
+            selected = {field.key for field in fields}
+            keys = [column for column in columns if column.key not in selected]
+            query = query.with_only_columns(*fields, *keys)
+
+        limit = max(1, min(limit or self.max_page_size, self.max_page_size))
+        query = keyset_query(
+            query,
+            columns=columns,
+            order=order,
+            after=after,
+            limit=limit,
+        )
+        async with read_session_scope() as read_session:
+            result = await read_session.execute(query)
+            rows = result.all() if projection else result.scalars().all()
+
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        if not rows:
+            return Page(items=[])
+
+        last_key = tuple(getattr(rows[-1], column.key) for column in columns)
+        next_cursor = encode_cursor(last_key) if has_next else None
+        if projection is not None:
+            rows = [construct(projection, row) for row in rows]
+        return Page(items=list(rows), next_cursor=next_cursor, last_key=last_key)
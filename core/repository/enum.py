@@ -1,7 +1,12 @@
-from pydantic import BaseModel
+from enum import Enum
 
 
-class SynchronizeSessionEnum(BaseModel):
+class SynchronizeSessionEnum(Enum):
     FETCH = "fetch"
     EVALUATE = "evaluate"
     FALSE = False
+
+
+class SortOrder(Enum):
+    ASC = "asc"
+    DESC = "desc"
@@ -0,0 +1,7 @@
+from core.exceptions import CustomException
+
+
+class InvalidCursorException(CustomException):
+    code = 400
+    error_code = "REPOSITORY__INVALID_CURSOR"
+    message = "invalid pagination cursor"
@@ -0,0 +1,104 @@
+import base64
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Generic, Sequence, TypeVar
+
+import ujson
+from sqlalchemy import ColumnElement, Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from core.repository.enum import SortOrder
+from core.repository.exception import InvalidCursorException
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    # Raw key of the last item, for callers paging with plain values
+    last_key: tuple[Any, ...] | None = field(default=None, repr=False)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(ujson.dumps(payload).encode()).decode()
+
+
+def decode_cursor(
+    cursor: str,
+    *,
+    columns: Sequence[InstrumentedAttribute],
+) -> tuple[Any, ...]:
+    try:
+        values = ujson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise InvalidCursorException
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorException
+
+    try:
+        return tuple(
+            _coerce(column=column, value=value)
+            for column, value in zip(columns, values)
+        )
+    except (TypeError, ValueError):
+        raise InvalidCursorException
+
+
+def _coerce(*, column: InstrumentedAttribute, value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def keyset_condition(
+    *,
+    columns: Sequence[InstrumentedAttribute],
+    values: Sequence[Any],
+    order: SortOrder,
+) -> ColumnElement[bool]:
+    """Rows strictly after `values` in (columns, order) ordering.
+
+    Expanded as `a > x OR (a = x AND b > y) ...` rather than a row value
+    comparison so MySQL can use a range scan on the leading index column.
+    """
+    conditions = []
+    for index, column in enumerate(columns):
+        value = values[index]
+        after = column < value if order == SortOrder.DESC else column > value
+        equal = [columns[prev] == values[prev] for prev in range(index)]
+        conditions.append(and_(*equal, after))
+
+    return or_(*conditions)
+
+
+def keyset_query(
+    query: Select,
+    *,
+    columns: Sequence[InstrumentedAttribute],
+    order: SortOrder,
+    after: Sequence[Any] | None,
+    limit: int,
+) -> Select:
+    if after is not None:
+        query = query.where(
+            keyset_condition(columns=columns, values=after, order=order)
+        )
+
+    order_by = [
+        column.desc() if order == SortOrder.DESC else column.asc() for column in columns
+    ]
+    # One extra row tells whether another page exists
+    return query.order_by(*order_by).limit(limit + 1)
@@ -0,0 +1,23 @@
+from functools import cache
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Row
+from sqlalchemy.orm import InstrumentedAttribute
+
+DTOType = TypeVar("DTOType", bound=BaseModel)
+
+
+@cache
+def projection_columns(
+    model: Type[Any],
+    dto: Type[BaseModel],
+) -> tuple[InstrumentedAttribute, ...]:
+    """Mapped attributes backing each field of `dto`, by field name"""
+    return tuple(getattr(model, name) for name in dto.model_fields)
+
+
+def construct(dto: Type[DTOType], row: Row) -> DTOType:
+    # Values come straight from typed columns, so validation is skipped
+    mapping = row._mapping
+    return dto.model_construct(**{name: mapping[name] for name in dto.model_fields})
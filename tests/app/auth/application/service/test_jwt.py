@@ -5,6 +5,8 @@ from tests.support.token import INVALID_REFRESH_TOKEN, USER_ID_1_TOKEN
 
 jwt_service = JwtService()
 
+pytestmark = pytest.mark.usefixtures("memory_refresh_tokens")
+
 
 @pytest.mark.asyncio
 async def test_verify_token():
@@ -13,6 +15,16 @@ async def test_verify_token():
         await jwt_service.verify_token(token="abc")
 
 
+@pytest.mark.asyncio
+async def test_verify_token_refresh_token(memory_refresh_tokens):
+    # Given
+    pair = await memory_refresh_tokens.issue(user_id=1)
+
+    # When, Then
+    with pytest.raises(DecodeTokenException):
+        await jwt_service.verify_token(token=pair.refresh_token)
+
+
 @pytest.mark.asyncio
 async def test_create_refresh_token_invalid_refresh_token():
     # Given
@@ -24,13 +36,57 @@ async def test_create_refresh_token_invalid_refresh_token():
 
 
 @pytest.mark.asyncio
-async def test_create_refresh_token():
+async def test_create_refresh_token_without_jti():
     # Given
     token = USER_ID_1_TOKEN
 
+    # When, Then
+    with pytest.raises(DecodeTokenException):
+        await jwt_service.create_refresh_token(token=token, refresh_token=token)
+
+
+@pytest.mark.asyncio
+async def test_create_refresh_token(memory_refresh_tokens):
+    # Given
+    pair = await memory_refresh_tokens.issue(user_id=1)
+
     # When
-    sut = await jwt_service.create_refresh_token(token=token, refresh_token=token)
+    sut = await jwt_service.create_refresh_token(
+        token=pair.token,
+        refresh_token=pair.refresh_token,
+    )
 
     # Then
     assert sut.token
-    assert sut.refresh_token
+    assert sut.refresh_token != pair.refresh_token
+
+
+@pytest.mark.asyncio
+async def test_create_refresh_token_reused(memory_refresh_tokens):
+    # Given
+    pair = await memory_refresh_tokens.issue(user_id=1)
+    await jwt_service.create_refresh_token(
+        token=pair.token,
+        refresh_token=pair.refresh_token,
+    )
+
+    # When, Then
+    with pytest.raises(DecodeTokenException):
+        await jwt_service.create_refresh_token(
+            token=pair.token,
+            refresh_token=pair.refresh_token,
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_refresh_token_other_session(memory_refresh_tokens):
+    # Given
+    pair = await memory_refresh_tokens.issue(user_id=1)
+    other_pair = await memory_refresh_tokens.issue(user_id=2)
+
+    # When, Then
+    with pytest.raises(DecodeTokenException):
+        await jwt_service.create_refresh_token(
+            token=other_pair.token,
+            refresh_token=pair.refresh_token,
+        )
@@ -9,10 +9,10 @@ from app.user.application.exception import (
     DuplicateEmailOrNicknameException,
     UserNotFoundException,
 )
-from tests.support.token import USER_ID_1_TOKEN
+from tests.support.token import USER_ID_1_ACCESS_TOKEN, USER_ID_1_TOKEN
 from tests.support.user_fixture import make_user
 
-HEADERS = {"Authorization": f"Bearer {USER_ID_1_TOKEN}"}
+HEADERS = {"Authorization": f"Bearer {USER_ID_1_ACCESS_TOKEN}"}
 BASE_URL = "http://test"
 
 
@@ -41,6 +41,19 @@ async def test_get_users(session: AsyncSession):
     assert sut[0] == {"id": 1, "email": "a@b.c", "nickname": "hide"}
 
 
+@pytest.mark.asyncio
+async def test_get_users_with_refresh_token():
+    # Given
+    headers = {"Authorization": f"Bearer {USER_ID_1_TOKEN}"}
+
+    # When
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/v1/user", headers=headers)
+
+    # Then
+    assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_create_user_password_does_not_match(session: AsyncSession):
     # Given
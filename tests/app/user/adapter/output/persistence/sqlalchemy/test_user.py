@@ -2,7 +2,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.user.adapter.output.persistence.sqlalchemy.user import UserSQLAlchemyRepo
-from app.user.domain.entity.user import User
+from app.user.domain.entity.user import User, UserRead
 from tests.support.user_fixture import make_user
 
 user_repo = UserSQLAlchemyRepo()
@@ -35,7 +35,8 @@ async def test_get_users(session: AsyncSession):
 
     # Then
     assert len(sut) == 2
-    saved_user_1 = sut[0]
+    # Newest first
+    saved_user_1 = sut[1]
     assert saved_user_1.password == user_1.password
     assert saved_user_1.email == user_1.email
     assert saved_user_1.nickname == user_1.nickname
@@ -43,7 +44,7 @@ async def test_get_users(session: AsyncSession):
     assert saved_user_1.location.lat == user_1.location.lat
     assert saved_user_1.location.lng == user_1.location.lng
 
-    saved_user_2 = sut[1]
+    saved_user_2 = sut[0]
     assert saved_user_2.password == user_2.password
     assert saved_user_2.email == user_2.email
     assert saved_user_2.nickname == user_2.nickname
@@ -52,6 +53,21 @@ async def test_get_users(session: AsyncSession):
     assert saved_user_2.location.lng == user_2.location.lng
 
 
+@pytest.mark.asyncio
+async def test_get_user_reads(session: AsyncSession):
+    # Given
+    user_1 = make_user(email="a@b.c", nickname="hide")
+    user_2 = make_user(email="b@b.c", nickname="test")
+    session.add_all([user_1, user_2])
+    await session.commit()
+
+    # When
+    sut = await user_repo.get_user_reads(limit=1)
+
+    # Then
+    assert sut == [UserRead(id=user_2.id, email="b@b.c", nickname="test")]
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email_or_nickname(session: AsyncSession):
     # Given
@@ -90,6 +106,21 @@ async def test_get_user_by_id(session: AsyncSession):
     assert sut is None
 
 
+@pytest.mark.asyncio
+async def test_get_users_by_ids(session: AsyncSession):
+    # Given
+    user_1 = make_user(email="a@b.c", nickname="hide")
+    user_2 = make_user(email="b@b.c", nickname="test")
+    session.add_all([user_1, user_2])
+    await session.commit()
+
+    # When
+    sut = await user_repo.get_users_by_ids(user_ids=[user_1.id, user_2.id, 0])
+
+    # Then
+    assert sorted(user.id for user in sut) == sorted([user_1.id, user_2.id])
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email_and_password(session: AsyncSession):
     # Given
@@ -132,3 +163,34 @@ async def test_save(session: AsyncSession):
 
     # When, Then
     await user_repo.save(user=user)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_admin", [True, False])
+async def test_is_admin(session: AsyncSession, is_admin: bool):
+    # Given
+    user = make_user(
+        password="password",
+        email="b@c.d",
+        nickname="hide",
+        is_admin=is_admin,
+        lat=37.123,
+        lng=127.123,
+    )
+    session.add(user)
+    await session.commit()
+
+    # When
+    sut = await user_repo.is_admin(user_id=user.id)
+
+    # Then
+    assert sut is is_admin
+
+
+@pytest.mark.asyncio
+async def test_is_admin_user_not_exist(session: AsyncSession):
+    # Given, When
+    sut = await user_repo.is_admin(user_id=1)
+
+    # Then
+    assert sut is False
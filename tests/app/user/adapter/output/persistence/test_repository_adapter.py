@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.user.adapter.output.persistence.repository_adapter import UserRepositoryAdapter
+from app.user.domain.entity.user import UserRead
 from app.user.domain.repository.user import UserRepo
 from tests.support.user_fixture import make_user
 
@@ -25,7 +27,7 @@ async def test_get_users(session: AsyncSession):
         lat=37.123,
         lng=127.123,
     )
-    user_repo_mock.get_users.return_value = [user]
+    user_repo_mock.get_user_reads.return_value = [UserRead.model_validate(user)]
     repository_adapter.user_repo = user_repo_mock
 
     # When
@@ -37,7 +39,7 @@ async def test_get_users(session: AsyncSession):
     assert result.id == user.id
     assert result.email == user.email
     assert result.nickname == user.nickname
-    repository_adapter.user_repo.get_users.assert_awaited_once_with(
+    repository_adapter.user_repo.get_user_reads.assert_awaited_once_with(
         limit=limit, prev=prev
     )
 
@@ -90,7 +92,7 @@ async def test_get_user_by_id(session: AsyncSession):
         lat=37.123,
         lng=127.123,
     )
-    user_repo_mock.get_user_by_id.return_value = user
+    user_repo_mock.get_users_by_ids.return_value = [user]
     repository_adapter.user_repo = user_repo_mock
 
     # When
@@ -105,11 +107,49 @@ async def test_get_user_by_id(session: AsyncSession):
     assert sut.is_admin == user.is_admin
     assert sut.location.lat == user.location.lat
     assert sut.location.lng == user.location.lng
-    repository_adapter.user_repo.get_user_by_id.assert_awaited_once_with(
-        user_id=user.id
+    repository_adapter.user_repo.get_users_by_ids.assert_awaited_once_with(
+        user_ids=[user.id]
     )
 
 
+@pytest.mark.asyncio
+async def test_get_user_by_id_batches_lookups():
+    # Given
+    user_1 = make_user(id=1, email="a@b.c", nickname="hide")
+    user_2 = make_user(id=2, email="b@b.c", nickname="test")
+    user_repo = AsyncMock(spec=UserRepo)
+    user_repo.get_users_by_ids.return_value = [user_1, user_2]
+    adapter = UserRepositoryAdapter(user_repo=user_repo)
+
+    # When
+    sut = await asyncio.gather(
+        adapter.get_user_by_id(user_id=1),
+        adapter.get_user_by_id(user_id=2),
+        adapter.get_user_by_id(user_id=1),
+        adapter.get_user_by_id(user_id=3),
+    )
+
+    # Then
+    assert sut == [user_1, user_2, user_1, None]
+    user_repo.get_users_by_ids.assert_awaited_once_with(user_ids=[1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids():
+    # Given
+    user = make_user(id=1)
+    user_repo = AsyncMock(spec=UserRepo)
+    user_repo.get_users_by_ids.return_value = [user]
+    adapter = UserRepositoryAdapter(user_repo=user_repo)
+
+    # When
+    sut = await adapter.get_users_by_ids(user_ids=[1])
+
+    # Then
+    assert sut == [user]
+    user_repo.get_users_by_ids.assert_awaited_once_with(user_ids=[1])
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email_and_password(session: AsyncSession):
     # Given
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -17,6 +17,8 @@ from tests.support.user_fixture import make_user
 repository_mock = AsyncMock(spec=UserRepositoryAdapter)
 user_service = UserService(repository=repository_mock)
 
+pytestmark = pytest.mark.usefixtures("memory_cache", "memory_refresh_tokens")
+
 
 @pytest.mark.asyncio
 async def test_get_user_list():
@@ -105,9 +107,9 @@ async def test_create_user():
 
 
 @pytest.mark.asyncio
-async def test_is_admin_user_not_exist():
+async def test_is_admin_user_is_not_admin():
     # Given
-    repository_mock.get_user_by_id.return_value = None
+    repository_mock.is_admin.return_value = False
     user_service.repository = repository_mock
 
     # When
@@ -118,47 +120,49 @@ async def test_is_admin_user_not_exist():
 
 
 @pytest.mark.asyncio
-async def test_is_admin_user_is_not_admin():
+async def test_is_admin():
     # Given
-    user = make_user(
-        id=1,
-        password="password",
-        email="h@id.e",
-        nickname="hide",
-        is_admin=False,
-        lat=37.123,
-        lng=127.123,
-    )
-    repository_mock.get_user_by_id.return_value = user
+    repository_mock.is_admin.return_value = True
     user_service.repository = repository_mock
 
     # When
-    sut = await user_service.is_admin(user_id=user.id)
+    sut = await user_service.is_admin(user_id=1)
 
     # Then
-    assert sut is False
+    assert sut is True
 
 
 @pytest.mark.asyncio
-async def test_is_admin():
+async def test_is_admin_cached():
     # Given
-    user = make_user(
-        id=1,
-        password="password",
-        email="h@id.e",
-        nickname="hide",
-        is_admin=True,
-        lat=37.123,
-        lng=127.123,
-    )
-    repository_mock.get_user_by_id.return_value = user
+    repository_mock.is_admin.reset_mock()
+    repository_mock.is_admin.return_value = True
     user_service.repository = repository_mock
+    await user_service.is_admin(user_id=1)
 
     # When
-    sut = await user_service.is_admin(user_id=user.id)
+    sut = await user_service.is_admin(user_id=1)
 
     # Then
     assert sut is True
+    repository_mock.is_admin.assert_awaited_once_with(user_id=1)
+
+
+@pytest.mark.asyncio
+async def test_change_admin_invalidates_cache():
+    # Given
+    repository_mock.is_admin.return_value = True
+    user_service.repository = repository_mock
+    await user_service.is_admin(user_id=1)
+    repository_mock.is_admin.return_value = False
+
+    # When
+    with patch.object(UserService, "_update_admin", AsyncMock()):
+        await user_service.change_admin(user_id=1, is_admin=False)
+    sut = await user_service.is_admin(user_id=1)
+
+    # Then
+    assert sut is False
 
 
 @pytest.mark.asyncio
@@ -186,12 +190,15 @@ async def test_login():
     )
     repository_mock.get_user_by_email_and_password.return_value = user
     user_service.repository = repository_mock
-    token = TokenHelper.encode(payload={"user_id": user.id})
-    refresh_token = TokenHelper.encode(payload={"sub": "refresh"})
 
     # When
     sut = await user_service.login(email="email", password="password")
 
     # Then
-    assert sut.token == token
-    assert sut.refresh_token == refresh_token
+    token = TokenHelper.decode(token=sut.token)
+    refresh_token = TokenHelper.decode(token=sut.refresh_token)
+    assert token["user_id"] == user.id
+    assert refresh_token["sub"] == "refresh"
+    assert refresh_token["user_id"] == user.id
+    assert refresh_token["jti"]
+    assert refresh_token["sid"] == token["sid"]
@@ -9,6 +9,8 @@ from core.db.session import (
     reset_session_context,
     session as db_session,
 )
+from core.helpers.cache import Cache, CustomKeyMaker, MemoryBackend
+from core.helpers.refresh_token import MemoryRefreshTokenStore, refresh_tokens
 from tests.support.test_db_coordinator import TestDbCoordinator
 
 test_db_coordinator = TestDbCoordinator()
@@ -29,6 +31,22 @@ def event_loop(request):
     loop.close()
 
 
+@pytest.fixture
+def memory_cache():
+    state = (Cache.backend, Cache.key_maker, Cache.lock_client, Cache.metrics)
+    Cache.init(backend=MemoryBackend(), key_maker=CustomKeyMaker())
+    yield Cache
+    Cache.backend, Cache.key_maker, Cache.lock_client, Cache.metrics = state
+
+
+@pytest.fixture
+def memory_refresh_tokens():
+    store = refresh_tokens.store
+    refresh_tokens.store = MemoryRefreshTokenStore()
+    yield refresh_tokens
+    refresh_tokens.store = store
+
+
 @pytest_asyncio.fixture
 async def session():
     test_db_coordinator.apply_alembic()
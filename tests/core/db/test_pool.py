@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from core.db.pool import InstrumentedQueuePool
+from core.helpers.metrics import PrometheusMetricsSink
+
+
+def make_pool(*, pool_size: int = 2, max_overflow: int = 0) -> InstrumentedQueuePool:
+    pool = InstrumentedQueuePool(
+        creator=MagicMock,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        timeout=0,
+        logging_name="writer",
+    )
+    pool.metrics = PrometheusMetricsSink()
+    return pool
+
+
+def test_checkout_gauges():
+    # Given
+    pool = make_pool()
+
+    # When
+    connection = pool.connect()
+
+    # Then
+    gauges = pool.metrics.gauges
+    assert gauges["db_pool_checked_out"][(("engine", "writer"),)] == 1
+    assert gauges["db_pool_size"][(("engine", "writer"),)] == 2
+    assert gauges["db_pool_overflow"][(("engine", "writer"),)] == 0
+    histogram = pool.metrics.histograms["db_pool_checkout_seconds"]
+    assert histogram[(("engine", "writer"),)].count == 1
+    connection.close()
+
+
+def test_return_updates_gauges():
+    # Given
+    pool = make_pool()
+    connection = pool.connect()
+
+    # When
+    connection.close()
+
+    # Then
+    assert pool.metrics.gauges["db_pool_checked_out"][(("engine", "writer"),)] == 0
+
+
+def test_overflow_gauge():
+    # Given
+    pool = make_pool(pool_size=1, max_overflow=1)
+    first = pool.connect()
+
+    # When
+    second = pool.connect()
+
+    # Then
+    assert pool.metrics.gauges["db_pool_overflow"][(("engine", "writer"),)] == 1
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_checkout_timeout():
+    # Given
+    pool = make_pool(pool_size=1)
+    connection = pool.connect()
+
+    # When
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    # Then
+    counters = pool.metrics.counters
+    assert counters["db_pool_timeouts_total"][(("engine", "writer"),)] == 1
+    connection.close()
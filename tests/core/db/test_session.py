@@ -0,0 +1,136 @@
+import asyncio
+from contextvars import Context
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.util import greenlet_spawn
+
+from app.user.domain.entity.user import User
+from core.db.session import (
+    EngineType,
+    RoutingSession,
+    engines,
+    read_session_scope,
+    reader_pool,
+    reset_engine_type,
+    reset_session_context,
+    reset_sticky_user,
+    session,
+    set_engine_type,
+    set_session_context,
+    set_sticky_user,
+)
+from core.db.write_marker import write_marker
+
+
+def test_get_bind_reader_is_pinned_per_session():
+    # Given
+    routing_session = RoutingSession()
+
+    # When
+    first = routing_session.get_bind(clause=select(User))
+    second = routing_session.get_bind(clause=select(User))
+
+    # Then
+    assert first is second
+    assert first in [replica.engine.sync_engine for replica in reader_pool.replicas]
+
+
+def test_get_bind_writer_for_insert():
+    # Given
+    routing_session = RoutingSession()
+
+    # When
+    sut = routing_session.get_bind(clause=insert(User))
+
+    # Then
+    assert sut is engines[EngineType.WRITER].sync_engine
+
+
+def test_get_bind_reads_from_writer_after_write():
+    # Given
+    routing_session = RoutingSession()
+    routing_session.get_bind(clause=insert(User))
+
+    # When
+    sut = routing_session.get_bind(clause=select(User))
+
+    # Then
+    assert sut is engines[EngineType.WRITER].sync_engine
+
+
+def test_get_bind_reader_pin_reads_from_writer_after_write():
+    # Given
+    routing_session = RoutingSession()
+    routing_session.get_bind(clause=insert(User))
+    context = set_engine_type(EngineType.READER)
+
+    # When
+    sut = routing_session.get_bind(clause=select(User))
+
+    # Then
+    reset_engine_type(context=context)
+    assert sut is engines[EngineType.WRITER].sync_engine
+
+
+@pytest.mark.asyncio
+async def test_get_bind_sticky_user_reads_from_writer():
+    # Given
+    routing_session = RoutingSession()
+    context = set_sticky_user(1)
+    is_marked = AsyncMock(return_value=True)
+
+    # When
+    with patch.object(write_marker, "is_marked", is_marked):
+        first = await greenlet_spawn(routing_session.get_bind, clause=select(User))
+        second = await greenlet_spawn(routing_session.get_bind, clause=select(User))
+
+    # Then
+    reset_sticky_user(context=context)
+    assert first is second is engines[EngineType.WRITER].sync_engine
+    is_marked.assert_awaited_once_with(user_id=1)
+
+
+def test_get_bind_without_sticky_user_skips_marker():
+    # Given
+    routing_session = RoutingSession()
+    is_marked = AsyncMock()
+
+    # When
+    with patch.object(write_marker, "is_marked", is_marked):
+        sut = routing_session.get_bind(clause=select(User))
+
+    # Then
+    assert sut is not engines[EngineType.WRITER].sync_engine
+    is_marked.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_session_scope_outside_request():
+    # Given
+    async def read():
+        async with read_session_scope() as first, read_session_scope() as second:
+            return first, second
+
+    # When
+    first, second = await asyncio.create_task(read(), context=Context())
+
+    # Then
+    assert first is not second
+    assert first.sync_session.autoflush is False
+
+
+@pytest.mark.asyncio
+async def test_read_session_scope_reuses_request_session():
+    # Given
+    context = set_session_context(session_id="request")
+
+    # When
+    async with read_session_scope() as first, read_session_scope() as second:
+        sut = first is second and first is session()
+
+    # Then
+    await session.remove()
+    reset_session_context(context=context)
+    assert sut is True
@@ -0,0 +1,215 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from core.db import transactional
+from core.db.session import EngineType, engine_type_context
+from core.db.transactional import (
+    Propagation,
+    ReadOnlyTransactionError,
+    Transactional,
+)
+
+
+def make_session_mock() -> MagicMock:
+    session_mock = MagicMock()
+    session_mock.commit = AsyncMock()
+    session_mock.rollback = AsyncMock()
+    session_mock.connection = AsyncMock()
+    return session_mock
+
+
+def deadlock() -> OperationalError:
+    return OperationalError("UPDATE", {}, Exception(1213, "Deadlock found"))
+
+
+@pytest.mark.asyncio
+async def test_commit():
+    # Given
+    session_mock = make_session_mock()
+
+    @Transactional()
+    async def func():
+        return engine_type_context.get()
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        sut = await func()
+
+    # Then
+    assert sut == EngineType.WRITER
+    session_mock.commit.assert_awaited_once()
+    assert engine_type_context.get() is None
+
+
+@pytest.mark.asyncio
+async def test_rollback():
+    # Given
+    session_mock = make_session_mock()
+
+    @Transactional()
+    async def func():
+        raise ValueError
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        with pytest.raises(ValueError):
+            await func()
+
+    # Then
+    session_mock.rollback.assert_awaited_once()
+    session_mock.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_only():
+    # Given
+    session_mock = make_session_mock()
+
+    @Transactional(read_only=True)
+    async def func():
+        return engine_type_context.get()
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        sut = await func()
+
+    # Then
+    assert sut == EngineType.READER
+    session_mock.commit.assert_not_awaited()
+    session_mock.no_autoflush.__enter__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_isolation():
+    # Given
+    session_mock = make_session_mock()
+
+    @Transactional(isolation="SERIALIZABLE")
+    async def func():
+        pass
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        await func()
+
+    # Then
+    session_mock.connection.assert_awaited_once_with(
+        execution_options={"isolation_level": "SERIALIZABLE"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_required_joins_outer_transaction():
+    # Given
+    session_mock = make_session_mock()
+
+    @Transactional()
+    async def inner():
+        pass
+
+    @Transactional()
+    async def outer():
+        await inner()
+        await inner()
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        await outer()
+
+    # Then
+    session_mock.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_writable_join_inside_read_only_raises():
+    # Given
+    session_mock = make_session_mock()
+    calls = []
+
+    @Transactional()
+    async def inner():
+        calls.append("inner")
+
+    @Transactional(read_only=True)
+    async def outer():
+        await inner()
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        with pytest.raises(ReadOnlyTransactionError):
+            await outer()
+
+    # Then
+    assert calls == []
+    session_mock.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_nested_uses_savepoint():
+    # Given
+    session_mock = make_session_mock()
+
+    @Transactional(propagation=Propagation.NESTED)
+    async def inner():
+        pass
+
+    @Transactional()
+    async def outer():
+        await inner()
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        await outer()
+
+    # Then
+    session_mock.begin_nested.assert_called_once()
+    session_mock.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_retry_on_deadlock():
+    # Given
+    session_mock = make_session_mock()
+    func = AsyncMock(side_effect=[deadlock(), "done"])
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        sut = await Transactional(retries=2, retry_backoff=0)(func)()
+
+    # Then
+    assert sut == "done"
+    assert func.await_count == 2
+    session_mock.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_retry_exhausted():
+    # Given
+    session_mock = make_session_mock()
+    func = AsyncMock(side_effect=deadlock())
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        with pytest.raises(OperationalError):
+            await Transactional(retries=1, retry_backoff=0)(func)()
+
+    # Then
+    assert func.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_no_retry_for_other_errors():
+    # Given
+    session_mock = make_session_mock()
+    error = OperationalError("SELECT", {}, Exception(2013, "Lost connection"))
+    func = AsyncMock(side_effect=error)
+
+    # When
+    with patch.object(transactional, "session", session_mock):
+        with pytest.raises(OperationalError):
+            await Transactional(retries=3, retry_backoff=0)(func)()
+
+    # Then
+    assert func.await_count == 1
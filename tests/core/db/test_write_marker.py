@@ -0,0 +1,63 @@
+import pytest
+from redis.exceptions import ConnectionError
+
+from core.db.write_marker import WriteMarker
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from tests.support.fake_redis import FakeRedis
+
+
+@pytest.mark.asyncio
+async def test_mark():
+    # Given
+    client = FakeRedis()
+    marker = WriteMarker(client=client, ttl=5)
+
+    # When
+    await marker.mark(user_id=1)
+
+    # Then
+    assert await marker.is_marked(user_id=1) is True
+    assert await marker.is_marked(user_id=2) is False
+    assert client.ttls["db:wrote:1"] == 5
+
+
+@pytest.mark.asyncio
+async def test_disabled():
+    # Given
+    client = FakeRedis()
+    marker = WriteMarker(client=client, ttl=0)
+
+    # When
+    await marker.mark(user_id=1)
+
+    # Then
+    assert await marker.is_marked(user_id=1) is False
+    assert client.data == {}
+
+
+class FailingRedis(FakeRedis):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def get(self, name: str):
+        self.calls += 1
+        raise ConnectionError
+
+
+@pytest.mark.asyncio
+async def test_is_marked_unavailable():
+    # Given
+    client = FailingRedis()
+    marker = WriteMarker(
+        client=client,
+        ttl=5,
+        breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+    )
+
+    # When
+    sut = [await marker.is_marked(user_id=1) for _ in range(4)]
+
+    # Then
+    assert sut == [False] * 4
+    assert client.calls == 2
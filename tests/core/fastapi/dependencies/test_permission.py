@@ -1,16 +1,21 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from fastapi import Request
 
 from app.container import Container
+from core.exceptions import CustomException
 from core.fastapi.dependencies import (
     AllowAll,
     IsAdmin,
     IsAuthenticated,
     PermissionDependency,
 )
-from core.fastapi.dependencies.permission import UnauthorizedException
+from core.fastapi.dependencies.permission import (
+    BasePermission,
+    UnauthorizedException,
+)
 
 container = Container()
 
@@ -69,3 +74,79 @@ async def test_permission_dependency_allow_all():
 
     # Then
     assert sut is None
+
+
+@pytest.mark.asyncio
+async def test_permission_dependency_or_runs_sync_check_first():
+    # Given
+    dependency = PermissionDependency(permissions=[IsAdmin | AllowAll])
+    request = AsyncMock(spec=Request)
+    request.user = Mock(id=1)
+    user_service_mock = AsyncMock()
+
+    # When
+    with container.user_service.override(user_service_mock):
+        sut = await dependency(request=request)
+
+    # Then
+    assert sut is None
+    user_service_mock.is_admin.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_permission_dependency_and_runs_sync_check_first():
+    # Given
+    dependency = PermissionDependency(permissions=[IsAdmin & IsAuthenticated])
+    request = AsyncMock(spec=Request)
+    request.user = Mock(id=None)
+    user_service_mock = AsyncMock()
+
+    # When, Then
+    with container.user_service.override(user_service_mock):
+        with pytest.raises(UnauthorizedException):
+            await dependency(request=request)
+    user_service_mock.is_admin.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_permission_dependency_or_denied():
+    # Given
+    dependency = PermissionDependency(permissions=[IsAuthenticated | IsAdmin])
+    request = AsyncMock(spec=Request)
+    request.user = Mock(id=None)
+
+    # When, Then
+    with pytest.raises(UnauthorizedException):
+        await dependency(request=request)
+
+
+@pytest.mark.asyncio
+async def test_permission_dependency_cancels_on_first_denial():
+    # Given
+    cancelled = asyncio.Event()
+
+    class Denied(CustomException):
+        pass
+
+    class Slow(BasePermission):
+        async def has_permission(self, request: Request) -> bool:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return True
+
+    class Deny(BasePermission):
+        exception = Denied
+
+        async def has_permission(self, request: Request) -> bool:
+            return False
+
+    dependency = PermissionDependency(permissions=[Slow, Deny])
+    request = AsyncMock(spec=Request)
+
+    # When, Then
+    with pytest.raises(Denied):
+        await dependency(request=request)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -1,3 +1,4 @@
+import time
 from http.client import HTTPConnection
 from unittest.mock import Mock, patch
 
@@ -5,11 +6,20 @@ import pytest
 from jwt.exceptions import PyJWTError
 
 from core.fastapi.middlewares import authentication
-from core.fastapi.middlewares.authentication import AuthBackend, CurrentUser
+from core.fastapi.middlewares.authentication import (
+    AuthBackend,
+    CurrentUser,
+    VerifiedTokenCache,
+)
 
 auth_backend = AuthBackend()
 
 
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth_backend.cache.clear()
+
+
 @pytest.mark.asyncio
 @patch.object(authentication, "jwt")
 async def test_auth_backend_empty_header(jwt_mock):
@@ -96,6 +106,7 @@ async def test_auth_backend(jwt_mock):
     # Given
     conn_mock = Mock(spec=HTTPConnection)
     conn_mock.headers = {"Authorization": "bearer credentials"}
+    jwt_mock.get_unverified_header.return_value = {}
     jwt_mock.decode.return_value = {"user_id": 1}
 
     # When
@@ -104,3 +115,104 @@ async def test_auth_backend(jwt_mock):
     # Then
     assert authenticated is True
     assert user == CurrentUser(id=1)
+
+
+@pytest.mark.asyncio
+@patch.object(authentication, "jwt")
+async def test_auth_backend_caches_verified_token(jwt_mock):
+    # Given
+    conn_mock = Mock(spec=HTTPConnection)
+    conn_mock.headers = {"Authorization": "bearer credentials"}
+    jwt_mock.get_unverified_header.return_value = {}
+    jwt_mock.decode.return_value = {"user_id": 1, "exp": time.time() + 60}
+    await auth_backend.authenticate(conn=conn_mock)
+
+    # When
+    authenticated, user = await auth_backend.authenticate(conn=conn_mock)
+
+    # Then
+    assert authenticated is True
+    assert user == CurrentUser(id=1)
+    jwt_mock.decode.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch.object(authentication, "jwt")
+async def test_auth_backend_does_not_cache_invalid_token(jwt_mock):
+    # Given
+    conn_mock = Mock(spec=HTTPConnection)
+    conn_mock.headers = {"Authorization": "bearer credentials"}
+    jwt_mock.get_unverified_header.return_value = {}
+    jwt_mock.exceptions.PyJWTError = PyJWTError
+    jwt_mock.decode.side_effect = PyJWTError
+    await auth_backend.authenticate(conn=conn_mock)
+
+    # When
+    authenticated, _ = await auth_backend.authenticate(conn=conn_mock)
+
+    # Then
+    assert authenticated is False
+    assert jwt_mock.decode.call_count == 2
+
+
+def test_verified_token_cache_honors_exp():
+    # Given
+    cache = VerifiedTokenCache(max_entries=10, ttl=60)
+
+    # When
+    cache.set("token", {"user_id": 1, "exp": time.time() - 1})
+
+    # Then
+    assert cache.get("token") is None
+
+
+def test_verified_token_cache_evicts_least_recently_used():
+    # Given
+    cache = VerifiedTokenCache(max_entries=2, ttl=60)
+    cache.set("a", {"user_id": 1})
+    cache.set("b", {"user_id": 2})
+    cache.get("a")
+
+    # When
+    cache.set("c", {"user_id": 3})
+
+    # Then
+    assert cache.get("a") == {"user_id": 1}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"user_id": 3}
+
+
+@pytest.mark.asyncio
+@patch.object(authentication, "jwt")
+async def test_auth_backend_revoked_session(jwt_mock, memory_refresh_tokens):
+    # Given
+    conn_mock = Mock(spec=HTTPConnection)
+    conn_mock.headers = {"Authorization": "bearer credentials"}
+    jwt_mock.get_unverified_header.return_value = {}
+    jwt_mock.decode.return_value = {"user_id": 1, "sid": "session"}
+    await auth_backend.authenticate(conn=conn_mock)
+
+    # When
+    await memory_refresh_tokens.revoke(session_id="session")
+    authenticated, user = await auth_backend.authenticate(conn=conn_mock)
+
+    # Then
+    assert authenticated is False
+    assert user.id is None
+
+
+@pytest.mark.asyncio
+@patch.object(authentication, "jwt")
+async def test_auth_backend_refresh_token(jwt_mock):
+    # Given
+    conn_mock = Mock(spec=HTTPConnection)
+    conn_mock.headers = {"Authorization": "bearer credentials"}
+    jwt_mock.get_unverified_header.return_value = {}
+    jwt_mock.decode.return_value = {"sub": "refresh", "user_id": 42, "sid": "s"}
+
+    # When
+    authenticated, user = await auth_backend.authenticate(conn=conn_mock)
+
+    # Then
+    assert authenticated is False
+    assert user.id is None
@@ -1,10 +1,12 @@
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from sqlalchemy.ext.asyncio import async_scoped_session
 
+from core.db.session import get_session_context, sticky_user_context
 from core.fastapi.middlewares import SQLAlchemyMiddleware
+from core.fastapi.middlewares.authentication import CurrentUser
 from core.fastapi.middlewares import sqlalchemy
 from starlette.types import Receive, Scope, Send
 
@@ -35,8 +37,9 @@ async def exception_app(scope: Scope, receive: Receive, send: Send) -> None:
 
 
 @pytest.mark.asyncio
+@patch.object(sqlalchemy, "has_session", return_value=True)
 @patch.object(sqlalchemy, "session", spec=async_scoped_session)
-async def test_sqlalchemy_middleware(session_mock):
+async def test_sqlalchemy_middleware(session_mock, has_session_mock):
     # Given
     test_app = SQLAlchemyMiddleware(app=app)
 
@@ -48,8 +51,9 @@ async def test_sqlalchemy_middleware(session_mock):
 
 
 @pytest.mark.asyncio
+@patch.object(sqlalchemy, "has_session", return_value=True)
 @patch.object(sqlalchemy, "session", spec=async_scoped_session)
-async def test_sqlalchemy_middleware_exception(session_mock):
+async def test_sqlalchemy_middleware_exception(session_mock, has_session_mock):
     # Given
     test_app = SQLAlchemyMiddleware(app=exception_app)
 
@@ -59,3 +63,70 @@ async def test_sqlalchemy_middleware_exception(session_mock):
             response = await client.get("/")
             assert response.status_code == 200
             assert session_mock.remove.called
+
+
+@pytest.mark.asyncio
+@patch.object(sqlalchemy, "session", spec=async_scoped_session)
+async def test_sqlalchemy_middleware_without_session(session_mock):
+    # Given
+    test_app = SQLAlchemyMiddleware(app=app)
+
+    # When
+    async with AsyncClient(app=test_app, base_url="http://127.0.0.1") as client:
+        response = await client.get("/")
+
+    # Then
+    assert response.status_code == 200
+    assert not session_mock.remove.called
+
+
+@pytest.mark.asyncio
+@patch.object(sqlalchemy, "session", spec=async_scoped_session)
+async def test_sqlalchemy_middleware_skips_non_http_scope(session_mock):
+    # Given
+    session_ids = []
+    outer_session_id = get_session_context()
+
+    async def lifespan_app(scope: Scope, receive: Receive, send: Send) -> None:
+        session_ids.append(get_session_context())
+
+    test_app = SQLAlchemyMiddleware(app=lifespan_app)
+
+    # When
+    await test_app({"type": "lifespan"}, AsyncMock(), AsyncMock())
+
+    # Then
+    assert session_ids == [outer_session_id]
+    assert not session_mock.remove.called
+
+
+@pytest.mark.asyncio
+@patch.object(sqlalchemy, "write_marker")
+@patch.object(sqlalchemy, "session_has_written", return_value=True)
+@patch.object(sqlalchemy, "has_session", return_value=True)
+@patch.object(sqlalchemy, "session", spec=async_scoped_session)
+async def test_sqlalchemy_middleware_marks_user_after_write(
+    session_mock, has_session_mock, session_has_written_mock, write_marker_mock
+):
+    # Given
+    sticky_users = []
+
+    async def read_app(scope: Scope, receive: Receive, send: Send) -> None:
+        sticky_users.append(sticky_user_context.get())
+        await app(scope, receive, send)
+
+    async def user_app(scope: Scope, receive: Receive, send: Send) -> None:
+        scope["user"] = CurrentUser(id=1)
+        await SQLAlchemyMiddleware(app=read_app)(scope, receive, send)
+
+    write_marker_mock.mark = AsyncMock()
+
+    # When
+    async with AsyncClient(app=user_app, base_url="http://127.0.0.1") as client:
+        response = await client.get("/")
+
+    # Then
+    assert response.status_code == 200
+    assert sticky_users == [1]
+    write_marker_mock.mark.assert_awaited_once_with(user_id=1)
+    assert sticky_user_context.get() is None
@@ -0,0 +1,396 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.helpers.cache import cache_manager
+from core.helpers.cache.cache_manager import CacheManager
+from core.helpers.cache.cache_tag import CacheTag
+from core.helpers.cache.custom_key_maker import CustomKeyMaker
+from core.helpers.cache.memory_backend import MemoryBackend
+from core.helpers.metrics import PrometheusMetricsSink
+from tests.support.fake_redis import FakeRedis
+
+
+def make_cache(**kwargs) -> CacheManager:
+    cache = CacheManager()
+    cache.init(backend=MemoryBackend(), key_maker=CustomKeyMaker(), **kwargs)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cached():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide")
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    # When
+    await get_user(user_id=1)
+    sut = await get_user(user_id=1)
+
+    # Then
+    assert sut == {"id": 1}
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_cached_single_flight():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide")
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        await asyncio.sleep(0.01)
+        return {"id": user_id}
+
+    # When
+    sut = await asyncio.gather(*[get_user(user_id=1) for _ in range(10)])
+
+    # Then
+    assert sut == [{"id": 1}] * 10
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_cached_single_flight_exception():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide")
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    # When
+    sut = await asyncio.gather(
+        *[get_user(user_id=1) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    # Then
+    assert all(isinstance(result, ValueError) for result in sut)
+    assert calls == [1]
+    assert not cache.single_flight._calls
+
+
+@pytest.mark.asyncio
+async def test_cached_without_single_flight():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide", single_flight=False)
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        await asyncio.sleep(0.01)
+        return {"id": user_id}
+
+    # When
+    await asyncio.gather(*[get_user(user_id=1) for _ in range(3)])
+
+    # Then
+    assert calls == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cached_lock():
+    # Given
+    client = FakeRedis()
+    workers = [make_cache(lock_client=client) for _ in range(3)]
+    shared_backend = workers[0].backend
+    for worker in workers:
+        worker.backend = shared_backend
+    calls = []
+
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        await asyncio.sleep(0.01)
+        return {"id": user_id}
+
+    functions = [
+        worker.cached(prefix="hide", lock=True)(get_user) for worker in workers
+    ]
+
+    # When
+    sut = await asyncio.gather(*[function(user_id=1) for function in functions])
+
+    # Then
+    assert sut == [{"id": 1}] * 3
+    assert calls == [1]
+    assert not client.locks
+
+
+@pytest.mark.asyncio
+async def test_cached_early_refresh():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide", ttl=60, early_refresh_beta=1.0)
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    await get_user(user_id=1)
+
+    # When
+    fresh = await get_user(user_id=1)
+    with patch.object(cache_manager.time, "time", return_value=10**10):
+        refreshed = await get_user(user_id=1)
+
+    # Then
+    assert fresh == {"id": 1}
+    assert refreshed == {"id": 1}
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cached_early_refresh_legacy_entry():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide", ttl=60)
+    async def get_user_list(*, limit: int):
+        calls.append(limit)
+        return [limit]
+
+    await get_user_list(limit=1)
+    refreshing = cache.cached(prefix="hide", ttl=60, early_refresh_beta=1.0)(
+        get_user_list.__wrapped__
+    )
+
+    # When
+    first = await refreshing(limit=1)
+    second = await refreshing(limit=1)
+
+    # Then
+    assert first == second == [1]
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_remove_by_tag():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(tag=CacheTag.GET_USER_LIST)
+    async def get_user_list(*, limit: int):
+        calls.append(limit)
+        return [limit]
+
+    await get_user_list(limit=1)
+    await get_user_list(limit=2)
+
+    # When
+    await cache.remove_by_tag(tag=CacheTag.GET_USER_LIST)
+    await get_user_list(limit=1)
+
+    # Then
+    assert calls == [1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_remove():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(tag=CacheTag.USER_IS_ADMIN)
+    async def is_admin(*, user_id: int):
+        calls.append(user_id)
+        return True
+
+    await is_admin(user_id=1)
+    await is_admin(user_id=2)
+
+    # When
+    await cache.remove(
+        function=is_admin, tag=CacheTag.USER_IS_ADMIN, kwargs={"user_id": 1}
+    )
+    await is_admin(user_id=1)
+    await is_admin(user_id=2)
+
+    # Then
+    assert calls == [1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_cached_many():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached_many(prefix="user")
+    async def get_users(*, ids: list[int]):
+        calls.append(ids)
+        return {id: {"id": id} for id in ids if id != 4}
+
+    await get_users(ids=[1, 2])
+
+    # When
+    sut = await get_users(ids=[3, 2, 1, 4, 3])
+
+    # Then
+    assert sut == {3: {"id": 3}, 2: {"id": 2}, 1: {"id": 1}}
+    assert calls == [[1, 2], [3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_cached_many_all_hits():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached_many(prefix="user")
+    async def get_users(*, ids: list[int]):
+        calls.append(ids)
+        return {id: {"id": id} for id in ids}
+
+    await get_users(ids=[1, 2])
+
+    # When
+    sut = await get_users(ids=[2, 1])
+
+    # Then
+    assert sut == {2: {"id": 2}, 1: {"id": 1}}
+    assert calls == [[1, 2]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [[], 0, {}, ""])
+async def test_cached_falsy_value(value):
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide")
+    async def get_user_list():
+        calls.append(1)
+        return value
+
+    # When
+    await get_user_list()
+    sut = await get_user_list()
+
+    # Then
+    assert sut == value
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_cached_none_without_negative_ttl():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide")
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        return None
+
+    # When
+    await get_user(user_id=1)
+    sut = await get_user(user_id=1)
+
+    # Then
+    assert sut is None
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cached_negative_ttl():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(prefix="hide", ttl=60, negative_ttl=5)
+    async def get_user(*, user_id: int):
+        calls.append(user_id)
+        return None
+
+    # When
+    await get_user(user_id=1)
+    sut = await get_user(user_id=1)
+
+    # Then
+    assert sut is None
+    assert calls == [1]
+    _, expires_at, _, _ = next(iter(cache.backend._entries.values()))
+    assert expires_at - time.monotonic() <= 5
+
+
+@pytest.mark.asyncio
+async def test_cached_many_negative_ttl():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached_many(prefix="user", negative_ttl=5)
+    async def get_users(*, ids: list[int]):
+        calls.append(ids)
+        return {id: {"id": id} for id in ids if id != 2}
+
+    await get_users(ids=[1, 2])
+
+    # When
+    sut = await get_users(ids=[1, 2])
+
+    # Then
+    assert sut == {1: {"id": 1}}
+    assert calls == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_cached_metrics():
+    # Given
+    sink = PrometheusMetricsSink()
+    cache = make_cache(metrics=sink)
+
+    @cache.cached(tag=CacheTag.GET_USER_LIST)
+    async def get_user_list(*, limit: int):
+        return [limit]
+
+    # When
+    await get_user_list(limit=1)
+    await get_user_list(limit=1)
+    await get_user_list(limit=2)
+
+    # Then
+    tag = ("tag", CacheTag.GET_USER_LIST.value)
+    assert sink.counters["cache_hits_total"][(tag,)] == 1
+    assert sink.counters["cache_misses_total"][(tag,)] == 2
+    latency = sink.histograms["cache_backend_latency_seconds"]
+    assert latency[(("operation", "get"), tag)].count == 3
+    assert latency[(("operation", "set"), tag)].count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_metrics_error():
+    # Given
+    sink = PrometheusMetricsSink()
+    cache = make_cache(metrics=sink)
+    cache.backend.get = AsyncMock(side_effect=ConnectionError)
+
+    @cache.cached(prefix="hide")
+    async def get_user_list():
+        return []
+
+    # When
+    with pytest.raises(ConnectionError):
+        await get_user_list()
+
+    # Then
+    labels = (("operation", "get"), ("tag", "hide"))
+    assert sink.counters["cache_errors_total"][labels] == 1
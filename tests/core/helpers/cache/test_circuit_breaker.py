@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from core.helpers.cache import circuit_breaker
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+
+
+def test_open_after_threshold():
+    # Given
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    # When
+    breaker.record_failure()
+    allowed_before_threshold = breaker.allow()
+    breaker.record_failure()
+
+    # Then
+    assert allowed_before_threshold is True
+    assert breaker.is_open is True
+    assert breaker.allow() is False
+
+
+def test_half_open_allows_single_probe():
+    # Given
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    with patch.object(circuit_breaker.time, "monotonic", return_value=100.0):
+        breaker.record_failure()
+
+    # When
+    with patch.object(circuit_breaker.time, "monotonic", return_value=111.0):
+        probe = breaker.allow()
+        other = breaker.allow()
+
+    # Then
+    assert probe is True
+    assert other is False
+
+
+def test_probe_success_closes():
+    # Given
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    breaker.allow()
+
+    # When
+    breaker.record_success()
+
+    # Then
+    assert breaker.is_open is False
+    assert breaker.allow() is True
+
+
+def test_probe_failure_reopens():
+    # Given
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    with patch.object(circuit_breaker.time, "monotonic", return_value=100.0):
+        breaker.record_failure()
+    with patch.object(circuit_breaker.time, "monotonic", return_value=111.0):
+        breaker.allow()
+
+    # When
+    with patch.object(circuit_breaker.time, "monotonic", return_value=112.0):
+        breaker.record_failure()
+        sut = breaker.allow()
+
+    # Then
+    assert sut is False
+
+
+def test_unfinished_probe_releases_slot_after_recovery_timeout():
+    # Given
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    with patch.object(circuit_breaker.time, "monotonic", return_value=100.0):
+        breaker.record_failure()
+    with patch.object(circuit_breaker.time, "monotonic", return_value=111.0):
+        breaker.allow()
+
+    # When
+    with patch.object(circuit_breaker.time, "monotonic", return_value=115.0):
+        before_deadline = breaker.allow()
+    with patch.object(circuit_breaker.time, "monotonic", return_value=121.0):
+        after_deadline = breaker.allow()
+
+    # Then
+    assert before_deadline is False
+    assert after_deadline is True
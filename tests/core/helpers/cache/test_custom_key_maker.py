@@ -1,4 +1,5 @@
 import pytest
+from pydantic import BaseModel
 
 from core.helpers.cache.custom_key_maker import CustomKeyMaker
 
@@ -25,7 +26,136 @@ async def test_make_with_args():
         pass
 
     # When
-    sut = await key_maker.make(function=test, prefix="hide")
+    sut = await key_maker.make(function=test, prefix="hide", args=(1,))
+
+    # Then
+    path = "hide::tests.core.helpers.cache.test_custom_key_maker.test"
+    assert sut.startswith(f"{path}:")
+    assert sut == await key_maker.make(function=test, prefix="hide", kwargs={"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_make_different_values():
+    # Given
+    async def get_user_list(*, limit: int = 12, prev: int | None = None):
+        pass
+
+    # When
+    sut_1 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"limit": 10, "prev": None},
+    )
+    sut_2 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"limit": 5, "prev": 900},
+    )
+
+    # Then
+    assert sut_1 != sut_2
+
+
+@pytest.mark.asyncio
+async def test_make_apply_defaults():
+    # Given
+    async def get_user_list(*, limit: int = 12, prev: int | None = None):
+        pass
+
+    # When
+    sut_1 = await key_maker.make(function=get_user_list, prefix="hide")
+    sut_2 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"limit": 12},
+    )
+
+    # Then
+    assert sut_1 == sut_2
+
+
+@pytest.mark.asyncio
+async def test_make_skip_self():
+    # Given
+    class Service:
+        async def get_user(self, *, user_id: int):
+            pass
+
+    # When
+    sut_1 = await key_maker.make(
+        function=Service.get_user,
+        prefix="hide",
+        args=(Service(),),
+        kwargs={"user_id": 1},
+    )
+    sut_2 = await key_maker.make(
+        function=Service.get_user,
+        prefix="hide",
+        args=(Service(),),
+        kwargs={"user_id": 1},
+    )
+
+    # Then
+    assert sut_1 == sut_2
+
+
+@pytest.mark.asyncio
+async def test_make_model_argument():
+    # Given
+    class Query(BaseModel):
+        limit: int
+
+    async def get_user_list(*, query: Query):
+        pass
+
+    # When
+    sut_1 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"query": Query(limit=10)},
+    )
+    sut_2 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"query": Query(limit=10)},
+    )
+
+    # Then
+    assert sut_1 == sut_2
+
+
+@pytest.mark.asyncio
+async def test_make_dict_argument_ignores_order():
+    # Given
+    async def get_user_list(*, filters: dict):
+        pass
+
+    # When
+    sut_1 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"filters": {"a": 1, "b": [2]}},
+    )
+    sut_2 = await key_maker.make(
+        function=get_user_list,
+        prefix="hide",
+        kwargs={"filters": {"b": [2], "a": 1}},
+    )
 
     # Then
-    assert sut == "hide::tests.core.helpers.cache.test_custom_key_maker.test.a"
+    assert sut_1 == sut_2
+
+
+@pytest.mark.asyncio
+async def test_make_rejects_unstable_argument():
+    # Given
+    async def get_user(*, user: object):
+        pass
+
+    # When, Then
+    with pytest.raises(TypeError):
+        await key_maker.make(
+            function=get_user,
+            prefix="hide",
+            kwargs={"user": object()},
+        )
@@ -0,0 +1,203 @@
+from unittest.mock import patch
+
+import pytest
+
+from core.helpers.cache import memory_backend
+from core.helpers.cache.base import MISSING
+from core.helpers.cache.memory_backend import MemoryBackend
+from core.helpers.metrics import PrometheusMetricsSink
+
+
+@pytest.mark.asyncio
+async def test_get_empty():
+    # Given
+    backend = MemoryBackend()
+
+    # When
+    sut = await backend.get(key="hide")
+
+    # Then
+    assert sut is None
+    assert backend.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_set():
+    # Given
+    backend = MemoryBackend()
+
+    # When
+    await backend.set(response=[{"id": 1}], key="hide")
+
+    # Then
+    assert await backend.get(key="hide") == [{"id": 1}]
+    assert backend.stats.hits == 1
+    assert backend.stats.entries == 1
+
+
+@pytest.mark.asyncio
+async def test_get_expired():
+    # Given
+    backend = MemoryBackend()
+    with patch.object(memory_backend.time, "monotonic", return_value=100.0):
+        await backend.set(response="value", key="hide", ttl=10)
+
+    # When
+    with patch.object(memory_backend.time, "monotonic", return_value=110.0):
+        sut = await backend.get(key="hide")
+
+    # Then
+    assert sut is None
+    assert backend.stats.expirations == 1
+    assert backend.stats.entries == 0
+
+
+@pytest.mark.asyncio
+async def test_evict_least_recently_used():
+    # Given
+    backend = MemoryBackend(max_entries=2)
+    await backend.set(response=1, key="a")
+    await backend.set(response=2, key="b")
+    await backend.get(key="a")
+
+    # When
+    await backend.set(response=3, key="c")
+
+    # Then
+    assert await backend.get(key="a") == 1
+    assert await backend.get(key="b") is None
+    assert await backend.get(key="c") == 3
+    assert backend.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_evict_by_size():
+    # Given
+    backend = MemoryBackend(max_size=200)
+    await backend.set(response="a" * 100, key="a")
+
+    # When
+    await backend.set(response="b" * 100, key="b")
+
+    # Then
+    assert await backend.get(key="a") is None
+    assert await backend.get(key="b") == "b" * 100
+    assert backend.stats.size <= 200
+
+
+@pytest.mark.asyncio
+async def test_set_too_large():
+    # Given
+    backend = MemoryBackend(max_size=10)
+
+    # When
+    await backend.set(response="a" * 100, key="a")
+
+    # Then
+    assert await backend.get(key="a") is None
+    assert backend.stats.entries == 0
+
+
+@pytest.mark.asyncio
+async def test_set_too_large_replaces_existing():
+    # Given
+    backend = MemoryBackend(max_size=100)
+    await backend.set(response="old", key="a")
+
+    # When
+    await backend.set(response="a" * 1000, key="a")
+
+    # Then
+    assert await backend.get(key="a") is None
+    assert backend.stats.entries == 0
+    assert backend.stats.size == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_startswith():
+    # Given
+    backend = MemoryBackend()
+    await backend.set(response=1, key="data1")
+    await backend.set(response=2, key="data2")
+    await backend.set(response=3, key="other")
+
+    # When
+    await backend.delete_startswith(value="data")
+
+    # Then
+    assert await backend.get(key="data1") is None
+    assert await backend.get(key="data2") is None
+    assert await backend.get(key="other") == 3
+
+
+@pytest.mark.asyncio
+async def test_delete_by_tag():
+    # Given
+    backend = MemoryBackend()
+    await backend.set(response=1, key="a", tag="tag")
+    await backend.set(response=2, key="b", tag="tag")
+    await backend.set(response=3, key="c", tag="other")
+
+    # When
+    await backend.delete_by_tag(tag="tag")
+
+    # Then
+    assert await backend.get(key="a") is None
+    assert await backend.get(key="b") is None
+    assert await backend.get(key="c") == 3
+
+
+@pytest.mark.asyncio
+async def test_get_many():
+    # Given
+    backend = MemoryBackend()
+    await backend.set_many(responses={"a": 1, "b": 2})
+
+    # When
+    sut = await backend.get_many(keys=["a", "b", "c"])
+
+    # Then
+    assert sut == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_delete_many():
+    # Given
+    backend = MemoryBackend()
+    await backend.set_many(responses={"a": 1, "b": 2})
+
+    # When
+    await backend.delete_many(keys=["a", "c"])
+
+    # Then
+    assert await backend.get_many(keys=["a", "b"]) == {"b": 2}
+    assert backend.stats.entries == 1
+
+
+@pytest.mark.asyncio
+async def test_get_cached_none():
+    # Given
+    backend = MemoryBackend()
+    await backend.set(response=None, key="hide")
+
+    # When
+    sut = await backend.get(key="hide", default=MISSING)
+
+    # Then
+    assert sut is None
+    assert await backend.get(key="other", default=MISSING) is MISSING
+
+
+@pytest.mark.asyncio
+async def test_evict_metrics():
+    # Given
+    sink = PrometheusMetricsSink()
+    backend = MemoryBackend(max_entries=1, metrics=sink)
+    await backend.set(response=1, key="hide::a")
+
+    # When
+    await backend.set(response=2, key="hide::b")
+
+    # Then
+    labels = (("tag", "hide"), ("tier", "memory"))
+    assert sink.counters["cache_evictions_total"][labels] == 1
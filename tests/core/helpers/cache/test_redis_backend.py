@@ -1,7 +1,14 @@
+from unittest.mock import patch
+
 import pytest
+from pydantic import BaseModel
 
+from core.helpers.cache import redis_backend as redis_backend_module
+from core.helpers.cache.base import MISSING
 from core.helpers.cache.redis_backend import RedisBackend
-from core.helpers.redis import redis_client
+from core.helpers.metrics import PrometheusMetricsSink
+from core.helpers.redis import cache_redis_client
+from tests.support.fake_redis import FakeRedis
 
 redis_backend = RedisBackend()
 
@@ -22,14 +29,14 @@ async def test_get_empty():
 async def test_get():
     # Given
     key = "hide"
-    await redis_client.set(key, 1)
+    await cache_redis_client.set(key, 1)
 
     # When
     sut = await redis_backend.get(key=key)
 
     # Then
     assert sut == 1
-    await redis_client.delete(key)
+    await cache_redis_client.delete(key)
 
 
 @pytest.mark.asyncio
@@ -44,11 +51,10 @@ async def test_set_dict():
     # Then
     sut: dict[str, str] = await redis_backend.get(key=key)
     assert sut == data
-    await redis_client.delete(key)
+    await cache_redis_client.delete(key)
 
 
-class Test:
-    ...
+class Test: ...
 
 
 @pytest.mark.asyncio
@@ -61,20 +67,226 @@ async def test_set_object():
     await redis_backend.set(response=data, key=key)
 
     # Then
-    sut = await redis_client.exists(key)
+    sut = await cache_redis_client.exists(key)
     assert sut == 1
-    await redis_client.delete(key)
+    await cache_redis_client.delete(key)
 
 
 @pytest.mark.asyncio
 async def test_delete_startswith():
     # Given
-    await redis_client.set("data1", "b")
-    await redis_client.set("data2", "a")
+    await cache_redis_client.set("data1", "b")
+    await cache_redis_client.set("data2", "a")
 
     # When
     await redis_backend.delete_startswith(value="data")
 
     # Then
-    assert await redis_client.get("data1") is None
-    assert await redis_client.get("data2") is None
+    assert await cache_redis_client.get("data1") is None
+    assert await cache_redis_client.get("data2") is None
+
+
+class UserModel(BaseModel):
+    id: int
+    nickname: str
+
+
+@pytest.mark.asyncio
+async def test_set_model_list():
+    # Given
+    data = [UserModel(id=1, nickname="hide")]
+    key = "hide"
+
+    # When
+    await redis_backend.set(response=data, key=key)
+
+    # Then
+    sut = await redis_backend.get(key=key)
+    assert sut == data
+    await cache_redis_client.delete(key)
+
+
+@pytest.mark.asyncio
+async def test_set_with_tag_registers_key():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client)
+
+    # When
+    with patch.object(redis_backend_module.time, "time", return_value=1000):
+        await backend.set(response=[1], key="get_user_list::a", ttl=30, tag="tag")
+        await backend.set(response=[2], key="get_user_list::b", ttl=60, tag="tag")
+
+    # Then
+    assert client.data["cache:tags:tag"] == {
+        "get_user_list::a": 1030,
+        "get_user_list::b": 1060,
+    }
+    assert "cache:tags:tag" not in client.ttls
+
+
+@pytest.mark.asyncio
+async def test_set_with_tag_prunes_expired_keys():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client, tag_prune_delay=60)
+    with patch.object(redis_backend_module.time, "time", return_value=1000):
+        await backend.set(response=[1], key="a", ttl=30, tag="tag")
+        await backend.set(response=[2], key="b", ttl=600, tag="tag")
+
+    # When
+    with patch.object(redis_backend_module.time, "time", return_value=1100):
+        await backend.set(response=[3], key="c", ttl=30, tag="tag")
+
+    # Then
+    assert set(client.data["cache:tags:tag"]) == {"b", "c"}
+
+
+@pytest.mark.asyncio
+async def test_delete_by_tag():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client, batch_size=2)
+    for index in range(5):
+        await backend.set(response=index, key=f"key{index}", tag="tag")
+    await backend.set(response="other", key="other", tag="other")
+
+    # When
+    await backend.delete_by_tag(tag="tag")
+
+    # Then
+    assert set(client.data) == {"other", "cache:tags:other"}
+
+
+@pytest.mark.asyncio
+async def test_delete_by_tag_resumes_interrupted_run():
+    # Given
+    class InterruptedRedis(FakeRedis):
+        unlinks = 0
+
+        async def unlink(self, *names: str) -> int:
+            # Fails after the first batch of tagged keys is gone
+            self.unlinks += 1
+            removed = await super().unlink(*names)
+            if self.unlinks == 2:
+                raise ConnectionError
+            return removed
+
+    client = InterruptedRedis()
+    backend = RedisBackend(client=client, batch_size=2)
+    for index in range(5):
+        await backend.set(response=index, key=f"key{index}", tag="tag")
+    await backend.set(response="other", key="other", tag="other")
+    with pytest.raises(ConnectionError):
+        await backend.delete_by_tag(tag="tag")
+    await backend.set(response=5, key="key5", tag="tag")
+
+    # When
+    await backend.delete_by_tag(tag="tag")
+
+    # Then
+    assert set(client.data) == {"other", "cache:tags:other"}
+
+
+@pytest.mark.asyncio
+async def test_delete_by_tag_empty():
+    # Given
+    backend = RedisBackend(client=FakeRedis())
+
+    # When, Then
+    await backend.delete_by_tag(tag="tag")
+
+
+@pytest.mark.asyncio
+async def test_get_corrupt_value():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client)
+    client.data["user:1"] = b"\x00\x03corrupt"
+
+    # When
+    sut = await backend.get(key="user:1", default=MISSING)
+
+    # Then
+    assert sut is MISSING
+
+
+@pytest.mark.asyncio
+async def test_get_many():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client)
+    await backend.set(response={"id": 1}, key="user:1")
+    await backend.set(response=[], key="user:2")
+    client.round_trips = 0
+
+    # When
+    sut = await backend.get_many(keys=["user:1", "user:2", "user:3"])
+
+    # Then
+    assert sut == {"user:1": {"id": 1}, "user:2": []}
+    assert client.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_set_many():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client)
+
+    # When
+    await backend.set_many(
+        responses={"user:1": {"id": 1}, "user:2": {"id": 2}},
+        ttl=30,
+        tag="user",
+    )
+
+    # Then
+    assert client.round_trips == 1
+    assert client.ttls["user:1"] == 30
+    assert set(client.data["cache:tags:user"]) == {"user:1", "user:2"}
+    assert await backend.get(key="user:2") == {"id": 2}
+
+
+@pytest.mark.asyncio
+async def test_delete_many():
+    # Given
+    client = FakeRedis()
+    backend = RedisBackend(client=client)
+    await backend.set_many(responses={"user:1": 1, "user:2": 2, "user:3": 3})
+
+    # When
+    await backend.delete_many(keys=["user:1", "user:2"])
+
+    # Then
+    assert set(client.data) == {"user:3"}
+
+
+@pytest.mark.asyncio
+async def test_get_cached_none():
+    # Given
+    backend = RedisBackend(client=FakeRedis())
+    await backend.set(response=None, key="hide")
+
+    # When
+    sut = await backend.get(key="hide", default=MISSING)
+
+    # Then
+    assert sut is None
+    assert await backend.get(key="other", default=MISSING) is MISSING
+    assert await backend.get_many(keys=["hide", "other"]) == {"hide": None}
+
+
+@pytest.mark.asyncio
+async def test_set_payload_size_metrics():
+    # Given
+    sink = PrometheusMetricsSink()
+    backend = RedisBackend(client=FakeRedis(), metrics=sink)
+
+    # When
+    await backend.set(response={"name": "hide"}, key="hide::a")
+
+    # Then
+    histogram = sink.histograms["cache_payload_size_bytes"][(("tag", "hide"),)]
+    assert histogram.count == 1
+    assert histogram.sum > 0
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from core.helpers.cache.base import MISSING
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from core.helpers.cache.redis_backend import RedisBackend
+from core.helpers.cache.resilient_backend import (
+    CacheInvalidationError,
+    ResilientBackend,
+)
+from tests.support.fake_redis import FakeRedis
+
+
+class SlowRedis(FakeRedis):
+    async def get(self, name: str):
+        await asyncio.sleep(1)
+        return await super().get(name)
+
+
+class FailingRedis(FakeRedis):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def get(self, name: str):
+        self.calls += 1
+        raise ConnectionError
+
+    async def set(self, name: str, value, ex: int | None = None):
+        self.calls += 1
+        raise ConnectionError
+
+    async def unlink(self, *names: str):
+        self.calls += 1
+        raise ConnectionError
+
+
+class SlowUnlinkRedis(FakeRedis):
+    async def unlink(self, *names: str):
+        await asyncio.sleep(0.05)
+        return await super().unlink(*names)
+
+
+def make_backend(client: FakeRedis, **kwargs) -> ResilientBackend:
+    return ResilientBackend(backend=RedisBackend(client=client), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_get():
+    # Given
+    backend = make_backend(FakeRedis())
+    await backend.set(response={"name": "hide"}, key="hide")
+
+    # When
+    sut = await backend.get(key="hide")
+
+    # Then
+    assert sut == {"name": "hide"}
+
+
+@pytest.mark.asyncio
+async def test_get_timeout_is_miss():
+    # Given
+    backend = make_backend(SlowRedis(), timeout=0.01)
+
+    # When
+    sut = await backend.get(key="hide", default=MISSING)
+
+    # Then
+    assert sut is MISSING
+    assert backend.breaker.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_set_failure_is_dropped():
+    # Given
+    backend = make_backend(FailingRedis())
+
+    # When, Then
+    await backend.set(response=1, key="hide")
+
+
+@pytest.mark.asyncio
+async def test_invalidation_failure_raises():
+    # Given
+    backend = make_backend(FailingRedis())
+
+    # When, Then
+    with pytest.raises(CacheInvalidationError):
+        await backend.delete_many(keys=["hide"])
+
+
+@pytest.mark.asyncio
+async def test_invalidation_uses_own_timeout():
+    # Given
+    client = SlowUnlinkRedis()
+    backend = make_backend(client, timeout=0.01, invalidation_timeout=1)
+    await client.set("hide", b"1")
+
+    # When
+    await backend.delete_many(keys=["hide"])
+
+    # Then
+    assert "hide" not in client.data
+    assert backend.breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_circuit_open_bypasses_backend():
+    # Given
+    client = FailingRedis()
+    backend = make_backend(
+        client,
+        breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+    )
+
+    # When
+    for _ in range(5):
+        await backend.get(key="hide")
+
+    # Then
+    assert client.calls == 2
+    assert backend.breaker.is_open is True
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_keep_circuit_open():
+    # Given
+    client = SlowRedis()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    backend = make_backend(client, timeout=5, breaker=breaker)
+    breaker.record_failure()
+    await asyncio.sleep(0.05)
+    probe = asyncio.create_task(backend.get(key="hide"))
+    await asyncio.sleep(0)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    # When
+    await asyncio.sleep(0.05)
+    client.get = FakeRedis.get.__get__(client)
+    await backend.get(key="hide")
+
+    # Then
+    assert breaker.is_open is False
+
+
+@pytest.mark.asyncio
+async def test_write_behind():
+    # Given
+    client = FakeRedis()
+    backend = make_backend(client, write_behind=True)
+    await backend.start()
+
+    # When
+    await backend.set(response=1, key="a")
+    await backend.delete_many(keys=["a"])
+    await backend.set(response=2, key="b")
+    queued = dict(client.data)
+    await backend.stop()
+
+    # Then
+    assert queued == {}
+    assert await backend.get(key="a") is None
+    assert await backend.get(key="b") == 2
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from core.helpers.cache.serializer import (
+    MAGIC,
+    CacheDecodeError,
+    CacheSerializer,
+    JsonSerializer,
+    PickleSerializer,
+    PydanticSerializer,
+)
+
+
+class UserModel(BaseModel):
+    id: int
+    nickname: str
+
+
+@dataclass
+class UserData:
+    id: int
+
+
+class Role(Enum):
+    ADMIN = "admin"
+
+
+serializer = CacheSerializer()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        1,
+        "hide",
+        None,
+        [],
+        {"name": "hide"},
+        [{"id": 1}, {"id": 2}],
+    ],
+)
+def test_json_round_trip(value):
+    # When
+    data = serializer.dumps(value)
+
+    # Then
+    assert data[:1] == MAGIC
+    assert data[1] & 0x0F == JsonSerializer.format_id
+    assert serializer.loads(data) == value
+
+
+def test_pydantic_model_round_trip():
+    # Given
+    value = UserModel(id=1, nickname="hide")
+
+    # When
+    data = serializer.dumps(value)
+
+    # Then
+    assert data[1] & 0x0F == PydanticSerializer.format_id
+    assert serializer.loads(data) == value
+
+
+def test_pydantic_model_list_round_trip():
+    # Given
+    value = [UserModel(id=1, nickname="hide"), UserModel(id=2, nickname="test")]
+
+    # When
+    data = serializer.dumps(value)
+
+    # Then
+    assert data[1] & 0x0F == PydanticSerializer.format_id
+    sut = serializer.loads(data)
+    assert sut == value
+    assert all(isinstance(item, UserModel) for item in sut)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        UserData(id=1),
+        {"created_at": datetime(2024, 1, 1)},
+        {1, 2},
+        UUID("12345678-1234-5678-1234-567812345678"),
+        {"role": Role.ADMIN},
+        (1, "hide"),
+        {"ids": [(1, 2)]},
+        {1: "hide"},
+        float("inf"),
+    ],
+)
+def test_fallback_to_pickle(value):
+    # When
+    data = serializer.dumps(value)
+
+    # Then
+    assert data[1] & 0x0F == PickleSerializer.format_id
+    assert serializer.loads(data) == value
+
+
+def test_compress_above_threshold():
+    # Given
+    value = {"name": "hide" * 1000}
+
+    # When
+    data = serializer.dumps(value)
+
+    # Then
+    assert data[1] >> 4 != 0
+    assert len(data) < len(JsonSerializer().dumps(value))
+    assert serializer.loads(data) == value
+
+
+def test_no_compress_below_threshold():
+    # When
+    data = serializer.dumps({"name": "hide"})
+
+    # Then
+    assert data[1] >> 4 == 0
+
+
+def test_loads_legacy_json():
+    # When
+    sut = serializer.loads(b'{"name": "hide"}')
+
+    # Then
+    assert sut == {"name": "hide"}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        MAGIC + bytes([PickleSerializer.format_id]) + b"corrupt",
+        MAGIC + bytes([0x0F]) + b"{}",
+        MAGIC + bytes([JsonSerializer.format_id | 1 << 4]) + b"not zlib",
+        b"not json",
+    ],
+)
+def test_loads_corrupt_value(data):
+    # When, Then
+    with pytest.raises(CacheDecodeError):
+        serializer.loads(data)
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from core.helpers.cache.memory_backend import MemoryBackend
+from core.helpers.cache.two_tier_backend import TwoTierBackend
+from tests.support.fake_redis import FakeRedis
+
+
+def make_backend(
+    *,
+    remote: MemoryBackend,
+    client: FakeRedis,
+) -> TwoTierBackend:
+    return TwoTierBackend(remote=remote, local=MemoryBackend(), client=client)
+
+
+@pytest.mark.asyncio
+async def test_get_from_remote_populates_local():
+    # Given
+    remote = MemoryBackend()
+    await remote.set(response={"name": "hide"}, key="hide")
+    backend = make_backend(remote=remote, client=FakeRedis())
+
+    # When
+    sut = await backend.get(key="hide")
+
+    # Then
+    assert sut == {"name": "hide"}
+    assert await backend.local.get(key="hide") == {"name": "hide"}
+
+
+@pytest.mark.asyncio
+async def test_get_from_local():
+    # Given
+    remote = MemoryBackend()
+    backend = make_backend(remote=remote, client=FakeRedis())
+    await backend.set(response=[1, 2], key="hide")
+    remote.clear()
+
+    # When
+    sut = await backend.get(key="hide")
+
+    # Then
+    assert sut == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_delete_startswith_invalidates_other_workers():
+    # Given
+    client = FakeRedis()
+    remote = MemoryBackend()
+    backend = make_backend(remote=remote, client=client)
+    other = make_backend(remote=remote, client=client)
+    await other.start()
+    await asyncio.sleep(0)
+    await backend.set(response=1, key="data1")
+    await other.get(key="data1")
+
+    # When
+    await backend.delete_startswith(value="data")
+    await asyncio.sleep(0)
+
+    # Then
+    assert await other.local.get(key="data1") is None
+    assert await other.get(key="data1") is None
+    await other.stop()
+
+
+@pytest.mark.asyncio
+async def test_delete_by_tag_invalidates_other_workers():
+    # Given
+    client = FakeRedis()
+    remote = MemoryBackend()
+    backend = make_backend(remote=remote, client=client)
+    other = make_backend(remote=remote, client=client)
+    await other.start()
+    await asyncio.sleep(0)
+    await backend.set(response=1, key="key", tag="tag")
+    await other.get(key="key")
+
+    # When
+    await backend.delete_by_tag(tag="tag")
+    await asyncio.sleep(0)
+
+    # Then
+    assert await other.get(key="key") is None
+    await other.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_many():
+    # Given
+    remote = MemoryBackend()
+    backend = make_backend(remote=remote, client=FakeRedis())
+    await backend.set(response=1, key="a")
+    await remote.set(response=2, key="b")
+
+    # When
+    sut = await backend.get_many(keys=["a", "b", "c"])
+
+    # Then
+    assert sut == {"a": 1, "b": 2}
+    assert await backend.local.get(key="b") == 2
@@ -0,0 +1,152 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.helpers.dataloader import DataLoader, request_loader
+
+
+@pytest.mark.asyncio
+async def test_load_batches_same_tick():
+    # Given
+    batch_load = AsyncMock(return_value={1: "a", 2: "b"})
+    loader = DataLoader(batch_load=batch_load)
+
+    # When
+    sut = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    # Then
+    assert sut == ["a", "b", "a"]
+    batch_load.assert_awaited_once_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_load_missing_key():
+    # Given
+    loader = DataLoader(batch_load=AsyncMock(return_value={}))
+
+    # When
+    sut = await loader.load(1)
+
+    # Then
+    assert sut is None
+
+
+@pytest.mark.asyncio
+async def test_load_cached():
+    # Given
+    batch_load = AsyncMock(return_value={1: "a"})
+    loader = DataLoader(batch_load=batch_load)
+    await loader.load(1)
+
+    # When
+    sut = await loader.load(1)
+
+    # Then
+    assert sut == "a"
+    batch_load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_clear():
+    # Given
+    batch_load = AsyncMock(side_effect=[{1: "a"}, {1: "b"}])
+    loader = DataLoader(batch_load=batch_load)
+    await loader.load(1)
+
+    # When
+    loader.clear(1)
+    sut = await loader.load(1)
+
+    # Then
+    assert sut == "b"
+
+
+@pytest.mark.asyncio
+async def test_load_many_max_batch_size():
+    # Given
+    batch_load = AsyncMock(side_effect=lambda keys: {key: key * 10 for key in keys})
+    loader = DataLoader(batch_load=batch_load, max_batch_size=2)
+
+    # When
+    sut = await loader.load_many([1, 2, 3])
+
+    # Then
+    assert sut == [10, 20, 30]
+    assert [call.args[0] for call in batch_load.await_args_list] == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_load_many_max_batch_size_loads_chunks_sequentially():
+    # Given
+    active, overlaps = [], []
+
+    async def batch_load(keys):
+        overlaps.append(bool(active))
+        active.append(keys)
+        await asyncio.sleep(0)
+        active.remove(keys)
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_load=batch_load, max_batch_size=1)
+
+    # When
+    sut = await loader.load_many([1, 2, 3])
+
+    # Then
+    assert sut == [1, 2, 3]
+    assert overlaps == [False, False, False]
+
+
+@pytest.mark.asyncio
+async def test_loads_from_different_ticks_run_sequentially():
+    # Given
+    active, overlaps = [], []
+
+    async def batch_load(keys):
+        overlaps.append(bool(active))
+        active.append(keys)
+        await asyncio.sleep(0.01)
+        active.remove(keys)
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_load=batch_load)
+
+    async def load_later(key):
+        await asyncio.sleep(0)
+        return await loader.load(key)
+
+    # When
+    sut = await asyncio.gather(loader.load(1), load_later(2))
+
+    # Then
+    assert sut == [1, 2]
+    assert overlaps == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_load_error_is_not_cached():
+    # Given
+    batch_load = AsyncMock(side_effect=[ValueError, {1: "a"}])
+    loader = DataLoader(batch_load=batch_load)
+    with pytest.raises(ValueError):
+        await loader.load(1)
+
+    # When
+    sut = await loader.load(1)
+
+    # Then
+    assert sut == "a"
+
+
+def test_request_loader_shared_within_request():
+    # Given
+    def factory():
+        return DataLoader(batch_load=AsyncMock())
+
+    # When
+    first = request_loader("test", factory)
+    second = request_loader("test", factory)
+
+    # Then
+    assert first is second
@@ -0,0 +1,59 @@
+from core.helpers.metrics import PrometheusMetricsSink
+
+
+def test_render_counter():
+    # Given
+    sink = PrometheusMetricsSink()
+    sink.increment("cache_hits_total", tag="get_user_list")
+    sink.increment("cache_hits_total", 2, tag="get_user_list")
+
+    # When
+    sut = sink.render()
+
+    # Then
+    assert "# TYPE cache_hits_total counter" in sut
+    assert 'cache_hits_total{tag="get_user_list"} 3' in sut
+
+
+def test_render_gauge():
+    # Given
+    sink = PrometheusMetricsSink()
+    sink.set_gauge("db_pool_checked_out", 3, engine="writer")
+
+    # When
+    sut = sink.render()
+
+    # Then
+    assert "# TYPE db_pool_checked_out gauge" in sut
+    assert 'db_pool_checked_out{engine="writer"} 3' in sut
+
+
+def test_render_histogram():
+    # Given
+    sink = PrometheusMetricsSink(buckets={"size": (10, 100)})
+    sink.observe("size", 5, tag="hide")
+    sink.observe("size", 50, tag="hide")
+    sink.observe("size", 500, tag="hide")
+
+    # When
+    sut = sink.render()
+
+    # Then
+    assert "# TYPE size histogram" in sut
+    assert 'size_bucket{tag="hide",le="10"} 1' in sut
+    assert 'size_bucket{tag="hide",le="100"} 2' in sut
+    assert 'size_bucket{tag="hide",le="+Inf"} 3' in sut
+    assert 'size_sum{tag="hide"} 555' in sut
+    assert 'size_count{tag="hide"} 3' in sut
+
+
+def test_render_escape_label():
+    # Given
+    sink = PrometheusMetricsSink()
+    sink.increment("hits", tag='a"b')
+
+    # When
+    sut = sink.render()
+
+    # Then
+    assert 'hits{tag="a\\"b"} 1' in sut
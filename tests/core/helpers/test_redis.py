@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from core.helpers import redis as redis_helper
+from core.helpers.redis import (
+    cache_redis_client,
+    close_redis_pools,
+    redis_client,
+    warm_redis_pools,
+)
+
+
+def test_separate_pools():
+    # Given
+    cache_pool = cache_redis_client.connection_pool
+    pool = redis_client.connection_pool
+
+    # When, Then
+    assert cache_pool is not pool
+    assert cache_pool.connection_kwargs["decode_responses"] is False
+    assert pool.connection_kwargs["decode_responses"] is True
+
+
+def test_pool_settings():
+    # Given
+    pool = redis_client.connection_pool
+
+    # When
+    sut = pool.connection_kwargs
+
+    # Then
+    assert sut["port"] == redis_helper.config.REDIS_PORT
+    assert sut["socket_timeout"] == redis_helper.config.REDIS_SOCKET_TIMEOUT
+    assert sut["socket_keepalive"] == redis_helper.config.REDIS_SOCKET_KEEPALIVE
+    assert (
+        sut["health_check_interval"] == redis_helper.config.REDIS_HEALTH_CHECK_INTERVAL
+    )
+    assert pool.max_connections == redis_helper.config.REDIS_MAX_CONNECTIONS
+
+
+@pytest.mark.asyncio
+async def test_warm_redis_pools():
+    # Given
+    ping = AsyncMock(return_value=True)
+
+    # When
+    with (
+        patch.object(redis_client, "ping", ping),
+        patch.object(cache_redis_client, "ping", ping),
+    ):
+        await warm_redis_pools(connections=3)
+
+    # Then
+    assert ping.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_warm_redis_pools_unavailable():
+    # Given
+    ping = AsyncMock(side_effect=ConnectionError)
+
+    # When, Then
+    with (
+        patch.object(redis_client, "ping", ping),
+        patch.object(cache_redis_client, "ping", ping),
+    ):
+        await warm_redis_pools(connections=1)
+
+
+@pytest.mark.asyncio
+async def test_close_redis_pools():
+    # Given
+    disconnect = AsyncMock()
+
+    # When
+    with (
+        patch.object(redis_client.connection_pool, "disconnect", disconnect),
+        patch.object(cache_redis_client.connection_pool, "disconnect", disconnect),
+    ):
+        await close_redis_pools()
+
+    # Then
+    assert disconnect.await_count == 2
@@ -0,0 +1,121 @@
+import pytest
+from redis.exceptions import ConnectionError
+
+from core.helpers.cache.circuit_breaker import CircuitBreaker
+from core.helpers.refresh_token import (
+    MemoryRefreshTokenStore,
+    RedisRefreshTokenStore,
+    RefreshTokenManager,
+    ReusedRefreshTokenException,
+    RevokedTokenException,
+)
+from core.helpers.token import DecodeTokenException, TokenHelper
+from tests.support.fake_redis import FakeRedis
+
+
+def make_manager() -> RefreshTokenManager:
+    return RefreshTokenManager(store=MemoryRefreshTokenStore(), refresh_ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_issue():
+    # Given
+    manager = make_manager()
+
+    # When
+    sut = await manager.issue(user_id=1)
+
+    # Then
+    token = TokenHelper.decode(token=sut.token)
+    refresh_token = TokenHelper.decode(token=sut.refresh_token)
+    assert token["user_id"] == 1
+    assert refresh_token["user_id"] == 1
+    assert refresh_token["sid"] == token["sid"]
+
+
+@pytest.mark.asyncio
+async def test_rotate():
+    # Given
+    manager = make_manager()
+    pair = await manager.issue(user_id=1)
+
+    # When
+    sut = await manager.rotate(refresh_token=pair.refresh_token)
+
+    # Then
+    refresh_token = TokenHelper.decode(token=sut.refresh_token)
+    assert refresh_token["sid"] == TokenHelper.decode(token=pair.token)["sid"]
+    assert refresh_token["jti"] != TokenHelper.decode(token=pair.refresh_token)["jti"]
+
+
+@pytest.mark.asyncio
+async def test_rotate_reused_token_revokes_session():
+    # Given
+    manager = make_manager()
+    pair = await manager.issue(user_id=1)
+    rotated = await manager.rotate(refresh_token=pair.refresh_token)
+
+    # When
+    with pytest.raises(ReusedRefreshTokenException):
+        await manager.rotate(refresh_token=pair.refresh_token)
+
+    # Then
+    session_id = TokenHelper.decode(token=pair.token)["sid"]
+    assert await manager.is_revoked(session_id=session_id) is True
+    with pytest.raises(RevokedTokenException):
+        await manager.rotate(refresh_token=rotated.refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_rotate_access_token():
+    # Given
+    manager = make_manager()
+    pair = await manager.issue(user_id=1)
+
+    # When, Then
+    with pytest.raises(DecodeTokenException):
+        await manager.rotate(refresh_token=pair.token)
+
+
+@pytest.mark.asyncio
+async def test_redis_store():
+    # Given
+    client = FakeRedis()
+    store = RedisRefreshTokenStore(client=client)
+    await store.add(jti="jti", ttl=60)
+    await store.revoke_session(session_id="session", ttl=60)
+
+    # When
+    consumed = [await store.consume(jti="jti"), await store.consume(jti="jti")]
+
+    # Then
+    assert consumed == [True, False]
+    assert client.ttls["auth:revoked:session"] == 60
+    assert await store.is_session_revoked(session_id="session") is True
+    assert await store.is_session_revoked(session_id="other") is False
+
+
+class FailingRedis(FakeRedis):
+    async def exists(self, *names: str) -> int:
+        self.round_trips += 1
+        raise ConnectionError
+
+
+@pytest.mark.asyncio
+async def test_redis_store_revocation_check_fails_open():
+    # Given
+    client = FailingRedis()
+    store = RedisRefreshTokenStore(
+        client=client,
+        breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    # When
+    sut = [
+        await store.is_session_revoked(session_id="session"),
+        await store.is_session_revoked(session_id="session"),
+    ]
+
+    # Then
+    assert sut == [False, False]
+    assert client.round_trips == 1
@@ -1,10 +1,19 @@
 from typing import Any
+from unittest.mock import patch
 
 import jwt
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
 
 from core.config import config
-from core.helpers.token import TokenHelper, DecodeTokenException, ExpiredTokenException
+from core.helpers import token as token_module
+from core.helpers.token import (
+    KeySet,
+    TokenHelper,
+    DecodeTokenException,
+    ExpiredTokenException,
+)
 from tests.support.token import EXPIRED_TOKEN
 
 
@@ -75,3 +84,81 @@ async def test_decode_expired_token_decode_error():
     # When, Then
     with pytest.raises(DecodeTokenException):
         TokenHelper.decode_expired_token(token=token)
+
+
+def make_pem(private_key) -> tuple[str, str]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "algorithm, private_key",
+    [
+        ("RS256", rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+        ("EdDSA", ed25519.Ed25519PrivateKey.generate()),
+    ],
+)
+async def test_asymmetric_key_set(algorithm, private_key):
+    # Given
+    private_pem, public_pem = make_pem(private_key)
+    signer = KeySet(algorithm=algorithm, signing_key=private_pem, kid="2024-01")
+    verifier = KeySet(algorithm=algorithm, verification_keys={"2024-01": public_pem})
+
+    # When
+    with patch.object(token_module, "key_set", signer):
+        token = TokenHelper.encode(payload={"user_id": 1})
+    with patch.object(token_module, "key_set", verifier):
+        sut = TokenHelper.decode(token=token)
+
+    # Then
+    assert jwt.get_unverified_header(token)["kid"] == "2024-01"
+    assert sut["user_id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_key_set_rotation():
+    # Given
+    old_private_pem, old_public_pem = make_pem(ed25519.Ed25519PrivateKey.generate())
+    new_private_pem, _ = make_pem(ed25519.Ed25519PrivateKey.generate())
+    old_signer = KeySet(algorithm="EdDSA", signing_key=old_private_pem, kid="old")
+    with patch.object(token_module, "key_set", old_signer):
+        token = TokenHelper.encode(payload={"user_id": 1})
+
+    # When
+    new_signer = KeySet(
+        algorithm="EdDSA",
+        signing_key=new_private_pem,
+        kid="new",
+        verification_keys={"old": old_public_pem},
+    )
+    with patch.object(token_module, "key_set", new_signer):
+        sut = TokenHelper.decode(token=token)
+
+    # Then
+    assert sut["user_id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_decode_unknown_kid():
+    # Given
+    private_pem, _ = make_pem(ed25519.Ed25519PrivateKey.generate())
+    signer = KeySet(algorithm="EdDSA", signing_key=private_pem, kid="unknown")
+    with patch.object(token_module, "key_set", signer):
+        token = TokenHelper.encode(payload={"user_id": 1})
+
+    # When, Then
+    with pytest.raises(DecodeTokenException):
+        TokenHelper.decode(token=token)
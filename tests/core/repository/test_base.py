@@ -0,0 +1,197 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from app.user.domain.entity.user import User, UserRead
+from core.repository import base
+from core.repository.base import BaseRepo
+from core.repository.pagination import decode_cursor
+from tests.support.user_fixture import make_user
+
+
+def make_read_session(rows: list) -> MagicMock:
+    read_session = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    read_session.execute = AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def read_session_scope():
+        yield read_session
+
+    read_session.scope = read_session_scope
+    return read_session
+
+
+def make_users(*ids: int) -> list[User]:
+    return [make_user(id=id, email=f"{id}@b.c", nickname=f"user{id}") for id in ids]
+
+
+@pytest.mark.asyncio
+async def test_paginate_has_next_page():
+    # Given
+    repo = BaseRepo(User)
+    read_session = make_read_session(make_users(5, 4, 3))
+
+    # When
+    with patch.object(base, "read_session_scope", read_session.scope):
+        sut = await repo.paginate(limit=2)
+
+    # Then
+    assert [user.id for user in sut.items] == [5, 4]
+    assert decode_cursor(sut.next_cursor, columns=(User.id,)) == (4,)
+    query = read_session.execute.await_args.args[0]
+    assert query._limit_clause.value == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_last_page():
+    # Given
+    repo = BaseRepo(User)
+    read_session = make_read_session(make_users(2, 1))
+
+    # When
+    with patch.object(base, "read_session_scope", read_session.scope):
+        sut = await repo.paginate(limit=2, after=(3,))
+
+    # Then
+    assert [user.id for user in sut.items] == [2, 1]
+    assert sut.next_cursor is None
+    assert sut.last_key == (1,)
+
+
+@pytest.mark.asyncio
+async def test_paginate_clamps_limit():
+    # Given
+    repo = BaseRepo(User)
+    repo.max_page_size = 10
+    read_session = make_read_session([])
+
+    # When
+    with patch.object(base, "read_session_scope", read_session.scope):
+        sut = await repo.paginate(limit=1000)
+
+    # Then
+    assert sut.items == []
+    query = read_session.execute.await_args.args[0]
+    assert query._limit_clause.value == 11
+
+
+def make_session_mock() -> MagicMock:
+    session_mock = MagicMock()
+    session_mock.execute = AsyncMock()
+    return session_mock
+
+
+def compile_mysql(statement) -> str:
+    return str(statement.compile(dialect=mysql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_save():
+    # Given
+    repo = BaseRepo(User)
+    session_mock = make_session_mock()
+    user = make_user()
+
+    # When
+    with patch.object(base, "session", session_mock):
+        sut = await repo.save(user)
+
+    # Then
+    assert sut is user
+    session_mock.add.assert_called_once_with(user)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_chunks_rows():
+    # Given
+    repo = BaseRepo(User)
+    session_mock = make_session_mock()
+    rows = [{"email": f"{id}@b.c", "nickname": f"user{id}"} for id in range(5)]
+
+    # When
+    with patch.object(base, "session", session_mock):
+        await repo.bulk_create(iter(rows), chunk_size=2)
+
+    # Then
+    calls = session_mock.execute.await_args_list
+    assert [call.args[1] for call in calls] == [rows[:2], rows[2:4], rows[4:]]
+    assert compile_mysql(calls[0].args[0]).startswith("INSERT INTO user")
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert():
+    # Given
+    repo = BaseRepo(User)
+    session_mock = make_session_mock()
+    rows = [{"id": 1, "email": "a@b.c", "nickname": "hide"}]
+
+    # When
+    with patch.object(base, "session", session_mock):
+        await repo.bulk_upsert(rows)
+
+    # Then
+    query, params = session_mock.execute.await_args.args
+    assert params == rows
+    assert compile_mysql(query).endswith(
+        "ON DUPLICATE KEY UPDATE email = VALUES(email), nickname = VALUES(nickname)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_ids():
+    # Given
+    repo = BaseRepo(User)
+    session_mock = make_session_mock()
+
+    # When
+    with patch.object(base, "session", session_mock):
+        await repo.bulk_update_by_ids(range(3), {"is_admin": True}, chunk_size=2)
+
+    # Then
+    queries = [call.args[0] for call in session_mock.execute.await_args_list]
+    assert len(queries) == 2
+    assert "WHERE user.id IN (__[POSTCOMPILE_id_1])" in compile_mysql(queries[0])
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_ids():
+    # Given
+    repo = BaseRepo(User)
+    session_mock = make_session_mock()
+
+    # When
+    with patch.object(base, "session", session_mock):
+        await repo.bulk_delete_by_ids([1, 2, 3], chunk_size=10)
+
+    # Then
+    query = session_mock.execute.await_args.args[0]
+    assert compile_mysql(query).startswith("DELETE FROM user WHERE user.id IN")
+
+
+@pytest.mark.asyncio
+async def test_paginate_projection():
+    # Given
+    repo = BaseRepo(User)
+    read_session = make_read_session([])
+    values = [{"id": 2, "email": "a@b.c", "nickname": "hide"}]
+    rows = [SimpleNamespace(_mapping=value, **value) for value in values]
+    read_session.execute.return_value.all.return_value = rows
+
+    # When
+    with patch.object(base, "read_session_scope", read_session.scope):
+        sut = await repo.paginate(limit=1, projection=UserRead)
+
+    # Then
+    assert sut.items == [UserRead(id=2, email="a@b.c", nickname="hide")]
+    assert sut.last_key == (2,)
+    query = read_session.execute.await_args.args[0]
+    assert [column.key for column in query.selected_columns] == [
+        "id",
+        "email",
+        "nickname",
+    ]
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+
+from app.user.domain.entity.user import User
+from core.repository.enum import SortOrder
+from core.repository.exception import InvalidCursorException
+from core.repository.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    keyset_query,
+)
+
+
+def compile_mysql(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=mysql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def test_cursor_round_trip():
+    # Given
+    created_at = datetime(2024, 1, 2, 3, 4, 5)
+    cursor = encode_cursor((created_at, 10))
+
+    # When
+    sut = decode_cursor(cursor, columns=(User.created_at, User.id))
+
+    # Then
+    assert sut == (created_at, 10)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-base64!", encode_cursor((1, 2)), "bnVsbA=="],
+)
+def test_decode_invalid_cursor(cursor):
+    # Given, When, Then
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, columns=(User.id,))
+
+
+def test_keyset_condition_single_column():
+    # Given, When
+    sut = keyset_condition(columns=(User.id,), values=(10,), order=SortOrder.DESC)
+
+    # Then
+    assert compile_mysql(sut) == "user.id < 10"
+
+
+def test_keyset_condition_multi_column():
+    # Given, When
+    sut = keyset_condition(
+        columns=(User.nickname, User.id),
+        values=("hide", 10),
+        order=SortOrder.ASC,
+    )
+
+    # Then
+    assert compile_mysql(sut) == (
+        "user.nickname > 'hide' OR user.nickname = 'hide' AND user.id > 10"
+    )
+
+
+def test_keyset_query():
+    # Given
+    query = select(User.id)
+
+    # When
+    sut = keyset_query(
+        query,
+        columns=(User.id,),
+        order=SortOrder.DESC,
+        after=(10,),
+        limit=5,
+    )
+
+    # Then
+    compiled = compile_mysql(sut)
+    assert "WHERE user.id < 10" in compiled
+    assert compiled.endswith("ORDER BY user.id DESC \n LIMIT 6")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from app.user.domain.entity.user import User
+from core.repository.projection import projection_columns
+
+
+class UserEmail(BaseModel):
+    email: str
+
+
+def test_projection_columns():
+    # Given, When
+    sut = projection_columns(User, UserEmail)
+
+    # Then
+    assert [column.key for column in sut] == ["email"]
+    assert projection_columns(User, UserEmail) is sut
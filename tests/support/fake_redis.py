@@ -0,0 +1,191 @@
+import asyncio
+from typing import Any, AsyncIterator
+
+
+class FakePubSub:
+    def __init__(self, client: "FakeRedis"):
+        self.client = client
+        self.channels: set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        for channel in channels:
+            self.channels.add(channel)
+            self.client.subscribers.setdefault(channel, []).append(self)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        for channel in channels or tuple(self.channels):
+            self.channels.discard(channel)
+            self.client.subscribers.get(channel, []).remove(self)
+
+    async def get_message(
+        self,
+        ignore_subscribe_messages: bool = False,
+        timeout: float | None = 0.0,
+    ) -> dict[str, Any] | None:
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.queue.get()
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        await self.unsubscribe()
+
+
+class FakeLock:
+    def __init__(self, client: "FakeRedis", name: str):
+        self.client = client
+        self.name = name
+
+    async def acquire(self) -> bool:
+        while self.name in self.client.locks:
+            await asyncio.sleep(0)
+
+        self.client.locks.add(self.name)
+        return True
+
+    async def release(self) -> None:
+        self.client.locks.discard(self.name)
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis"):
+        self.client = client
+        self.commands: list = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self.client, name)
+
+        def _queue(*args, **kwargs) -> "FakePipeline":
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self) -> list[Any]:
+        self.client.round_trips += 1
+        commands, self.commands = self.commands, []
+        results = []
+        for command, args, kwargs in commands:
+            result = command(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                self.client.round_trips -= 1
+                result = await result
+            results.append(result)
+        return results
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.commands = []
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for `redis.asyncio.Redis` used in unit tests"""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+        self.subscribers: dict[str, list[FakePubSub]] = {}
+        self.locks: set[str] = set()
+        self.ttls: dict[str, int] = {}
+        self.round_trips = 0
+
+    async def get(self, name: str) -> Any:
+        self.round_trips += 1
+        return self.data.get(name)
+
+    async def set(self, name: str, value: Any, ex: int | None = None) -> bool:
+        self.round_trips += 1
+        self.data[name] = value
+        if ex is not None:
+            self.ttls[name] = ex
+        return True
+
+    async def getdel(self, name: str) -> Any:
+        self.round_trips += 1
+        self.ttls.pop(name, None)
+        return self.data.pop(name, None)
+
+    async def exists(self, *names: str) -> int:
+        self.round_trips += 1
+        return sum(name in self.data for name in names)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, *names: str) -> int:
+        self.round_trips += 1
+        for name in names:
+            self.ttls.pop(name, None)
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    async def unlink(self, *names: str) -> int:
+        return await self.delete(*names)
+
+    async def zadd(self, name: str, mapping: dict[Any, float]) -> int:
+        self.round_trips += 1
+        members = self.data.setdefault(name, {})
+        added = len(set(mapping) - set(members))
+        members.update(mapping)
+        return added
+
+    async def zremrangebyscore(self, name: str, min: Any, max: float) -> int:
+        self.round_trips += 1
+        members = self.data.get(name, {})
+        removed = [member for member, score in members.items() if score <= max]
+        for member in removed:
+            del members[member]
+        if name in self.data and not members:
+            del self.data[name]
+        return len(removed)
+
+    async def zscan_iter(self, name: str, count: int | None = None):
+        for member, score in list(self.data.get(name, {}).items()):
+            yield member, score
+
+    async def zrem(self, name: str, *values: Any) -> int:
+        self.round_trips += 1
+        members = self.data.get(name, {})
+        removed = sum(members.pop(value, None) is not None for value in values)
+        if name in self.data and not members:
+            del self.data[name]
+        return removed
+
+    async def zunionstore(
+        self, dest: str, keys: list[str], aggregate: str | None = None
+    ) -> int:
+        self.round_trips += 1
+        members: dict[Any, float] = {}
+        for key in keys:
+            for member, score in self.data.get(key, {}).items():
+                members[member] = max(score, members.get(member, score))
+        self.data.pop(dest, None)
+        if members:
+            self.data[dest] = members
+        return len(members)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(client=self)
+
+    async def scan_iter(self, match: str | None = None) -> AsyncIterator[str]:
+        prefix = match.rstrip("*") if match else ""
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    async def publish(self, channel: str, message: Any) -> int:
+        subscribers = self.subscribers.get(channel, [])
+        for subscriber in subscribers:
+            subscriber.queue.put_nowait(
+                {"type": "message", "channel": channel, "data": message},
+            )
+        return len(subscribers)
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(client=self)
+
+    def lock(self, name: str, **kwargs) -> FakeLock:
+        return FakeLock(client=self, name=name)